@@ -0,0 +1,473 @@
+"""
+Module containing the generation benchmark suite.
+
+Synthetic projects of 1/10/100/1000 entities x 5/50/200 fields are generated
+to time the building of the entity data, the naming helpers, the validation,
+the rendering of each template, the whole generation and the cold imports,
+and to measure the peak memory. The results are written as JSON, so that
+they can be compared between releases.
+
+Usage:
+    python -m benchmarks.bench_generation -o bench.json
+    python -m benchmarks.bench_generation --entities 1 10 --fields 5
+
+date: 18/10/2026
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from generator.core import __version__
+from generator.core import logger as logger_module
+from generator.core.class_generator import (
+    TEMPLATES_TO_GENERATE,
+    get_renderer,
+    get_template_name,
+    replace_camel_case_with_underscore,
+)
+from generator.core.generator import build_entity_data, build_generation_data
+from generator.core.logger import (
+    console_handler,
+    logger,
+    setup_logging,
+    shutdown_logging,
+)
+from generator.core.model import Entity, Field, Project
+from generator.core.naming import (
+    bulk_name_variants,
+    clear_naming_cache,
+    to_camel_case,
+    to_column_name,
+    to_kebab_case,
+    to_pascal_case,
+)
+from generator.core.validation import validate_project
+from generator.scripts.generate_entity import generate_all_templates
+
+ENTITY_COUNTS = (1, 10, 100, 1000)
+FIELD_COUNTS = (5, 50, 200)
+
+# Modules whose cold import is timed in a fresh interpreter
+IMPORTED_MODULES = (
+    "generator.core",
+    "generator.core.class_generator",
+    "generator.cli",
+    "generator.gui.main",
+)
+
+FIELD_TYPES = (
+    "Long",
+    "String",
+    "Integer",
+    "Boolean",
+    "Double",
+    "BigDecimal",
+    "LocalDate",
+    "LocalDateTime",
+    "ZonedDateTime",
+    "UUID",
+)
+
+BENCHMARK_FORMAT = 1
+
+# Level of the logger in the application
+LOGGED_LEVEL = logging.INFO
+
+
+class _Value:
+    """
+    Stand-in for the Tk variables and widgets read by build_entity_data.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def synthesize_fields(field_count: int) -> list[dict]:
+    """
+    Build the fields of a synthetic entity, the first one being its id.
+    """
+    return [
+        {
+            "name": "id" if i == 0 else f"field number {i}",
+            "type": FIELD_TYPES[i % len(FIELD_TYPES)],
+            "comment": f"Field {i}",
+            "test_value": str(i),
+            "is_id": i == 0,
+            "nullable": i % 2 == 1,
+        }
+        for i in range(field_count)
+    ]
+
+
+def synthesize_entities(entity_count: int, field_count: int) -> list[dict]:
+    """
+    Build the template data of a synthetic project.
+    """
+    fields = synthesize_fields(field_count)
+    for field in fields:
+        field["name"] = to_camel_case(field["name"])
+    return [
+        build_generation_data("Acme", "Shop", "com.acme.shop", f"Entity{i}", fields)
+        for i in range(entity_count)
+    ]
+
+
+def measure(func, repeat: int) -> dict:
+    """
+    Time a function.
+
+    Returns:
+        The statistics of the durations, in seconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {
+        "runs": repeat,
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.fmean(durations),
+    }
+
+
+def bench_build_entity_data(field_counts, repeat: int) -> list[dict]:
+    """
+    Time build_entity_data, which converts the rows of the entity editor.
+    """
+    results = []
+    for field_count in field_counts:
+        rows = [
+            (
+                _Value(field["name"]),
+                _Value(field["type"]),
+                _Value(field["comment"]),
+                _Value(field["test_value"]),
+                _Value(field["is_id"]),
+                _Value(field["nullable"]),
+                None,
+            )
+            for field in synthesize_fields(field_count)
+        ]
+        timing = measure(lambda: build_entity_data("Entity", rows), repeat)
+        results.append({"name": "build_entity_data", "fields": field_count, **timing})
+    return results
+
+
+def bench_naming(field_counts, repeat: int) -> list[dict]:
+    """
+    Time the naming helpers on the names of an entity.
+    """
+    helpers = {
+        "to_camel_case": to_camel_case,
+        "to_pascal_case": to_pascal_case,
+        "to_kebab_case": to_kebab_case,
+        "replace_camel_case_with_underscore": replace_camel_case_with_underscore,
+        "to_column_name": to_column_name,
+    }
+    results = []
+    for field_count in field_counts:
+        names = [field["name"] for field in synthesize_fields(field_count)]
+        for helper_name, helper in helpers.items():
+            timing = measure(lambda: [helper(name) for name in names], repeat)
+            results.append(
+                {"name": f"naming.{helper_name}", "fields": field_count, **timing}
+            )
+
+        def cold_bulk():
+            clear_naming_cache()
+            bulk_name_variants(names)
+
+        timing = measure(cold_bulk, repeat)
+        results.append(
+            {"name": "naming.bulk_name_variants", "fields": field_count, **timing}
+        )
+    return results
+
+
+def bench_validation(entity_counts, field_counts, repeat: int) -> list[dict]:
+    """
+    Time the validation of a whole project, run before the generation.
+    """
+    results = []
+    for entity_count in entity_counts:
+        for field_count in field_counts:
+            fields = [
+                Field.from_dict(field) for field in synthesize_fields(field_count)
+            ]
+            for field in fields:
+                field.name = to_camel_case(field.name)
+            project = Project(
+                "Acme",
+                "Shop",
+                "com.acme.shop",
+                [Entity(f"Entity{i}", fields) for i in range(entity_count)],
+            )
+            timing = measure(lambda: validate_project(project), repeat)
+            results.append(
+                {
+                    "name": "validate_project",
+                    "entities": entity_count,
+                    "fields": field_count,
+                    **timing,
+                }
+            )
+    return results
+
+
+def bench_templates(field_counts, repeat: int) -> list[dict]:
+    """
+    Time the rendering of each template, once compiled.
+    """
+    renderer = get_renderer()
+    renderer.compile_all()
+    results = []
+    for field_count in field_counts:
+        (data,) = synthesize_entities(1, field_count)
+        for template_path in TEMPLATES_TO_GENERATE:
+            timing = measure(lambda: renderer.render(template_path, data), repeat)
+            results.append(
+                {
+                    "name": "render",
+                    "template": get_template_name(template_path),
+                    "fields": field_count,
+                    **timing,
+                }
+            )
+    return results
+
+
+def write_entity_files(directory: str, entities: list[dict]) -> list[str]:
+    """
+    Write the entity JSON files read by generate_all_templates.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for data in entities:
+        path = os.path.join(directory, f"{data['Table']}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        paths.append(path)
+    return paths
+
+
+def generate_project(json_paths, output_root: str):
+    """
+    Generate every entity of a project as the GUI does.
+    """
+    for json_path in json_paths:
+        generate_all_templates(json_path, output_root)
+
+
+def bench_generation(
+    entity_counts, field_counts, repeat: int, memory: bool = True
+) -> list[dict]:
+    """
+    Time the whole generation, and measure its peak memory, for each size.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for entity_count in entity_counts:
+            for field_count in field_counts:
+                size = f"{entity_count}x{field_count}"
+                json_paths = write_entity_files(
+                    os.path.join(workdir, "specs", size),
+                    synthesize_entities(entity_count, field_count),
+                )
+                runs = iter(range(repeat))
+                timing = measure(
+                    lambda: generate_project(
+                        json_paths, os.path.join(workdir, size, str(next(runs)))
+                    ),
+                    repeat,
+                )
+                result = {
+                    "name": "generate_all_templates",
+                    "entities": entity_count,
+                    "fields": field_count,
+                    **timing,
+                }
+                if memory:
+                    tracemalloc.start()
+                    try:
+                        generate_project(json_paths, os.path.join(workdir, size, "mem"))
+                        result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+                    finally:
+                        tracemalloc.stop()
+                results.append(result)
+    return results
+
+
+def bench_logging(entity_count: int, field_count: int, repeat: int) -> dict:
+    """
+    Time the whole generation with the default logging of the application,
+    the other benchmarks running with the logs disabled. The console handler
+    is silenced, so only the cost of the log records and the log file is
+    measured.
+
+    The log file is written to a temporary directory, unless the logging is
+    already set up by the caller.
+    """
+    owned = logger_module.queue_listener is None
+    level = logger.level
+    console_level = console_handler.level
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            if owned:
+                setup_logging(os.path.join(workdir, "logs"))
+            try:
+                logger.setLevel(LOGGED_LEVEL)
+                console_handler.setLevel(logging.CRITICAL)
+                json_paths = write_entity_files(
+                    os.path.join(workdir, "specs"),
+                    synthesize_entities(entity_count, field_count),
+                )
+                runs = iter(range(repeat))
+                timing = measure(
+                    lambda: generate_project(
+                        json_paths, os.path.join(workdir, str(next(runs)))
+                    ),
+                    repeat,
+                )
+            finally:
+                if owned:
+                    # The log file is closed before its directory is removed
+                    shutdown_logging()
+    finally:
+        logger.setLevel(level)
+        console_handler.setLevel(console_level)
+    return {
+        "name": "generate_all_templates.logged",
+        "entities": entity_count,
+        "fields": field_count,
+        **timing,
+    }
+
+
+def bench_imports(modules=IMPORTED_MODULES, repeat: int = 3) -> list[dict]:
+    """
+    Time the cold import of modules, each in a fresh interpreter.
+    """
+    results = []
+    for module in modules:
+        code = (
+            "import time; start = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - start)"
+        )
+        durations = []
+        error = None
+        for _ in range(repeat):
+            process = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True
+            )
+            if process.returncode != 0:
+                error = process.stderr.strip().splitlines()[-1]
+                break
+            durations.append(float(process.stdout.strip().splitlines()[-1]))
+        result = {"name": "import", "module": module}
+        if error:
+            result["error"] = error
+        else:
+            result.update(
+                runs=repeat,
+                min=min(durations),
+                median=statistics.median(durations),
+                mean=statistics.fmean(durations),
+            )
+        results.append(result)
+    return results
+
+
+def run_benchmarks(
+    entity_counts=ENTITY_COUNTS,
+    field_counts=FIELD_COUNTS,
+    repeat: int = 5,
+    memory: bool = True,
+    imports: bool = True,
+) -> dict:
+    """
+    Run the whole suite.
+
+    Args:
+        entity_counts (list[int]): Numbers of entities of the projects.
+        field_counts (list[int]): Numbers of fields of the entities.
+        repeat (int): Number of runs of the micro benchmarks. The whole
+            generation is run at most three times.
+        memory (bool): Measure the peak memory of the generation.
+        imports (bool): Time the cold imports.
+
+    Returns:
+        The report, ready to be written as JSON.
+    """
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        results = bench_build_entity_data(field_counts, repeat)
+        results += bench_naming(field_counts, repeat)
+        results += bench_validation(entity_counts, field_counts, repeat)
+        results += bench_templates(field_counts, repeat)
+        results += bench_generation(entity_counts, field_counts, min(repeat, 3), memory)
+        results.append(
+            bench_logging(max(entity_counts), min(field_counts), min(repeat, 3))
+        )
+        if imports:
+            results += bench_imports()
+    finally:
+        logger.setLevel(level)
+    return {
+        "format": BENCHMARK_FORMAT,
+        "generator": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    """
+    Run the suite from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_generation",
+        description="Benchmark the generation on synthetic projects.",
+    )
+    parser.add_argument("-o", "--output", help="JSON report file (default: stdout)")
+    parser.add_argument("--entities", type=int, nargs="+", default=ENTITY_COUNTS)
+    parser.add_argument("--fields", type=int, nargs="+", default=FIELD_COUNTS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--no-imports", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.entities,
+        args.fields,
+        args.repeat,
+        memory=not args.no_memory,
+        imports=not args.no_imports,
+    )
+    content = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(content + "\n")
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
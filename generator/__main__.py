@@ -0,0 +1,12 @@
+"""
+Entry point of the headless command line interface: python -m generator
+
+date: 18/10/2026
+"""
+
+import sys
+
+from generator.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
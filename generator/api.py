@@ -0,0 +1,194 @@
+"""
+Module containing the public API of the generator.
+
+Usage:
+    from generator.api import generate
+
+    report = generate(project, output="build/api", options={"workers": 4})
+    report = generate(project, options={"archive": "api.zip"})
+    if not report.ok:
+        for result in report.failed:
+            print(result.table, result.error)
+        for path, error in report.project_errors.items():
+            print(path, error)
+
+Importing the generator performs no I/O: templates and resources are resolved
+relative to the package, logging is left to the embedding program (see
+generator.core.logger.setup_logging) and each call to generate() is
+independent. The only state shared between calls is the cache of compiled
+templates, built on first use.
+
+date: 18/10/2026
+"""
+
+import time
+
+from generator.core.archive import ArchiveWriter
+from generator.core.engine import GenerationEngine
+from generator.core.generator import build_project_data
+
+# Options of generate() and their default value
+DEFAULT_OPTIONS = {
+    # Number of workers, 1 renders in the calling thread, None uses every CPU
+    "workers": 1,
+    # Kind of worker pool when workers > 1, "process" or "thread"
+    "executor": "process",
+    # Only regenerate the files whose template or entity changed
+    "incremental": False,
+    # Templates to render, every template by default
+    "template_paths": None,
+    # Archive receiving the files instead of the output directory: path of a
+    # .zip, .tar.gz or .tar, or a binary file object written as a zip
+    "archive": None,
+    # Compression of the archive entries, "deflate" or "store"
+    "compression": "deflate",
+    # Compression level of the archive, from 0 to 9, None for the default
+    "compression_level": None,
+}
+
+# Options of the archive, not given to the engine
+ARCHIVE_OPTIONS = ("archive", "compression", "compression_level")
+
+
+class GenerationReport:
+    """
+    Class describing the outcome of a call to generate().
+    """
+
+    def __init__(
+        self,
+        output: str,
+        entities: list,
+        stats: dict,
+        elapsed: float,
+        project_errors: dict = None,
+    ):
+        """
+        Initialize the report.
+
+        Args:
+            output (str): Root directory of the generated files.
+            entities (list[EntityResult]): Result of each entity, in order.
+            stats (dict): Statistics of the writer.
+            elapsed (float): Duration of the generation, in seconds.
+            project_errors (dict): Errors of the project files, such as the
+                Application class, by output path.
+        """
+        self.output = output
+        self.entities = entities
+        self.stats = stats
+        self.elapsed = elapsed
+        self.project_errors = project_errors or {}
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every entity and every project file was generated.
+        """
+        return not self.project_errors and all(result.ok for result in self.entities)
+
+    @property
+    def failed(self) -> list:
+        """
+        Results of the entities that could not be generated.
+        """
+        return [result for result in self.entities if not result.ok]
+
+    @property
+    def files(self) -> list[str]:
+        """
+        Paths of the files generated for the entities.
+        """
+        return [path for result in self.entities for path in result.files]
+
+    @property
+    def files_skipped(self) -> int:
+        """
+        Number of unchanged files, skipped by the manifest or by the writer.
+        """
+        skipped = {path for result in self.entities for path in result.skipped}
+        return len(skipped) + self.stats["files_skipped"]
+
+    def __repr__(self):
+        return (
+            f"GenerationReport(output={self.output!r}, "
+            f"entities={len(self.entities)}, failed={len(self.failed)}, "
+            f"stats={self.stats})"
+        )
+
+
+def generate(
+    project_model, output: str = "output", options: dict = None
+) -> GenerationReport:
+    """
+    Generate the Java API of a project.
+
+    Args:
+        project_model (dict | Project): Project, with its "company",
+            "project" and "package" names and its "entities", each having a
+            "name" and a list of "fields", or its model, see
+            generator.core.model.
+        output (str): Root directory of the generated files.
+        options (dict): Options overriding DEFAULT_OPTIONS.
+
+    Returns:
+        The report of the generation. An entity that cannot be generated does
+        not stop the others, its error is in the report.
+
+    Raises:
+        ValueError: If an option is unknown, or a ProjectValidationError
+            listing every problem of the project model before any file is
+            written, see generator.core.validation.
+    """
+    return generate_entities(build_project_data(project_model), output, options)
+
+
+def generate_entities(
+    entities: list[dict], output: str = "output", options: dict = None
+) -> GenerationReport:
+    """
+    Generate the Java API of entities whose template data is already built,
+    see generator.core.generator.build_project_data.
+
+    Args:
+        entities (list[dict]): Template data of the entities.
+        output (str): Root directory of the generated files. With the
+            "archive" option, nothing is written there: the entries of the
+            archive are named relative to it.
+        options (dict): Options overriding DEFAULT_OPTIONS.
+
+    Returns:
+        The report of the generation.
+
+    Raises:
+        ValueError: If an option is unknown or invalid.
+    """
+    options = options or {}
+    unknown = sorted(set(options) - set(DEFAULT_OPTIONS))
+    if unknown:
+        raise ValueError(f"Unknown options: {', '.join(unknown)}")
+    options = {**DEFAULT_OPTIONS, **options}
+    archive, compression, level = (options.pop(key) for key in ARCHIVE_OPTIONS)
+
+    start = time.perf_counter()
+    writer = None
+    if archive is not None:
+        writer = ArchiveWriter(
+            archive, root=output, compression=compression, level=level
+        )
+    try:
+        engine = GenerationEngine(output_root=output, writer=writer, **options)
+        results = engine.generate(entities)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.close()
+    return GenerationReport(
+        output,
+        results,
+        engine.writer.stats(),
+        time.perf_counter() - start,
+        engine.project_errors,
+    )
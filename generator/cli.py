@@ -0,0 +1,243 @@
+"""
+Module containing the headless command line interface.
+
+Usage:
+    python -m generator project.json -o output
+    cat project.json | python -m generator -o output
+    python -m generator project.jsonl --stream -o output
+    python -m generator project.json --archive api.zip
+
+Only generator.core and jinja2 are imported, so the generation can run in CI
+or in containers without Tk, PIL or Faker.
+
+date: 18/10/2026
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+
+from generator.api import generate_entities
+from generator.core.archive import COMPRESSIONS, ArchiveWriter
+from generator.core.engine import EXECUTORS
+from generator.core.generator import build_project_data
+from generator.core.logger import console_handler, setup_logging
+from generator.core.model import Project
+from generator.core.pipeline import read_entities_jsonl, run_pipeline
+from generator.core.validation import ProjectValidationError, format_problems
+
+# Exit codes
+EXIT_OK = 0
+EXIT_GENERATION_FAILED = 1
+EXIT_USAGE = 2
+
+# Level of the console logs, by number of -v
+VERBOSITY_LEVELS = (logging.WARNING, logging.INFO, logging.DEBUG)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the parser of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m generator",
+        description="Generate a hexagonal Java API from a JSON project spec.",
+    )
+    parser.add_argument(
+        "spec",
+        nargs="?",
+        default="-",
+        help="path to the JSON project spec, '-' to read it from stdin (default)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="output",
+        help="root directory of the generated files (default: output)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of workers (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=sorted(EXECUTORS),
+        default="process",
+        help="kind of worker pool (default: process)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only regenerate the files whose template or entity changed",
+    )
+    parser.add_argument(
+        "--archive",
+        default=None,
+        help=(
+            "write the files into a .zip, .tar.gz or .tar archive instead of "
+            "the output directory"
+        ),
+    )
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default="deflate",
+        help="compression of the archive entries (default: deflate)",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="compression level of the archive, from 0 to 9",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "read the spec as JSON Lines (project on the first line, then one "
+            "entity per line) and generate it in bounded memory"
+        ),
+    )
+    parser.add_argument(
+        "--log-dir",
+        default=None,
+        help="also write the logs to hexapi.log in this directory "
+        "(default: console only)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="log the summary of the generation on the console, "
+        "-vv to log every template",
+    )
+    return parser
+
+
+def load_spec(path: str) -> Project:
+    """
+    Load the project spec from a file, or from stdin when path is '-'.
+    """
+    if path == "-":
+        return Project.from_json(sys.stdin.read())
+    with open(path, "rb") as f:
+        return Project.from_json(f.read())
+
+
+def run_stream(args) -> int:
+    """
+    Generate a JSON Lines spec with the streaming pipeline.
+    """
+    source = sys.stdin if args.spec == "-" else args.spec
+    start = time.perf_counter()
+    archive = None
+    try:
+        if args.archive:
+            archive = ArchiveWriter(
+                args.archive,
+                root=args.output,
+                compression=args.compression,
+                level=args.compression_level,
+            )
+        writer = run_pipeline(
+            read_entities_jsonl(source), output_root=args.output, writer=archive
+        )
+        if archive is not None:
+            archive.close()
+    except (ProjectValidationError, json.JSONDecodeError) as e:
+        # Invalid input, as for a JSON spec read by main()
+        if archive is not None:
+            archive.abort()
+        problems = getattr(e, "problems", [str(e)])
+        print(
+            f"error: invalid project spec:\n{format_problems(problems)}",
+            file=sys.stderr,
+        )
+        return EXIT_USAGE
+    except (OSError, ValueError, KeyError) as e:
+        if archive is not None:
+            archive.abort()
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_GENERATION_FAILED
+    elapsed = time.perf_counter() - start
+    stats = writer.stats()
+    print(
+        f"Streamed the project in {elapsed:.2f}s: {stats['files_written']} files "
+        f"written ({stats['bytes_written']} bytes), {stats['files_skipped']} "
+        "unchanged files skipped"
+    )
+    return EXIT_OK
+
+
+def main(argv=None) -> int:
+    """
+    Run the command line interface.
+
+    Returns:
+        The exit code: 0 on success, 1 if an entity could not be generated,
+        2 if the arguments or the project spec are invalid.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.compression_level is not None and not 0 <= args.compression_level <= 9:
+        parser.error("--compression-level must be between 0 and 9")
+    if args.archive and args.incremental:
+        parser.error("--incremental cannot be used with --archive")
+
+    setup_logging(
+        args.log_dir, level=logging.DEBUG if args.verbose > 1 else logging.INFO
+    )
+    console_handler.setLevel(VERBOSITY_LEVELS[min(args.verbose, 2)])
+    if args.stream:
+        return run_stream(args)
+
+    try:
+        entities = build_project_data(load_spec(args.spec))
+    except ProjectValidationError as e:
+        # Every problem of the project is reported before any file is written
+        print(
+            f"error: invalid project spec:\n{format_problems(e.problems)}",
+            file=sys.stderr,
+        )
+        return EXIT_USAGE
+    except (OSError, ValueError, AttributeError, TypeError) as e:
+        print(f"error: invalid project spec: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        report = generate_entities(
+            entities,
+            output=args.output,
+            options={
+                "workers": args.workers,
+                "executor": args.executor,
+                "incremental": args.incremental,
+                "archive": args.archive,
+                "compression": args.compression,
+                "compression_level": args.compression_level,
+            },
+        )
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    for result in report.failed:
+        print(f"error: {result.table}: {result.error}", file=sys.stderr)
+    for path, error in report.project_errors.items():
+        print(f"error: {path}: {error}", file=sys.stderr)
+
+    total = len(report.entities)
+    print(
+        f"Generated {total - len(report.failed)}/{total} entities "
+        f"in {report.elapsed:.2f}s: {report.stats['files_written']} files written "
+        f"({report.stats['bytes_written']} bytes), {report.files_skipped} "
+        "unchanged files skipped"
+    )
+    return EXIT_OK if report.ok else EXIT_GENERATION_FAILED
@@ -0,0 +1,299 @@
+"""
+Module containing the writer of the generated files into an archive.
+
+The ArchiveWriter has the interface of the OutputWriter: the engine and the
+streaming pipeline render the templates into it as they do on disk, but each
+file becomes an entry of a zip or tar.gz archive, written entry by entry. No
+output directory is created, whatever the number of files.
+
+date: 18/10/2026
+"""
+
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+
+from generator.core.logger import logger
+from generator.core.writer import encode_text
+
+# Compression of the entries, "store" keeps them as they are
+COMPRESSIONS = ("deflate", "store")
+
+# Archive formats, by extension of the archive
+ARCHIVE_FORMATS = {
+    ".zip": "zip",
+    ".tar.gz": "tar.gz",
+    ".tgz": "tar.gz",
+    ".tar": "tar",
+}
+
+# Size above which a tar entry is buffered on disk instead of in memory: the
+# size of a tar entry must be known before its content is written
+TAR_SPOOL_SIZE = 1024 * 1024
+
+# Permissions of the entries
+ENTRY_MODE = 0o644
+
+
+def get_archive_format(path: str) -> str:
+    """
+    Get the format of an archive from its extension.
+
+    Raises:
+        ValueError: If the extension is not one of ARCHIVE_FORMATS.
+    """
+    lower = path.lower()
+    for extension, archive_format in ARCHIVE_FORMATS.items():
+        if lower.endswith(extension):
+            return archive_format
+    raise ValueError(
+        f"Unknown archive extension for {path}, expected one of: "
+        f"{', '.join(ARCHIVE_FORMATS)}"
+    )
+
+
+class ArchiveWriter:
+    """
+    Class writing the generated files as the entries of an archive.
+
+    The archive is written to a temporary file and moved in place by close(),
+    so that an interrupted generation never leaves a truncated archive. It is
+    also a context manager: leaving the block on an exception drops the
+    archive.
+    """
+
+    def __init__(
+        self,
+        target,
+        root: str = "output",
+        archive_format: str = None,
+        compression: str = "deflate",
+        level: int = None,
+    ):
+        """
+        Open the archive.
+
+        Args:
+            target: Path of the archive, or a binary file object open for
+                writing, such as an io.BytesIO.
+            root (str): Output root of the generation, the entries are named
+                by the path of the files relative to it.
+            archive_format (str): "zip", "tar.gz" or "tar", from the extension
+                of target by default. A file object defaults to "zip".
+            compression (str): "deflate" or "store", see COMPRESSIONS. A tar.gz
+                is written as a plain tar with "store".
+            level (int): Compression level, from 0 to 9, the default of zlib
+                if None.
+
+        Raises:
+            ValueError: If the format, compression or level is unknown.
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown compression '{compression}', expected one of: "
+                f"{', '.join(COMPRESSIONS)}"
+            )
+        if level is not None and not 0 <= level <= 9:
+            raise ValueError("The compression level must be between 0 and 9")
+        if archive_format is None:
+            archive_format = (
+                get_archive_format(target) if isinstance(target, str) else "zip"
+            )
+        if archive_format not in ARCHIVE_FORMATS.values():
+            raise ValueError(f"Unknown archive format '{archive_format}'")
+        if archive_format == "tar.gz" and compression == "store":
+            archive_format = "tar"
+
+        self.path = target if isinstance(target, str) else None
+        self.root = root
+        self.archive_format = archive_format
+        self.compression = compression
+        self.level = level
+        self.files_written = 0
+        self.files_skipped = 0
+        self.bytes_written = 0
+        self.closed = False
+        # Names of the entries, an archive may hold a name twice
+        self._names = set()
+        self._mtime = time.time()
+
+        if self.path is not None:
+            self._tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            fileobj = open(self._tmp_path, "wb")
+        else:
+            self._tmp_path = None
+            fileobj = target
+        self._fileobj = fileobj
+        try:
+            self._archive = self._open_archive(fileobj)
+        except BaseException:
+            self._discard_file()
+            raise
+
+    def _open_archive(self, fileobj):
+        """
+        Open the zip or tar archive on the file object.
+        """
+        if self.archive_format == "zip":
+            method = (
+                zipfile.ZIP_DEFLATED
+                if self.compression == "deflate"
+                else zipfile.ZIP_STORED
+            )
+            return zipfile.ZipFile(
+                fileobj, "w", compression=method, compresslevel=self.level
+            )
+        if self.archive_format == "tar.gz":
+            return tarfile.open(
+                fileobj=fileobj,
+                mode="w:gz",
+                compresslevel=9 if self.level is None else self.level,
+            )
+        return tarfile.open(fileobj=fileobj, mode="w")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def entry_name(self, output_path: str) -> str:
+        """
+        Get the name of the entry of a generated file.
+        """
+        if self.root:
+            output_path = os.path.relpath(output_path, self.root)
+        return os.path.normpath(output_path).replace(os.sep, "/")
+
+    def plan(self, output_paths):
+        """
+        Do nothing: an archive has no directories to create.
+        """
+
+    def write(self, output_path: str, content: str) -> bool:
+        """
+        Add a file to the archive.
+
+        Returns:
+            True, an archive always receives every file.
+        """
+        return self.write_stream(output_path, (content,))
+
+    def write_stream(self, output_path: str, chunks) -> bool:
+        """
+        Add a file to the archive from an iterable of text chunks.
+
+        The chunks of a zip entry are compressed as they come. A tar entry is
+        buffered first, on disk above TAR_SPOOL_SIZE.
+
+        Returns:
+            True, an archive always receives every file.
+
+        Raises:
+            ValueError: If the archive is closed or already holds this file.
+        """
+        if self.closed:
+            raise ValueError("The archive is closed")
+        name = self.entry_name(output_path)
+        if name in self._names:
+            raise ValueError(f"The archive already holds {name}")
+        blocks = (encode_text(chunk) for chunk in chunks)
+        if self.archive_format == "zip":
+            size = self._write_zip_entry(name, blocks)
+        else:
+            size = self._write_tar_entry(name, blocks)
+        self._names.add(name)
+        self.files_written += 1
+        self.bytes_written += size
+        logger.debug("File added to the archive: %s", name)
+        return True
+
+    def _write_zip_entry(self, name: str, blocks) -> int:
+        """
+        Compress blocks of bytes into a new zip entry.
+        """
+        info = zipfile.ZipInfo(name, time.localtime(self._mtime)[:6])
+        info.compress_type = self._archive.compression
+        info.external_attr = ENTRY_MODE << 16
+        size = 0
+        with self._archive.open(info, "w", force_zip64=True) as entry:
+            for block in blocks:
+                entry.write(block)
+                size += len(block)
+        return size
+
+    def _write_tar_entry(self, name: str, blocks) -> int:
+        """
+        Buffer blocks of bytes, then add them as a new tar entry.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=TAR_SPOOL_SIZE) as buffer:
+            for block in blocks:
+                buffer.write(block)
+            info = tarfile.TarInfo(name)
+            info.size = buffer.tell()
+            info.mtime = int(self._mtime)
+            info.mode = ENTRY_MODE
+            buffer.seek(0)
+            self._archive.addfile(info, buffer)
+        return info.size
+
+    def close(self):
+        """
+        Finish the archive and move it in place.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._archive.close()
+            if self._tmp_path is not None:
+                self._fileobj.close()
+                os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self._discard_file()
+            raise
+        logger.info(
+            "Archive %s written: %d file(s)",
+            self.path or self.archive_format,
+            self.files_written,
+        )
+
+    def abort(self):
+        """
+        Drop the archive, leaving any previous file at its path untouched.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._archive.close()
+        except Exception as e:
+            logger.debug("Error closing the dropped archive: %s", e)
+        self._discard_file()
+
+    def _discard_file(self):
+        """
+        Close and remove the temporary file of the archive.
+        """
+        if self._tmp_path is None:
+            return
+        self._fileobj.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+    def stats(self) -> dict:
+        """
+        Get the statistics of the files added to the archive.
+        """
+        return {
+            "files_written": self.files_written,
+            "files_skipped": self.files_skipped,
+            "bytes_written": self.bytes_written,
+        }
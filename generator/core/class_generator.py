@@ -5,12 +5,67 @@ date: 05/06/2025
 """
 
 import json
+import logging
 import os
 import re
+import threading
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, ModuleLoader, TemplateNotFound
 
+from generator.core.java_types import type_registry
 from generator.core.logger import logger
+from generator.core.naming import to_column_name
+from generator.core.resources import resource_path
+from generator.core.template_bundle import hash_source, load_bundle_index
+from generator.core.view_model import build_view_model
+from generator.core.writer import OutputWriter
+
+# Prefix of the template paths, such as in TEMPLATES_TO_GENERATE
+TEMPLATES_ROOT = "generator/templates"
+
+# Directory containing the templates
+TEMPLATES_DIR = resource_path("templates")
+
+# Templates precompiled by generator/scripts/build_templates.py
+TEMPLATES_BUNDLE = resource_path("templates_compiled")
+
+TEMPLATES_TO_GENERATE = [
+    "generator/templates/src/main/java/api/adapters/"
+    "datasources/xxx/model/XxxEntity.java.j2",
+    "generator/templates/src/main/java/api/adapters/"
+    "datasources/xxx/XxxMapper.java.j2",
+    "generator/templates/src/main/java/api/adapters/"
+    "datasources/xxx/XxxPanacheAdapter.java.j2",
+    "generator/templates/src/main/java/api/adapters/"
+    "rest/controllers/xxx/XxxController.java.j2",
+    "generator/templates/src/main/java/api/adapters/"
+    "rest/controllers/xxx/XxxMapper.java.j2",
+    "generator/templates/src/main/java/api/adapters/"
+    "rest/controllers/xxx/model/XxxSchema.java.j2",
+    "generator/templates/src/main/java/api/application/"
+    "xxx/XxxDatasourcePort.java.j2",
+    "generator/templates/src/main/java/api/application/" "xxx/XxxService.java.j2",
+    "generator/templates/src/main/java/api/application/" "xxx/model/Xxx.java.j2",
+    "generator/templates/src/main/resources/application.properties.j2",
+    "generator/templates/src/main/java/api/Application.java.j2",
+]
+
+# Templates whose output only depends on the project, not on the entity
+PROJECT_TEMPLATES = (
+    "generator/templates/src/main/resources/application.properties.j2",
+    "generator/templates/src/main/java/api/Application.java.j2",
+)
+
+REQUIRED_ENTITY_KEYS = (
+    "company",
+    "project",
+    "package_name",
+    "table",
+    "Table",
+    "fields",
+)
+
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def to_java_boolean(value):
@@ -20,124 +75,356 @@ def to_java_boolean(value):
     return str(value).lower()
 
 
+def replace_camel_case_with_underscore(value):
+    """
+    Convert a camelCase string to snake_case.
+    """
+    return CAMEL_CASE_BOUNDARY.sub("_", value).lower()
+
+
 def get_required_imports(fields: list[dict]) -> list[str]:
     """
     Returns the list of Java imports needed based on field types.
+
+    The templates read the "imports" of the entity instead, computed once per
+    entity by generator.core.view_model.build_view_model.
     """
-    imports = set()
+    return type_registry.imports_for(fields)
+
 
-    for field in fields:
-        field_type = field["type"]
-        match field_type:
-            case "LocalDateTime":
-                imports.add("java.time.LocalDateTime")
-            case "LocalDate":
-                imports.add("java.time.LocalDate")
-            case "UUID":
-                imports.add("java.util.UUID")
-            case "BigDecimal":
-                imports.add("java.math.BigDecimal")
-            case _:
-                pass
+def get_template_name(template_path: str) -> str:
+    """
+    Get the name of a template relative to the templates root.
+    """
+    return template_path.replace(TEMPLATES_ROOT + "/", "")
 
-    return sorted(imports)
 
+class TemplateRenderer:
+    """
+    Long-lived Jinja2 renderer.
 
-def render_template_to_output(
-    json_path: str,
-    template_path: str,
-    output_root: str = "output",
-):
+    Owns a single configured environment and keeps every compiled template in
+    memory, so that each template is parsed once and reused for every entity.
+    When a precompiled bundle is available, templates are loaded from it
+    instead of being parsed, unless their source changed since the build.
     """
-    Render a Jinja2 template to a Java file, based on the content of a JSON file.
+
+    def __init__(
+        self, templates_root: str = TEMPLATES_DIR, bundle_root: str = TEMPLATES_BUNDLE
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            templates_root (str): Directory containing the Jinja2 templates.
+            bundle_root (str): Directory of the precompiled templates, None to
+                always compile the sources.
+        """
+        self.templates_root = templates_root
+        self.env = Environment(
+            loader=FileSystemLoader(templates_root),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+        )
+        self.env.filters["replaceCamelCaseWithUnderscore"] = (
+            replace_camel_case_with_underscore
+        )
+        self.env.filters["to_java_boolean"] = to_java_boolean
+        self.env.filters["column_name"] = to_column_name
+        self.hits = 0
+        self.misses = 0
+        self.precompiled = 0
+        self._templates = {}
+        self._digests = {}
+        self._lock = threading.Lock()
+        self._bundle_digests = load_bundle_index(bundle_root) if bundle_root else None
+        self._bundle_loader = (
+            ModuleLoader(bundle_root) if self._bundle_digests is not None else None
+        )
+
+    def get_template(self, template_path: str):
+        """
+        Get the compiled template, compiling it on first use.
+
+        Args:
+            template_path (str): Path of the template, as in TEMPLATES_TO_GENERATE.
+        """
+        name = get_template_name(template_path)
+        template = self._templates.get(name)
+        if template is not None:
+            self.hits += 1
+            return template
+
+        with self._lock:
+            template = self._templates.get(name)
+            if template is None:
+                template = self._load_template(name)
+                self._templates[name] = template
+                self.misses += 1
+            else:
+                self.hits += 1
+        return template
+
+    def _load_template(self, name: str):
+        """
+        Load a template from the bundle if it is up to date, else compile it.
+        """
+        if self._bundle_digests is not None:
+            digest = self._bundle_digests.get(name)
+            if digest is not None and self._source_digest(name) in (digest, None):
+                logger.debug("Loading precompiled template: %s", name)
+                self.precompiled += 1
+                return self._bundle_loader.load(self.env, name)
+        logger.debug("Compiling template: %s", name)
+        return self.env.get_template(name)
+
+    def _source_digest(self, name: str):
+        """
+        Get the digest of the source of a template, None if it is not shipped.
+        """
+        digest = self._digests.get(name)
+        if digest is None:
+            try:
+                source, _, _ = self.env.loader.get_source(self.env, name)
+            except TemplateNotFound:
+                return None
+            digest = hash_source(source)
+            self._digests[name] = digest
+        return digest
+
+    def compile_all(self, template_paths=None):
+        """
+        Compile every template up front.
+
+        Args:
+            template_paths (list[str]): Templates to compile, defaults to
+                TEMPLATES_TO_GENERATE.
+        """
+        for template_path in template_paths or TEMPLATES_TO_GENERATE:
+            if get_template_name(template_path) not in self._templates:
+                self.get_template(template_path)
+
+    def template_digest(self, template_path: str) -> str:
+        """
+        Get the SHA-256 digest of the source of a template.
+
+        When the source is not shipped, the digest recorded in the bundle is
+        used.
+        """
+        name = get_template_name(template_path)
+        digest = self._source_digest(name)
+        if digest is None:
+            digest = (self._bundle_digests or {}).get(name)
+            if digest is None:
+                raise TemplateNotFound(name)
+        return digest
+
+    def render(self, template_path: str, data: dict) -> str:
+        """
+        Render a template with the given data.
+
+        The view model of the entity is built if data is not one yet: build
+        it once beforehand when rendering several templates of an entity.
+        """
+        template = self.get_template(template_path)
+        return template.render(
+            **build_view_model(data), get_required_imports=get_required_imports
+        )
+
+    def generate(self, template_path: str, data: dict):
+        """
+        Render a template chunk by chunk, without building the whole string.
+
+        The view model of the entity is built if data is not one yet: build
+        it once beforehand when rendering several templates of an entity.
+        """
+        template = self.get_template(template_path)
+        return template.generate(
+            **build_view_model(data), get_required_imports=get_required_imports
+        )
+
+    def cache_info(self) -> dict:
+        """
+        Get the statistics of the compiled template cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._templates),
+        }
+
+    def clear(self):
+        """
+        Drop every compiled template and reset the counters.
+        """
+        with self._lock:
+            self._templates.clear()
+            self._digests.clear()
+            self.hits = 0
+            self.misses = 0
+            self.precompiled = 0
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> TemplateRenderer:
+    """
+    Get the renderer shared by the whole process.
+    """
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = TemplateRenderer()
+    return _renderer
+
+
+def load_entity_json(json_path: str) -> dict:
+    """
+    Load and validate the entity model stored in a JSON file.
 
     Args:
         json_path (str): Path to the JSON input file.
+
+    Returns:
+        The decoded entity model.
+    """
+    logger.debug("Loading JSON file: %s", json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    check_entity_data(data)
+    return data
+
+
+def check_entity_data(data: dict):
+    """
+    Check that the entity model contains every key needed by the templates.
+
+    Raises:
+        ValueError: If one or more keys are missing.
+    """
+    missing = [key for key in REQUIRED_ENTITY_KEYS if key not in data]
+    if missing:
+        raise ValueError(f"Missing keys in entity data: {', '.join(missing)}")
+
+
+def get_output_path(data: dict, template_path: str, output_root: str = "output"):
+    """
+    Get the path of the file generated from a template for an entity.
+
+    Args:
+        data (dict): Entity model.
         template_path (str): Path to the Jinja2 template file.
         output_root (str): Root directory where the rendered file will be written.
     """
-    logger.info(
-        "Starting template rendering %s with data from %s", template_path, json_path
-    )
-    try:
-        # Charger les données JSON
-        logger.info("Loading JSON file: %s", json_path)
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        logger.info("JSON data loaded: %s", data)
-
-        company = data["company"]["lowercase"]
-        project = data["project"]["lowercase"]
-        package_name = data["package_name"]
-        table = data["table"]
-        Table = data["Table"]
-
-        # Convert the package name to a path
-        package_path = package_name.replace(".", "/")
-        logger.info("Package path: %s", package_path)
-
-        # Determine if it's a resource file
-        is_resource = "application.properties" in template_path
-
-        if is_resource:
-            # For resources, place in src/main/resources
-            template_rel_path = template_path.replace(
-                "generator/templates/src/main/resources/", ""
-            )
-            output_path = os.path.join(
-                output_root,
-                company,
-                project,
-                "src/main/resources",
-                template_rel_path.replace(".j2", ""),
-            )
-        else:
-            template_rel_path = template_path.replace(
-                "generator/templates/src/main/java/", ""
-            )
-            dynamic_path = (
-                template_rel_path.replace("xxx", table).replace("Xxx", Table)
-            ).replace(".j2", "")
-            output_path = os.path.join(
-                output_root,
-                company,
-                project,
-                "src/main/java",
-                package_path,
-                dynamic_path,
-            )
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        logger.info("Directories created if necessary: %s", output_path)
-
-        # Configure the Jinja2 environment
-        logger.info("Configuring Jinja2 environment")
-        env = Environment(
-            loader=FileSystemLoader("generator/templates"),
-            trim_blocks=True,
-            lstrip_blocks=True,
+    company = data["company"]["lowercase"]
+    project = data["project"]["lowercase"]
+
+    # Determine if it's a resource file
+    if "application.properties" in template_path:
+        # For resources, place in src/main/resources
+        template_rel_path = template_path.replace(
+            "generator/templates/src/main/resources/", ""
         )
-        env.filters["replaceCamelCaseWithUnderscore"] = lambda s: re.sub(
-            r"(?<!^)(?=[A-Z])", "_", s
-        ).lower()
-        env.filters["to_java_boolean"] = to_java_boolean
-
-        # Load and render the template
-        logger.info("Loading template: %s", template_path)
-        template_path_in_templates = template_path.replace("generator/templates/", "")
-        template = env.get_template(template_path_in_templates)
-        logger.info("Rendering template with data")
-        rendered = template.render(**data, get_required_imports=get_required_imports)
-        logger.info("Template rendered successfully")
-
-        # Write the output file
-        logger.info("Writing output file: %s", output_path)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(rendered)
-        logger.info("File written successfully")
+        return os.path.join(
+            output_root,
+            company,
+            project,
+            "src/main/resources",
+            template_rel_path.replace(".j2", ""),
+        )
+
+    # Convert the package name to a path
+    package_path = data["package_name"].replace(".", "/")
+    template_rel_path = template_path.replace("generator/templates/src/main/java/", "")
+    dynamic_path = (
+        template_rel_path.replace("xxx", data["table"]).replace("Xxx", data["Table"])
+    ).replace(".j2", "")
+    return os.path.join(
+        output_root,
+        company,
+        project,
+        "src/main/java",
+        package_path,
+        dynamic_path,
+    )
+
+
+def write_output_file(output_path: str, content: str, writer=None) -> bool:
+    """
+    Write a rendered template, creating its directory if necessary.
+
+    Args:
+        output_path (str): Path of the file.
+        content (str): Rendered content.
+        writer (OutputWriter): Writer to use, a new one by default.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    if writer is None:
+        writer = OutputWriter()
+    return writer.write(output_path, content)
+
 
+def render_entity_to_output(
+    data: dict,
+    template_path: str,
+    output_root: str = "output",
+    writer=None,
+) -> str:
+    """
+    Render a Jinja2 template to a Java file, based on an already loaded entity.
+
+    Args:
+        data (dict): Entity model.
+        template_path (str): Path to the Jinja2 template file.
+        output_root (str): Root directory where the rendered file will be written.
+        writer (OutputWriter): Writer to use, a new one by default.
+
+    Returns:
+        The path of the generated file.
+    """
+    try:
+        output_path = get_output_path(data, template_path, output_root)
+        rendered = get_renderer().render(template_path, data)
+        written = write_output_file(output_path, rendered, writer)
     except Exception as e:
-        logger.error("Error rendering template: %s", e)
+        logger.error("Error rendering template %s: %s", template_path, e)
         raise
 
-    logger.info("File generated: %s", output_path)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "%s rendered for %s: %s (%s)",
+            get_template_name(template_path),
+            data["Table"],
+            output_path,
+            "written" if written else "unchanged",
+        )
+    return output_path
+
+
+def render_template_to_output(
+    json_path: str,
+    template_path: str,
+    output_root: str = "output",
+) -> str:
+    """
+    Render a Jinja2 template to a Java file, based on the content of a JSON file.
+
+    Prefer render_entity_to_output when several templates are rendered for the
+    same entity, so that the JSON file is only read once.
+
+    Args:
+        json_path (str): Path to the JSON input file.
+        template_path (str): Path to the Jinja2 template file.
+        output_root (str): Root directory where the rendered file will be written.
+
+    Returns:
+        The path of the generated file.
+    """
+    data = load_entity_json(json_path)
+    return render_entity_to_output(data, template_path, output_root)
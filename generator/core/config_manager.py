@@ -7,7 +7,9 @@ date: 05/06/2025
 import json
 import os
 
-SETTINGS_FILE = "generator/config/settings.json"
+from generator.core.resources import resource_path
+
+SETTINGS_FILE = resource_path("config", "settings.json")
 
 
 def load_settings():
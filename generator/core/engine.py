@@ -0,0 +1,472 @@
+"""
+Module containing the parallel generation engine.
+
+date: 18/10/2026
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from generator.core.archive import ArchiveWriter
+from generator.core.class_generator import (
+    PROJECT_TEMPLATES,
+    TEMPLATES_TO_GENERATE,
+    check_entity_data,
+    get_output_path,
+    get_renderer,
+    write_output_file,
+)
+from generator.core.logger import logger
+from generator.core.manifest import GenerationManifest
+from generator.core.view_model import build_view_model
+from generator.core.writer import OutputWriter
+
+EXECUTORS = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+# Error of the entities left over when a generation is cancelled
+CANCELLED = "Cancelled"
+
+
+class GenerationCancelled(Exception):
+    """
+    Raised between two templates when the generation is cancelled.
+    """
+
+
+class EntityResult:
+    """
+    Result of the generation of one entity.
+    """
+
+    def __init__(self, index, table, files=None, error=None):
+        """
+        Initialize the result.
+
+        Args:
+            index (int): Position of the entity in the generated list.
+            table (str): Name of the entity.
+            files (list[str]): Paths of the generated files.
+            error (str): Description of the error, None on success.
+        """
+        self.index = index
+        self.table = table
+        self.files = files or []
+        self.skipped = []
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the entity was generated without error.
+        """
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"EntityResult({self.index}, {self.table!r}, {status})"
+
+
+def render_entity_templates(data: dict, template_paths, output_root: str, cancel=None):
+    """
+    Render the templates of an entity without writing them.
+
+    Runs in the worker processes, so it must stay a module-level function.
+
+    Args:
+        cancel (threading.Event): Checked before each template, when
+            rendering in the calling process or in a thread pool. An event
+            cannot be sent to the worker processes.
+
+    Returns:
+        A list of (output_path, rendered) tuples, in template order.
+
+    Raises:
+        GenerationCancelled: If cancel is set.
+    """
+    check_entity_data(data)
+    renderer = get_renderer()
+    rendered = []
+    for template_path in template_paths:
+        if cancel is not None and cancel.is_set():
+            raise GenerationCancelled()
+        rendered.append(
+            (
+                get_output_path(data, template_path, output_root),
+                renderer.render(template_path, data),
+            )
+        )
+    return rendered
+
+
+def _init_worker(template_paths):
+    """
+    Compile the templates once in each worker.
+    """
+    get_renderer().compile_all(template_paths)
+
+
+def _describe_error(error: Exception) -> str:
+    """
+    Describe an error in a stable, picklable way.
+    """
+    return f"{type(error).__name__}: {error}"
+
+
+class GenerationEngine:
+    """
+    Engine generating many entities in parallel.
+
+    Entity templates are rendered in a pool of workers, while the files are
+    written by the calling process in input order. The templates that only
+    depend on the project (see PROJECT_TEMPLATES) are rendered once per output
+    path, so the result is byte-identical to the serial generation.
+    """
+
+    def __init__(
+        self,
+        output_root: str = "output",
+        workers: int = None,
+        executor: str = "process",
+        template_paths=None,
+        incremental: bool = False,
+        writer=None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            output_root (str): Root directory where the files will be written.
+            workers (int): Number of workers, defaults to the number of CPUs.
+                With 1 worker, the entities are rendered in the calling thread.
+            executor (str): "process" or "thread".
+            template_paths (list[str]): Templates to render for each entity,
+                defaults to TEMPLATES_TO_GENERATE.
+            incremental (bool): Skip the units that did not change since the
+                previous run, according to the manifest of output_root.
+            writer (OutputWriter): Sink of the files, such as an ArchiveWriter,
+                a new OutputWriter for each run by default. The caller closes
+                it once the generation is done.
+
+        Raises:
+            ValueError: If an option is invalid, or if an incremental
+                generation is asked into an archive.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor '{executor}', expected one of: "
+                f"{', '.join(EXECUTORS)}"
+            )
+        if workers is not None and workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        if incremental and isinstance(writer, ArchiveWriter):
+            raise ValueError("An archive cannot be generated incrementally")
+        self.output_root = output_root
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.incremental = incremental
+        self.template_paths = list(template_paths or TEMPLATES_TO_GENERATE)
+        self.entity_templates = [
+            path for path in self.template_paths if path not in PROJECT_TEMPLATES
+        ]
+        self.project_templates = [
+            path for path in self.template_paths if path in PROJECT_TEMPLATES
+        ]
+        self.custom_writer = writer
+        self.writer = writer or OutputWriter()
+        self.cancelled = False
+        # Errors of the project files of the last run, by output path
+        self.project_errors = {}
+
+    def generate(
+        self, entities: list[dict], progress=None, cancel=None
+    ) -> list[EntityResult]:
+        """
+        Generate every entity.
+
+        Args:
+            entities (list[dict]): Entity models.
+            progress (callable): Called with (done, total, result) once each
+                entity is written, from the calling thread.
+            cancel (threading.Event): When set, the generation stops between
+                two templates. The files already written are kept (and
+                recorded in the manifest), the other entities fail with the
+                CANCELLED error and the project files are not written.
+
+        Returns:
+            One EntityResult per entity, in input order. The project files
+            that could not be written are in project_errors, not in the
+            result of an entity.
+        """
+        start = time.perf_counter()
+        self.cancelled = False
+        self.project_errors = {}
+        entities = list(entities)
+        logger.debug(
+            "Generating %d entities with %d %s worker(s)",
+            len(entities),
+            self.workers,
+            self.executor,
+        )
+        manifest = (
+            GenerationManifest.load(self.output_root) if self.incremental else None
+        )
+        results = [
+            EntityResult(index, entity.get("Table", f"#{index}"))
+            for index, entity in enumerate(entities)
+        ]
+        jobs = [
+            self._plan_entity(data, result, manifest)
+            for data, result in zip(entities, results)
+        ]
+        self.writer = self.custom_writer or OutputWriter()
+        self.writer.plan(self._planned_paths(entities, results, jobs))
+
+        done = 0
+        outcomes = self._render_entities(jobs, cancel)
+        try:
+            for result, (_, _, keys), outcome in zip(results, jobs, outcomes):
+                if result.error is None:
+                    self._write_entity(result, keys, outcome, manifest, cancel)
+                done += 1
+                if self.cancelled:
+                    break
+                if progress is not None:
+                    progress(done, len(results), result)
+        finally:
+            outcomes.close()
+
+        if self.cancelled:
+            for result in results[done:]:
+                if result.ok:
+                    result.error = CANCELLED
+            logger.info("Generation cancelled after %d entities", done)
+        else:
+            self._generate_project_files(entities, results, manifest)
+        if manifest is not None:
+            manifest.save()
+
+        failed = sum(1 for result in results if not result.ok)
+        failed += len(self.project_errors)
+        logger.info(
+            "Generation completed in %.3fs: %d entities, %d error(s), "
+            "%d file(s) skipped by the manifest, %s",
+            time.perf_counter() - start,
+            len(results),
+            failed,
+            sum(len(result.skipped) for result in results),
+            self.writer.stats(),
+        )
+        return results
+
+    def _write_entity(self, result, keys, outcome, manifest, cancel):
+        """
+        Write the rendered templates of an entity, stopping between two files
+        if the generation is cancelled.
+        """
+        if isinstance(outcome, GenerationCancelled):
+            self.cancelled = True
+            result.error = CANCELLED
+            return
+        if isinstance(outcome, Exception):
+            result.error = _describe_error(outcome)
+            logger.error("Error generating %s: %s", result.table, result.error)
+            return
+        try:
+            for (output_path, rendered), key in zip(outcome, keys):
+                if cancel is not None and cancel.is_set():
+                    self.cancelled = True
+                    result.error = CANCELLED
+                    return
+                write_output_file(output_path, rendered, self.writer)
+                result.files.append(output_path)
+                if manifest is not None:
+                    manifest.record(output_path, key, rendered)
+        except Exception as e:
+            result.error = _describe_error(e)
+            logger.error("Error writing %s: %s", result.table, result.error)
+
+    def _planned_paths(self, entities, results, jobs):
+        """
+        Get the paths of every file that may be written by this run.
+        """
+        for data, result, (_, template_paths, _) in zip(entities, results, jobs):
+            if not result.ok:
+                continue
+            for template_path in template_paths + self.project_templates:
+                yield get_output_path(data, template_path, self.output_root)
+
+    def _plan_entity(self, data, result, manifest):
+        """
+        Get the templates to render for an entity, with their manifest keys.
+
+        Returns:
+            A (data, template_paths, keys) tuple. Without manifest, every
+            template is rendered and the keys are None.
+        """
+        try:
+            check_entity_data(data)
+            # Built in the calling process, where custom types are known
+            data = build_view_model(data)
+        except Exception as e:
+            result.error = _describe_error(e)
+            logger.error("Error planning %s: %s", result.table, result.error)
+            return data, [], []
+        if manifest is None:
+            return data, self.entity_templates, [None] * len(self.entity_templates)
+        try:
+            keys = manifest.unit_keys(get_renderer(), data, self.entity_templates)
+            template_paths = []
+            template_keys = []
+            for template_path, key in zip(self.entity_templates, keys):
+                output_path = get_output_path(data, template_path, self.output_root)
+                if manifest.is_up_to_date(output_path, key):
+                    result.skipped.append(output_path)
+                else:
+                    template_paths.append(template_path)
+                    template_keys.append(key)
+        except Exception as e:
+            result.error = _describe_error(e)
+            logger.error("Error planning %s: %s", result.table, result.error)
+            return data, [], []
+        if result.skipped:
+            logger.debug(
+                "Skipping %d unchanged file(s) for %s",
+                len(result.skipped),
+                result.table,
+            )
+        return data, template_paths, template_keys
+
+    def _render_entities(self, jobs, cancel=None):
+        """
+        Render the entity templates, yielding a list of files or the exception
+        raised for each entity, in input order.
+
+        Closing the generator cancels the entities not rendered yet.
+        """
+        pending = [len(template_paths) > 0 for _, template_paths, _ in jobs]
+        if self.workers == 1 or sum(pending) <= 1:
+            _init_worker(self.entity_templates)
+            for (data, template_paths, _), todo in zip(jobs, pending):
+                if not todo:
+                    yield []
+                    continue
+                try:
+                    yield render_entity_templates(
+                        data, template_paths, self.output_root, cancel
+                    )
+                except Exception as e:
+                    yield e
+            return
+
+        pool_class = EXECUTORS[self.executor]
+        # The threads share the event of the calling thread
+        worker_cancel = cancel if self.executor == "thread" else None
+        with pool_class(
+            max_workers=min(self.workers, sum(pending)),
+            initializer=_init_worker,
+            initargs=(self.entity_templates,),
+        ) as pool:
+            futures = [
+                (
+                    pool.submit(
+                        render_entity_templates,
+                        data,
+                        template_paths,
+                        self.output_root,
+                        worker_cancel,
+                    )
+                    if todo
+                    else None
+                )
+                for (data, template_paths, _), todo in zip(jobs, pending)
+            ]
+            try:
+                for future in futures:
+                    if future is None:
+                        yield []
+                        continue
+                    if cancel is not None and cancel.is_set():
+                        # Not waited for, a worker process cannot see the event
+                        yield GenerationCancelled()
+                        continue
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        yield e
+            finally:
+                # Only the entities being rendered are waited for
+                for future in futures:
+                    if future is not None:
+                        future.cancel()
+
+    def _generate_project_files(self, entities, results, manifest=None):
+        """
+        Render the project templates once per output path.
+
+        The last successful entity wins, as in the serial generation where
+        every entity overwrites these files. A file that cannot be written is
+        recorded in project_errors, the entities keep their own outcome.
+        """
+        planned = {}
+        for data, result in zip(entities, results):
+            if not result.ok:
+                continue
+            for template_path in self.project_templates:
+                output_path = get_output_path(data, template_path, self.output_root)
+                planned[output_path] = (template_path, data)
+
+        renderer = get_renderer()
+        unchanged = set()
+        for output_path, (template_path, data) in planned.items():
+            try:
+                key = None
+                if manifest is not None:
+                    (key,) = manifest.unit_keys(renderer, data, [template_path])
+                    if manifest.is_up_to_date(output_path, key):
+                        unchanged.add(output_path)
+                        continue
+                rendered = renderer.render(template_path, data)
+                write_output_file(output_path, rendered, self.writer)
+                if manifest is not None:
+                    manifest.record(output_path, key, rendered)
+            except Exception as e:
+                self.project_errors[output_path] = _describe_error(e)
+                logger.error(
+                    "Error writing %s: %s",
+                    output_path,
+                    self.project_errors[output_path],
+                )
+        for data, result in zip(entities, results):
+            if not result.ok:
+                continue
+            for template_path in self.project_templates:
+                output_path = get_output_path(data, template_path, self.output_root)
+                if output_path in self.project_errors:
+                    continue
+                if output_path in unchanged:
+                    result.skipped.append(output_path)
+                else:
+                    result.files.append(output_path)
+
+
+def generate_entities(
+    entities: list[dict],
+    output_root: str = "output",
+    workers: int = None,
+    executor: str = "process",
+    incremental: bool = False,
+) -> list[EntityResult]:
+    """
+    Generate every entity with a GenerationEngine.
+    """
+    engine = GenerationEngine(
+        output_root=output_root,
+        workers=workers,
+        executor=executor,
+        incremental=incremental,
+    )
+    return engine.generate(entities)
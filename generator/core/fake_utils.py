@@ -1,38 +1,195 @@
 """
 Module containing the fake utils.
 
+Faker is only imported and built when the first values are needed, and the
+values are taken from per-type pools refilled in a background thread, so that
+the GUI never waits for Faker.
+
 date: 05/06/2025
 """
 
-from faker import Faker
+import threading
+from collections import deque
+
+from generator.core.java_types import type_registry
+from generator.core.logger import logger
+
+DEFAULT_LOCALE = "fr_FR"  # ou "en_US"
+
+# Number of values generated at once for a type
+POOL_SIZE = 32
+
+# A pool is refilled in the background when it holds fewer values
+REFILL_THRESHOLD = 8
+
+
+class FakeValuePool:
+    """
+    Class providing fake test values from pre-generated pools.
+
+    Each type has its own pool, filled by batches of POOL_SIZE values by the
+    fake factory of the type in the registry of the Java types. With a seed,
+    every batch is generated from a seed derived from the type and the
+    number of the batch, so the sequence of values of a type is reproducible
+    whatever the order in which the pools are consumed and refilled.
+    """
+
+    def __init__(
+        self,
+        locale: str = DEFAULT_LOCALE,
+        seed=None,
+        size: int = POOL_SIZE,
+        registry=None,
+    ):
+        """
+        Initialize the pool, without building Faker.
+
+        Args:
+            locale (str): Locale of Faker, such as "fr_FR" or "en_US".
+            seed: Seed of the generated values, None for random values.
+            size (int): Number of values generated at once for a type.
+            registry (JavaTypeRegistry): Types, the shared registry by default.
+        """
+        self.locale = locale
+        self.seed = seed
+        self.size = size
+        self.registry = registry or type_registry
+        self._faker = None
+        # Pools and numbers of batches, by type, created on first use so that
+        # the types registered later get values too
+        self._pools = {}
+        self._batches = {}
+        self._faker_lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._pending = set()
+        self._refill_thread = None
+
+    @property
+    def faker(self):
+        """
+        Faker instance, built on first use.
+        """
+        if self._faker is None:
+            with self._faker_lock:
+                if self._faker is None:
+                    from faker import Faker
+
+                    logger.debug("Building Faker for the locale %s", self.locale)
+                    self._faker = Faker(self.locale)
+        return self._faker
+
+    def get(self, field_type: str) -> str:
+        """
+        Get a fake value for a given field type.
+
+        The value is taken from the pool of the type. The pool is only filled
+        synchronously when it is empty, which does not happen once warm_up()
+        completed.
+        """
+        if self.registry.fake_factory(field_type) is None:
+            return ""
+        pool = self._pools.setdefault(field_type, deque())
+        try:
+            value = pool.popleft()
+        except IndexError:
+            self._fill(field_type)
+            value = pool.popleft()
+        if len(pool) < REFILL_THRESHOLD:
+            self.refill_async([field_type])
+        return value
+
+    def warm_up(self):
+        """
+        Build Faker and fill every pool in the background.
+        """
+        self.refill_async(
+            [java_type.name for java_type in self.registry if java_type.fake_factory]
+        )
+
+    def refill_async(self, field_types):
+        """
+        Fill the pools of the given types in a background thread.
 
-faker = Faker("fr_FR")  # ou "en_US"
+        Args:
+            field_types (list[str]): Types whose pool must be filled.
+        """
+        with self._refill_lock:
+            self._pending.update(field_types)
+            if self._refill_thread is not None and self._refill_thread.is_alive():
+                return
+            self._refill_thread = threading.Thread(
+                target=self._refill_pending, name="fake-values", daemon=True
+            )
+            self._refill_thread.start()
+
+    def wait(self, timeout: float = None):
+        """
+        Wait for the background refill to complete.
+        """
+        thread = self._refill_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refill_pending(self):
+        """
+        Fill the pools requested by refill_async(), until none is pending.
+        """
+        while True:
+            with self._refill_lock:
+                if not self._pending:
+                    self._refill_thread = None
+                    return
+                field_type = self._pending.pop()
+            if len(self._pools.get(field_type, ())) < REFILL_THRESHOLD:
+                try:
+                    self._fill(field_type)
+                except Exception as e:
+                    logger.error("Error while generating fake values: %s", e)
+
+    def _fill(self, field_type: str):
+        """
+        Generate a batch of values for a type and append it to its pool.
+        """
+        factory = self.registry.fake_factory(field_type)
+        faker = self.faker
+        with self._faker_lock:
+            batch = self._batches.get(field_type, 0)
+            if self.seed is not None:
+                faker.seed_instance(f"{self.seed}:{field_type}:{batch}")
+            self._batches[field_type] = batch + 1
+            self._pools.setdefault(field_type, deque()).extend(
+                factory(faker) for _ in range(self.size)
+            )
+
+
+_pool = FakeValuePool()
+
+
+def configure_fake_values(locale: str = DEFAULT_LOCALE, seed=None) -> FakeValuePool:
+    """
+    Replace the shared pool of fake values.
+
+    Args:
+        locale (str): Locale of Faker, such as "fr_FR" or "en_US".
+        seed: Seed of the generated values, None for random values.
+
+    Returns:
+        The new pool.
+    """
+    global _pool
+    _pool = FakeValuePool(locale, seed)
+    return _pool
+
+
+def get_fake_value_pool() -> FakeValuePool:
+    """
+    Get the shared pool of fake values.
+    """
+    return _pool
 
 
 def get_fake_value(field_type: str) -> str:
     """
     Get a fake value for a given field type.
     """
-    match field_type:
-        case "String":
-            return faker.first_name()
-        case "Integer":
-            return str(faker.random_int(min=1, max=100))
-        case "Long":
-            return str(faker.random_number(digits=10))
-        case "Boolean":
-            return "true"
-        case "Double":
-            return str(
-                round(faker.pyfloat(left_digits=2, right_digits=2, positive=True), 2)
-            )
-        case "BigDecimal":
-            return str(round(faker.pydecimal(left_digits=4, right_digits=2), 2))
-        case "ZonedDateTime" | "LocalDateTime":
-            return faker.iso8601()
-        case "LocalDate":
-            return faker.date()
-        case "UUID":
-            return str(faker.uuid4())
-        case _:
-            return ""
+    return _pool.get(field_type)
@@ -7,16 +7,21 @@ date: 05/06/2025
 import json
 import os
 
-from generator.core.naming import to_camel_case, to_kebab_case, to_pascal_case
+from generator.core.java_types import parse_types, type_registry
+from generator.core.model import Project
+from generator.core.naming import bulk_name_variants, name_variants
+from generator.core.validation import ProjectValidationError, validate_project
+from generator.core.view_model import build_view_model
 
 
 def build_entity_data(entity_name: str, fields_raw: list[tuple]) -> dict:
     """
     Build the entity data.
     """
-    entity_pascal = to_pascal_case(entity_name)
-    entity_camel = to_camel_case(entity_name)
-    entity_kebab = to_kebab_case(entity_name)
+    variants = name_variants(entity_name)
+    entity_pascal = variants["PascalCase"]
+    entity_camel = variants["camelCase"]
+    entity_kebab = variants["kebab-case"]
     table_plural = entity_camel + "s"
     capital_table_plural = table_plural.capitalize()
 
@@ -30,6 +35,8 @@ def build_entity_data(entity_name: str, fields_raw: list[tuple]) -> dict:
         "fields": [],
     }
 
+    # The names of every field are converted at once
+    field_names = bulk_name_variants(row[0].get() for row in fields_raw)
     for (
         name_entry,
         type_combobox,
@@ -39,7 +46,7 @@ def build_entity_data(entity_name: str, fields_raw: list[tuple]) -> dict:
         nullable_checkbox,
         _,
     ) in fields_raw:
-        name = to_camel_case(name_entry.get())
+        name = field_names[name_entry.get()]["camelCase"]
         typ = type_combobox.get().strip()
         comment = comment_entry.get().strip()
         test_val = test_entry.get().strip()
@@ -72,3 +79,87 @@ def save_entity_json(entity_name: str, data: dict, output_dir="output") -> str:
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
     return filepath
+
+
+def build_generation_data(
+    company: str,
+    project: str,
+    package_name: str,
+    entity_name: str,
+    fields: list[dict],
+    registry=None,
+) -> dict:
+    """
+    Build the data given to the templates for an entity of a project.
+
+    Args:
+        registry (JavaTypeRegistry): Types of the project, the shared registry
+            by default.
+
+    Returns:
+        The view model of the entity, see generator.core.view_model.
+    """
+    return build_view_model(
+        {
+            "company": {
+                "lowercase": company.lower(),
+                "uppercase": company.upper(),
+            },
+            "project": {
+                "lowercase": project.lower(),
+                "uppercase": project.upper(),
+            },
+            "package_name": package_name,
+            "table": entity_name.lower(),
+            "Table": entity_name[0].upper() + entity_name[1:],
+            "fields": fields,
+        },
+        registry,
+    )
+
+
+def build_project_data(spec) -> list[dict]:
+    """
+    Build the data of every entity of a project specification.
+
+    The specification holds the "company", "project" and "package" names and
+    an "entities" list, each entity having a "name" and a list of "fields".
+    It may declare custom "types", see generator.core.java_types.parse_types.
+    The whole project is validated first, see generator.core.validation.
+
+    Args:
+        spec (dict | Project): Specification, or the project it describes.
+
+    Raises:
+        ProjectValidationError: If the project cannot be generated.
+        TypeError: If the specification is not a dict.
+    """
+    project = spec if isinstance(spec, Project) else Project.from_dict(spec)
+    problems = validate_project(project)
+    if problems:
+        raise ProjectValidationError(problems)
+
+    registry = type_registry.copy(parse_types(project.types))
+    return [
+        build_entity_generation_data(project, entity, registry)
+        for entity in project.entities
+    ]
+
+
+def build_entity_generation_data(project, entity, registry=None) -> dict:
+    """
+    Build the data given to the templates for an entity of the model.
+
+    Args:
+        project (Project): Project of the entity.
+        entity (Entity): Entity to generate.
+        registry (JavaTypeRegistry): Types of the project.
+    """
+    return build_generation_data(
+        project.company,
+        project.project,
+        project.package,
+        entity.name,
+        [field.to_dict() for field in entity.fields],
+        registry,
+    )
@@ -1,17 +1,19 @@
 """
 Module containing the Java imports.
 
+The imports of the types are read from the registry of the Java types, see
+generator.core.java_types.
+
 date: 05/06/2025
 """
 
-# Mapping of Java types to their necessary imports
+from generator.core.java_types import DEFAULT_TYPES, type_registry
+
+# Mapping of the default Java types to their necessary imports
 TYPE_IMPORTS = {
-    "ZonedDateTime": "java.time.ZonedDateTime",
-    "LocalDate": "java.time.LocalDate",
-    "LocalDateTime": "java.time.LocalDateTime",
-    "UUID": "java.util.UUID",
-    "List": "import java.util.List",
-    "BigDecimal": "java.math.BigDecimal",
+    java_type.name: java_type.import_path
+    for java_type in DEFAULT_TYPES
+    if java_type.import_path
 }
 
 # Common imports for all entities
@@ -40,11 +42,4 @@ def get_required_imports(fields):
     Returns:
         List of required imports
     """
-    imports = set(COMMON_IMPORTS)
-
-    for field in fields:
-        field_type = field["type"]
-        if field_type in TYPE_IMPORTS:
-            imports.add(TYPE_IMPORTS[field_type])
-
-    return sorted(list(imports))
+    return sorted(set(COMMON_IMPORTS).union(type_registry.imports_for(fields)))
@@ -0,0 +1,257 @@
+"""
+Module containing the registry of the Java types of the fields.
+
+Each type is described once: its import, the DDL of its column, the generator
+of its fake test values and its label in the GUI. The view model of the
+entities (see generator.core.view_model), the types offered by the field
+editor and the fake values all read the registry.
+
+date: 18/10/2026
+"""
+
+
+class JavaType:
+    """
+    Class describing a Java type usable by a field.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        import_path: str = None,
+        column_definition: str = None,
+        fake_factory=None,
+        label: str = None,
+        selectable: bool = True,
+    ):
+        """
+        Initialize the type.
+
+        Args:
+            name (str): Name of the type in the Java code, such as "UUID".
+            import_path (str): Class to import, None for the java.lang types.
+            column_definition (str): DDL of the column, such as "BIGINT".
+            fake_factory (callable): Called with a Faker instance, returns a
+                test value as a string. None if no value can be generated.
+            label (str): Label shown in the GUI, the name by default.
+            selectable (bool): Whether the field editor offers the type.
+        """
+        self.name = name
+        self.import_path = import_path
+        self.column_definition = column_definition
+        self.fake_factory = fake_factory
+        self.label = label or name
+        self.selectable = selectable
+
+    def __repr__(self):
+        return f"JavaType({self.name!r}, import_path={self.import_path!r})"
+
+
+DEFAULT_TYPES = [
+    JavaType(
+        "String",
+        column_definition="VARCHAR(255)",
+        fake_factory=lambda faker: faker.first_name(),
+    ),
+    JavaType(
+        "Integer",
+        column_definition="INTEGER",
+        fake_factory=lambda faker: str(faker.random_int(min=1, max=100)),
+    ),
+    JavaType(
+        "Long",
+        column_definition="BIGINT",
+        fake_factory=lambda faker: str(faker.random_number(digits=10)),
+    ),
+    JavaType(
+        "Boolean",
+        column_definition="BOOLEAN",
+        fake_factory=lambda faker: "true",
+    ),
+    JavaType(
+        "Double",
+        column_definition="DOUBLE PRECISION",
+        fake_factory=lambda faker: str(
+            round(faker.pyfloat(left_digits=2, right_digits=2, positive=True), 2)
+        ),
+    ),
+    JavaType(
+        "BigDecimal",
+        import_path="java.math.BigDecimal",
+        column_definition="NUMERIC(19, 2)",
+        fake_factory=lambda faker: str(
+            round(faker.pydecimal(left_digits=4, right_digits=2), 2)
+        ),
+    ),
+    JavaType(
+        "ZonedDateTime",
+        import_path="java.time.ZonedDateTime",
+        column_definition="TIMESTAMP WITH TIME ZONE",
+        fake_factory=lambda faker: faker.iso8601(),
+    ),
+    JavaType(
+        "LocalDate",
+        import_path="java.time.LocalDate",
+        column_definition="DATE",
+        fake_factory=lambda faker: faker.date(),
+    ),
+    JavaType(
+        "LocalDateTime",
+        import_path="java.time.LocalDateTime",
+        column_definition="TIMESTAMP",
+        fake_factory=lambda faker: faker.iso8601(),
+    ),
+    JavaType(
+        "UUID",
+        import_path="java.util.UUID",
+        column_definition="UUID",
+        fake_factory=lambda faker: str(faker.uuid4()),
+    ),
+    JavaType("List", import_path="java.util.List", selectable=False),
+]
+
+
+class JavaTypeRegistry:
+    """
+    Class holding the Java types by name, in the order they are offered.
+    """
+
+    def __init__(self, types=()):
+        """
+        Initialize the registry.
+
+        Args:
+            types (iterable[JavaType]): Types to register.
+        """
+        self._types = {}
+        self._labels = {}
+        for java_type in types:
+            self.register(java_type)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._types
+
+    def __iter__(self):
+        return iter(self._types.values())
+
+    def register(self, java_type: JavaType, replace: bool = False):
+        """
+        Register a type, such as a type specific to a project.
+
+        Raises:
+            ValueError: If a type already has this name and replace is False.
+        """
+        previous = self._types.get(java_type.name)
+        if previous is not None:
+            if not replace:
+                raise ValueError(f"The type '{java_type.name}' is already registered")
+            del self._labels[previous.label]
+        self._types[java_type.name] = java_type
+        self._labels[java_type.label] = java_type
+
+    def get(self, name: str) -> JavaType:
+        """
+        Get a type by name, None if it is unknown.
+        """
+        return self._types.get(name)
+
+    def names(self) -> list[str]:
+        """
+        Get the names of the types offered by the field editor.
+        """
+        return [t.name for t in self._types.values() if t.selectable]
+
+    def labels(self) -> list[str]:
+        """
+        Get the labels of the types offered by the field editor.
+        """
+        return [t.label for t in self._types.values() if t.selectable]
+
+    def label_for(self, name: str) -> str:
+        """
+        Get the label of a type, its name if it is unknown.
+        """
+        java_type = self._types.get(name)
+        return java_type.label if java_type else name
+
+    def name_for(self, label: str) -> str:
+        """
+        Get the name of the type shown with a label, the label if unknown.
+        """
+        java_type = self._labels.get(label)
+        return java_type.name if java_type else label
+
+    def import_for(self, name: str) -> str:
+        """
+        Get the class to import for a type, None if there is none.
+        """
+        java_type = self._types.get(name)
+        return java_type.import_path if java_type else None
+
+    def column_definition_for(self, name: str) -> str:
+        """
+        Get the DDL of the column of a type, None if there is none.
+        """
+        java_type = self._types.get(name)
+        return java_type.column_definition if java_type else None
+
+    def fake_factory(self, name: str):
+        """
+        Get the generator of the fake values of a type, None if there is none.
+        """
+        java_type = self._types.get(name)
+        return java_type.fake_factory if java_type else None
+
+    def imports_for(self, fields: list[dict]) -> list[str]:
+        """
+        Get the sorted imports needed by the types of the fields.
+        """
+        imports = {self.import_for(field["type"]) for field in fields}
+        imports.discard(None)
+        return sorted(imports)
+
+    def copy(self, types=()) -> "JavaTypeRegistry":
+        """
+        Get a new registry with these types and the given ones, which replace
+        the types of the same name.
+        """
+        registry = JavaTypeRegistry(self)
+        for java_type in types:
+            registry.register(java_type, replace=True)
+        return registry
+
+
+def parse_types(specs: list[dict]) -> list[JavaType]:
+    """
+    Build the custom types of a project specification.
+
+    Each type has a "name" and optionally an "import", a "column" and a
+    "label". No fake value is generated for these types.
+
+    Raises:
+        ValueError: If a type has no name.
+    """
+    types = []
+    for spec in specs:
+        if not spec.get("name"):
+            raise ValueError("A custom type has no name")
+        types.append(
+            JavaType(
+                spec["name"],
+                import_path=spec.get("import"),
+                column_definition=spec.get("column"),
+                label=spec.get("label"),
+            )
+        )
+    return types
+
+
+# Singleton instance
+type_registry = JavaTypeRegistry(DEFAULT_TYPES)
+
+
+def register_type(java_type: JavaType, replace: bool = False):
+    """
+    Register a type in the shared registry, see JavaTypeRegistry.register.
+    """
+    type_registry.register(java_type, replace)
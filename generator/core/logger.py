@@ -1,39 +1,121 @@
 """
 Module containing the logger.
 
+Importing this module has no side effect: the handlers are only attached by
+setup_logging(), called by the applications (GUI and command line), so that a
+program embedding the generator keeps control of its logging configuration.
+
+Once set up, the records are logged on the console (stderr) and, unless
+log_dir is None, formatted and written to the log file by a background thread
+(QueueHandler + QueueListener), so that logging does not slow down the
+generation.
+
 date: 05/06/2025
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = "logs"
 LOG_FILE = "hexapi.log"
 LOG_PATH = os.path.join(LOG_DIR, LOG_FILE)
 
-os.makedirs(LOG_DIR, exist_ok=True)
-
 # Format of the logs
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Root logger
+# Logger of the generator. The details of each template are logged at DEBUG.
 logger = logging.getLogger("hexapi")
-logger.setLevel(logging.DEBUG)
+logger.addHandler(logging.NullHandler())
 
-# Handler console
+# Handler console, attached by setup_logging()
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
 
-# File handler with rotation
-file_handler = RotatingFileHandler(
-    LOG_PATH, maxBytes=1_000_000, backupCount=3, encoding="utf-8"
-)
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+# File handler with rotation and the queue feeding it, built by setup_logging()
+file_handler = None
+queue_handler = None
+queue_listener = None
+# Whether setup_logging() attached the handlers
+_is_set_up = False
+
+_setup_lock = threading.Lock()
+
+
+def setup_logging(log_dir: str = LOG_DIR, level: int = logging.INFO):
+    """
+    Attach the console handler and the log file to the logger of the
+    generator. Calling it again has no effect.
+
+    Args:
+        log_dir (str): Directory of the log file, created if necessary. None
+            to only log on the console.
+        level (int): Level of the logger, logging.DEBUG to log every template.
+    """
+    global file_handler, queue_handler, queue_listener, _is_set_up
+    with _setup_lock:
+        if _is_set_up:
+            return
+        _is_set_up = True
+        logger.setLevel(level)
+        logger.addHandler(console_handler)
+        if log_dir is None:
+            return
+
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            os.path.join(log_dir, LOG_FILE),
+            maxBytes=1_000_000,
+            backupCount=3,
+            encoding="utf-8",
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        queue_listener.start()
+        # Write the pending records before the interpreter exits
+        atexit.register(queue_listener.stop)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_log_directly_in_child)
+        logger.addHandler(queue_handler)
+
+
+def shutdown_logging():
+    """
+    Detach the handlers attached by setup_logging() and close the log file,
+    so that it can be set up again, in another directory.
+    """
+    global file_handler, queue_handler, queue_listener, _is_set_up
+    with _setup_lock:
+        if not _is_set_up:
+            return
+        _is_set_up = False
+        logger.removeHandler(console_handler)
+        if queue_listener is None:
+            return
+        queue_listener.stop()
+        atexit.unregister(queue_listener.stop)
+        for handler in (queue_handler, file_handler):
+            logger.removeHandler(handler)
+        file_handler.close()
+        file_handler = queue_handler = queue_listener = None
+
 
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+def _log_directly_in_child():
+    """
+    The listener thread does not survive a fork: forked workers write to the
+    log file directly.
+    """
+    if queue_handler in logger.handlers:
+        logger.removeHandler(queue_handler)
+        logger.addHandler(file_handler)
@@ -0,0 +1,170 @@
+"""
+Module containing the manifest used for incremental generation.
+
+The manifest is stored next to the generated files. For every output file it
+records the key of the unit that produced it (generator version + template
+source + entity model) and the hash of the written content, so that unchanged
+units are neither rendered nor written again.
+
+date: 18/10/2026
+"""
+
+import hashlib
+import json
+import os
+
+from generator.core import __version__
+from generator.core.class_generator import PROJECT_TEMPLATES
+from generator.core.logger import logger
+
+MANIFEST_FILE = ".hexapi-manifest.json"
+MANIFEST_VERSION = 1
+
+# Keys of the entity data used by the templates of PROJECT_TEMPLATES
+PROJECT_KEYS = ("company", "project", "package_name")
+
+
+def hash_text(content: str) -> str:
+    """
+    Get the SHA-256 digest of a text.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def digest_data(data: dict) -> str:
+    """
+    Get a digest of an entity model, independent of the order of its keys.
+    """
+    return hash_text(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def get_unit_data(data: dict, template_path: str) -> dict:
+    """
+    Get the part of the entity data a template depends on.
+
+    The project templates only depend on the project, so that every entity
+    produces the same key for them.
+    """
+    if template_path in PROJECT_TEMPLATES:
+        return {key: data[key] for key in PROJECT_KEYS}
+    return data
+
+
+def compute_unit_key(template_digest: str, data_digest: str) -> str:
+    """
+    Compute the key of a generation unit (one template for one entity).
+    """
+    return hash_text(f"{__version__}\0{template_digest}\0{data_digest}")
+
+
+class GenerationManifest:
+    """
+    Class recording which unit produced each generated file.
+    """
+
+    def __init__(self, output_root: str, entries: dict = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            output_root (str): Root directory of the generated files.
+            entries (dict): {relative output path: {"key": ..., "hash": ...}}
+        """
+        self.output_root = output_root
+        self.entries = entries or {}
+
+    @property
+    def path(self) -> str:
+        """
+        Path of the manifest file.
+        """
+        return os.path.join(self.output_root, MANIFEST_FILE)
+
+    @classmethod
+    def load(cls, output_root: str) -> "GenerationManifest":
+        """
+        Load the manifest of an output directory.
+
+        A missing, unreadable or outdated manifest gives an empty manifest, so
+        that every unit is generated again.
+        """
+        path = os.path.join(output_root, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return cls(output_root)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable manifest %s: %s", path, e)
+            return cls(output_root)
+        if content.get("version") != MANIFEST_VERSION:
+            logger.info("Ignoring manifest %s with another version", path)
+            return cls(output_root)
+        return cls(output_root, content.get("files", {}))
+
+    def _relative(self, output_path: str) -> str:
+        """
+        Get the key of an output file in the manifest.
+        """
+        return os.path.relpath(output_path, self.output_root).replace(os.sep, "/")
+
+    def unit_keys(self, renderer, data: dict, template_paths) -> list[str]:
+        """
+        Compute the keys of the templates rendered for an entity.
+
+        The entity model is hashed once, whatever the number of templates.
+        """
+        entity_digest = None
+        project_digest = None
+        keys = []
+        for template_path in template_paths:
+            if template_path in PROJECT_TEMPLATES:
+                if project_digest is None:
+                    project_digest = digest_data(get_unit_data(data, template_path))
+                data_digest = project_digest
+            else:
+                if entity_digest is None:
+                    entity_digest = digest_data(data)
+                data_digest = entity_digest
+            keys.append(
+                compute_unit_key(renderer.template_digest(template_path), data_digest)
+            )
+        return keys
+
+    def is_up_to_date(self, output_path: str, key: str) -> bool:
+        """
+        Whether the file was produced by the same unit and was not modified.
+        """
+        entry = self.entries.get(self._relative(output_path))
+        if entry is None or entry["key"] != key:
+            return False
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                return hash_text(f.read()) == entry["hash"]
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def record(self, output_path: str, key: str, content: str):
+        """
+        Record the unit that produced a file.
+        """
+        self.entries[self._relative(output_path)] = {
+            "key": key,
+            "hash": hash_text(content),
+        }
+
+    def save(self):
+        """
+        Write the manifest next to the generated files.
+        """
+        os.makedirs(self.output_root, exist_ok=True)
+        content = {
+            "version": MANIFEST_VERSION,
+            "generator": __version__,
+            "files": dict(sorted(self.entries.items())),
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(content, f, indent=1)
+        os.replace(tmp_path, self.path)
+        logger.debug("Manifest saved: %s", self.path)
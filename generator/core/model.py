@@ -0,0 +1,237 @@
+"""
+Module containing the model of a project: the Project, Entity and Field
+classes.
+
+The classes use __slots__: a project with thousands of entities holds one
+small object per field instead of a dict, and the attributes are read without
+hashing their names. They are converted from and to the dicts of the project
+specification (see generator.cli) and JSON by from_dict/to_dict and
+from_json/to_json.
+
+date: 18/10/2026
+"""
+
+import json
+
+
+class Field:
+    """
+    Class representing a field of an entity.
+    """
+
+    __slots__ = ("name", "type", "comment", "test_value", "is_id", "nullable")
+
+    def __init__(
+        self,
+        name: str,
+        type: str = "String",
+        comment: str = "",
+        test_value: str = "",
+        is_id: bool = False,
+        nullable: bool = False,
+    ):
+        """
+        Initialize the field.
+
+        Args:
+            name (str): Name of the field, in camelCase.
+            type (str): Java type, see generator.core.java_types.
+            comment (str): Comment of the field.
+            test_value (str): Value used by the tests.
+            is_id (bool): Whether the field is the identifier of the entity.
+            nullable (bool): Whether the field may be null.
+        """
+        self.name = name
+        self.type = type
+        self.comment = comment
+        self.test_value = test_value
+        self.is_id = is_id
+        self.nullable = nullable
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Field":
+        """
+        Build a field from a dict, reading the legacy "nom" and "isId" keys.
+        """
+        get = data.get
+        return cls(
+            get("name") or get("nom") or "",
+            get("type") or "String",
+            get("comment") or "",
+            get("test_value") or "",
+            bool(get("is_id", get("isId", False))),
+            bool(get("nullable", False)),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "comment": self.comment,
+            "test_value": self.test_value,
+            "is_id": self.is_id,
+            "nullable": self.nullable,
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, Field):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    def __repr__(self):
+        return f"Field({self.name!r}, {self.type!r})"
+
+
+class Entity:
+    """
+    Class representing an entity of a project and its fields, in order.
+    """
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name: str, fields: list[Field] = None):
+        self.name = name
+        self.fields = fields if fields is not None else []
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Entity":
+        """
+        Build an entity from a dict with a "name" and a list of "fields".
+        """
+        from_dict = Field.from_dict
+        return cls(
+            data.get("name") or "",
+            [from_dict(field) for field in data.get("fields") or []],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "fields": [field.to_dict() for field in self.fields],
+        }
+
+    @property
+    def id_fields(self) -> list[Field]:
+        """
+        Fields marked as identifier.
+        """
+        return [field for field in self.fields if field.is_id]
+
+    def __eq__(self, other):
+        if not isinstance(other, Entity):
+            return NotImplemented
+        return self.name == other.name and self.fields == other.fields
+
+    def __repr__(self):
+        return f"Entity({self.name!r}, fields={len(self.fields)})"
+
+
+class Project:
+    """
+    Class representing a project: its names, its custom types and its
+    entities, in order.
+    """
+
+    __slots__ = ("company", "project", "package", "entities", "types")
+
+    def __init__(
+        self,
+        company: str = "",
+        project: str = "",
+        package: str = "",
+        entities: list[Entity] = None,
+        types: list[dict] = None,
+    ):
+        """
+        Initialize the project.
+
+        Args:
+            company (str): Name of the company.
+            project (str): Name of the project.
+            package (str): Java package of the project.
+            entities (list[Entity]): Entities of the project.
+            types (list[dict]): Custom Java types, see
+                generator.core.java_types.parse_types.
+        """
+        self.company = company
+        self.project = project
+        self.package = package
+        self.entities = entities if entities is not None else []
+        self.types = types if types is not None else []
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Project":
+        """
+        Build a project from a project specification.
+
+        Raises:
+            TypeError: If the specification is not a dict.
+        """
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"A project specification is a dict, not {type(data).__name__}"
+            )
+        from_dict = Entity.from_dict
+        return cls(
+            data.get("company") or "",
+            data.get("project") or "",
+            data.get("package") or "",
+            [from_dict(entity) for entity in data.get("entities") or []],
+            list(data.get("types") or []),
+        )
+
+    def to_dict(self) -> dict:
+        data = {
+            "company": self.company,
+            "project": self.project,
+            "package": self.package,
+            "entities": [entity.to_dict() for entity in self.entities],
+        }
+        if self.types:
+            data["types"] = self.types
+        return data
+
+    @classmethod
+    def from_json(cls, text) -> "Project":
+        """
+        Build a project from a JSON specification, a string or bytes.
+        """
+        return cls.from_dict(json.loads(text))
+
+    def to_json(self, indent: int = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    def missing_keys(self) -> list[str]:
+        """
+        Get the names of the empty "company", "project" and "package" keys.
+        """
+        return [
+            key
+            for key, value in (
+                ("company", self.company),
+                ("project", self.project),
+                ("package", self.package),
+            )
+            if not value
+        ]
+
+    def entity(self, name: str) -> Entity:
+        """
+        Get an entity by name, None if there is none.
+        """
+        return next((entity for entity in self.entities if entity.name == name), None)
+
+    def __eq__(self, other):
+        if not isinstance(other, Project):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    def __repr__(self):
+        return (
+            f"Project({self.company!r}, {self.project!r}, {self.package!r}, "
+            f"entities={len(self.entities)})"
+        )
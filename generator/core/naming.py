@@ -1,62 +1,153 @@
 """
 Module containing the naming.
 
+Every variant of a name is computed in one pass by name_variants(), which
+cleans the name once and keeps the result in a bounded LRU cache: the same
+entity and field names are converted for each entity, template and run, and
+the helpers below only read the variant they need from the cache.
+
 date: 05/06/2025
 """
 
 import re
 import unicodedata
+from functools import lru_cache
+
+# Number of names whose variants are kept in the cache
+NAMES_CACHE_SIZE = 4096
+
+# Characters kept by clean_string
+_ALLOWED_CHARACTERS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "
+)
+
+# Translate table deleting the other ASCII characters
+_ASCII_DELETE = {
+    code: None for code in range(128) if chr(code) not in _ALLOWED_CHARACTERS
+}
+
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def clean_string(s: str) -> str:
     """
     Clean the string.
+
+    Accents are removed, then every character but ASCII letters, digits and
+    spaces.
+    """
+    if not s.isascii():
+        # The combining accents left by NFKD are not ASCII, they are dropped
+        # with the other characters
+        s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode()
+    return s.translate(_ASCII_DELETE).strip()
+
+
+def to_column_name(name: str) -> str:
+    """
+    Convert a field name to the name of its column, in snake_case.
+
+    "Id" is first replaced by "_id", so that "userId" gives "user_id".
+    """
+    return _column_name(name)
+
+
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def _column_name(name: str) -> str:
+    return _CAMEL_CASE_BOUNDARY.sub("_", name.replace("Id", "_id")).lower()
+
+
+@lru_cache(maxsize=NAMES_CACHE_SIZE)
+def _variants(name: str) -> dict:
+    """
+    Compute the variants of a name, see name_variants. Shared by the cache,
+    never modified.
+    """
+    cleaned = clean_string(name)
+    words = cleaned.split()
+    camel = (
+        words[0].lower() + "".join(w.capitalize() for w in words[1:]) if words else ""
+    )
+    return {
+        "original": cleaned,
+        "PascalCase": "".join(word.capitalize() for word in words),
+        "camelCase": camel,
+        "lowercase": cleaned.lower().replace(" ", ""),
+        # Naive plural, used for the REST endpoints
+        "kebab-case": _CAMEL_CASE_BOUNDARY.sub("-", cleaned).lower() + "s",
+        "snake_case": _CAMEL_CASE_BOUNDARY.sub("_", camel).lower(),
+        "column": _column_name(camel),
+    }
+
+
+def name_variants(name: str) -> dict:
+    """
+    Get every variant of a raw name.
+
+    Returns:
+        A new dict with the "original" cleaned name and its "PascalCase",
+        "camelCase", "lowercase", "kebab-case" (pluralized), "snake_case" and
+        "column" variants.
+    """
+    return dict(_variants(name))
+
+
+def bulk_name_variants(names) -> dict:
+    """
+    Get the variants of many names, such as the fields of an entity.
+
+    Args:
+        names (iterable[str]): Raw names, possibly repeated.
+
+    Returns:
+        The variants of each distinct name, by name. The dicts are shared with
+        the cache and must not be modified.
     """
-    nfkd = unicodedata.normalize("NFKD", s)
-    no_accents = "".join(c for c in nfkd if not unicodedata.combining(c))
-    cleaned = re.sub(r"[^a-zA-Z0-9 ]", "", no_accents)
-    return cleaned.strip()
+    return {name: _variants(name) for name in dict.fromkeys(names)}
+
+
+def clear_naming_cache():
+    """
+    Empty the caches of the variants.
+    """
+    _variants.cache_clear()
+    _column_name.cache_clear()
 
 
 def to_pascal_case(s: str) -> str:
     """
     Convert the string to PascalCase.
     """
-    s = clean_string(s)
-    return "".join(word.capitalize() for word in s.split())
+    return _variants(s)["PascalCase"]
 
 
 def to_camel_case(s: str) -> str:
     """
     Convert the string to camelCase.
     """
-    s = clean_string(s)
-    parts = s.split()
-    return (
-        parts[0].lower() + "".join(w.capitalize() for w in parts[1:]) if parts else ""
-    )
+    return _variants(s)["camelCase"]
 
 
 def to_kebab_case(s: str) -> str:
     """
     Convert the string to kebab-case.
     """
-    s = clean_string(s)
-    kebab = re.sub(r"(?<!^)(?=[A-Z])", "-", s).lower()
-    return kebab + "s"  # Pluralisation naïve
+    return _variants(s)["kebab-case"]  # Pluralisation naïve
+
+
+def to_snake_case(s: str) -> str:
+    """
+    Convert the string to snake_case.
+    """
+    return _variants(s)["snake_case"]
 
 
 def generate_name_variants(name: str) -> dict:
     """
     Generate several formats from a raw name.
     """
-    s = clean_string(name)
-    pascal = to_pascal_case(s)
-    camel = to_camel_case(s)
-    lower = s.lower().replace(" ", "")
+    variants = _variants(name)
     return {
-        "original": s,
-        "PascalCase": pascal,
-        "camelCase": camel,
-        "lowercase": lower,
+        key: variants[key]
+        for key in ("original", "PascalCase", "camelCase", "lowercase")
     }
@@ -0,0 +1,225 @@
+"""
+Module containing the streaming generation pipeline.
+
+The pipeline is a chain of iterator stages:
+
+    read entities -> expand to (entity, template) units -> render chunks -> sink
+
+Entities are read lazily, each template is rendered with Template.generate()
+and its chunks are streamed to the sink, so that the peak memory does not grow
+with the size of the model.
+
+date: 18/10/2026
+"""
+
+import json
+import os
+import time
+
+from generator.core.class_generator import (
+    PROJECT_TEMPLATES,
+    TEMPLATES_TO_GENERATE,
+    check_entity_data,
+    get_output_path,
+    get_renderer,
+)
+from generator.core.generator import build_entity_generation_data
+from generator.core.java_types import parse_types, type_registry
+from generator.core.logger import logger
+from generator.core.model import Entity, Project
+from generator.core.validation import ProjectValidationError, ProjectValidator
+from generator.core.view_model import build_view_model
+from generator.core.writer import OutputWriter
+
+# Number of created directories remembered by the writer of the pipeline
+MAX_DIRECTORIES = 64
+
+
+def validate_entities_jsonl(path: str) -> list[str]:
+    """
+    Check a whole project stored as JSON Lines, without building its data.
+
+    The file is read one line at a time, only the names seen are kept.
+
+    Returns:
+        Every problem found, see generator.core.validation, empty if the
+        project can be generated.
+    """
+    validator = ProjectValidator()
+    problems = []
+    project = None
+    entities = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if project is None:
+                project = Project.from_dict(item)
+                problems.extend(validator.check_project(project))
+                continue
+            entities += 1
+            problems.extend(
+                _entity_problems(validator, Entity.from_dict(item), line_number)
+            )
+    if project is None:
+        problems.extend(validator.check_project(Project()))
+    if not entities:
+        problems.append("The project has no entities")
+    return problems
+
+
+def read_entities_jsonl(source):
+    """
+    Read the entities of a project stored as JSON Lines, one at a time.
+
+    The first line holds the project ("company", "project" and "package", and
+    optionally custom "types"), every following line holds an entity ("name"
+    and "fields").
+
+    A file is validated as a whole before its first entity is yielded, see
+    validate_entities_jsonl. An open file such as sys.stdin cannot be read
+    twice: each entity is validated before it is yielded, so an invalid
+    entity stops the generation after the entities before it.
+
+    Args:
+        source: Path of the file, or an open text file such as sys.stdin.
+
+    Yields:
+        The template data of each entity.
+
+    Raises:
+        ProjectValidationError: If the project or an entity is invalid.
+    """
+    if isinstance(source, str):
+        problems = validate_entities_jsonl(source)
+        if problems:
+            raise ProjectValidationError(problems)
+        with open(source, "r", encoding="utf-8") as f:
+            yield from read_entities_jsonl(f)
+        return
+
+    project = None
+    registry = None
+    validator = ProjectValidator()
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        if project is None:
+            project = Project.from_dict(item)
+            problems = validator.check_project(project)
+            if problems:
+                raise ProjectValidationError(problems)
+            registry = type_registry.copy(parse_types(project.types))
+            continue
+        entity = Entity.from_dict(item)
+        problems = _entity_problems(validator, entity, line_number)
+        if problems:
+            raise ProjectValidationError(problems)
+        yield build_entity_generation_data(project, entity, registry)
+
+
+def _entity_problems(validator, entity: Entity, line_number: int) -> list[str]:
+    """
+    Check an entity of a JSON Lines project, prefixing its problems with the
+    number of its line.
+    """
+    return [
+        f"Line {line_number}: {problem}" for problem in validator.check_entity(entity)
+    ]
+
+
+def read_entities_dir(directory: str):
+    """
+    Read the template data of the entities stored in a directory, one JSON file
+    per entity, one file at a time.
+    """
+    with os.scandir(directory) as entries:
+        names = sorted(entry.name for entry in entries if entry.name.endswith(".json"))
+    for name in names:
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            yield json.load(f)
+
+
+def iter_units(entities, template_paths=None, output_root: str = "output"):
+    """
+    Expand the entities into generation units.
+
+    The project templates are only emitted the first time their output path is
+    seen, as they produce the same file for every entity of a project.
+
+    Yields:
+        (data, template_path, output_path) tuples.
+    """
+    template_paths = list(template_paths or TEMPLATES_TO_GENERATE)
+    seen_project_paths = set()
+    for data in entities:
+        check_entity_data(data)
+        data = build_view_model(data)
+        for template_path in template_paths:
+            output_path = get_output_path(data, template_path, output_root)
+            if template_path in PROJECT_TEMPLATES:
+                if output_path in seen_project_paths:
+                    continue
+                seen_project_paths.add(output_path)
+            yield data, template_path, output_path
+
+
+def render_units(units, renderer=None):
+    """
+    Render the units lazily.
+
+    Yields:
+        (output_path, chunks) tuples, chunks being an iterator of strings that
+        must be consumed before the next unit is requested.
+    """
+    renderer = renderer or get_renderer()
+    for data, template_path, output_path in units:
+        yield output_path, renderer.generate(template_path, data)
+
+
+def write_units(rendered_units, writer: OutputWriter = None) -> OutputWriter:
+    """
+    Stream the rendered units to the writer.
+
+    Returns:
+        The writer, holding the statistics of the run.
+    """
+    writer = writer or OutputWriter(max_directories=MAX_DIRECTORIES)
+    for output_path, chunks in rendered_units:
+        writer.write_stream(output_path, chunks)
+    return writer
+
+
+def run_pipeline(
+    entities,
+    output_root: str = "output",
+    template_paths=None,
+    writer: OutputWriter = None,
+    renderer=None,
+) -> OutputWriter:
+    """
+    Generate a model of any size in bounded memory.
+
+    Args:
+        entities (iterable[dict]): Template data of the entities, ideally a
+            lazy iterator such as read_entities_jsonl().
+        output_root (str): Root directory where the files will be written.
+        template_paths (list[str]): Templates to render, defaults to
+            TEMPLATES_TO_GENERATE.
+        writer (OutputWriter): Sink of the files, a new one by default.
+        renderer (TemplateRenderer): Renderer, the shared one by default.
+
+    Returns:
+        The writer, holding the statistics of the run.
+    """
+    start = time.perf_counter()
+    units = iter_units(entities, template_paths, output_root)
+    writer = write_units(render_units(units, renderer), writer)
+    logger.info(
+        "Streaming generation completed in %.3fs: %s",
+        time.perf_counter() - start,
+        writer.stats(),
+    )
+    return writer
@@ -0,0 +1,151 @@
+"""
+Module containing the progress of a generation and its run in the background.
+
+date: 18/10/2026
+"""
+
+import queue
+import threading
+import time
+
+
+class GenerationProgress:
+    """
+    Class computing the throughput and the remaining time of a generation.
+    """
+
+    def __init__(self, total: int, clock=time.monotonic):
+        """
+        Initialize the progress.
+
+        Args:
+            total (int): Number of entities to generate.
+            clock (callable): Source of the time, in seconds.
+        """
+        self.total = total
+        self.done = 0
+        self.clock = clock
+        self.start_time = clock()
+
+    def update(self, done: int):
+        """
+        Record the number of entities generated so far.
+        """
+        self.done = done
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Time elapsed since the start, in seconds.
+        """
+        return self.clock() - self.start_time
+
+    @property
+    def fraction(self) -> float:
+        """
+        Part of the entities generated, between 0 and 1.
+        """
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def rate(self) -> float:
+        """
+        Number of entities generated per second, 0 before the first one.
+        """
+        elapsed = self.elapsed
+        return self.done / elapsed if self.done and elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """
+        Estimated remaining time in seconds, None until it can be estimated.
+        """
+        rate = self.rate
+        if not rate:
+            return None
+        return (self.total - self.done) / rate
+
+    def describe(self) -> str:
+        """
+        Describe the progress, such as "12/300 entities - 45.2 entities/s -
+        ETA 6s".
+        """
+        text = f"{self.done}/{self.total} entities"
+        if self.rate:
+            text += f" - {self.rate:.1f} entities/s - ETA {self.eta:.0f}s"
+        return text
+
+
+class BackgroundGeneration:
+    """
+    Class running a GenerationEngine in a background thread.
+
+    The engine reports its progress as events put in a queue, which the GUI
+    drains from its own thread with poll(), so that Tk is only used by the
+    main thread:
+
+        ("progress", done, total, table)
+        ("done", results)
+        ("error", message)
+    """
+
+    def __init__(self, engine, entities: list[dict]):
+        """
+        Initialize the run.
+
+        Args:
+            engine (GenerationEngine): Engine generating the entities.
+            entities (list[dict]): Entity models.
+        """
+        self.engine = engine
+        self.entities = list(entities)
+        self.events = queue.SimpleQueue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="generation", daemon=True)
+
+    def start(self):
+        """
+        Start the generation.
+        """
+        self.thread.start()
+
+    def cancel(self):
+        """
+        Ask the generation to stop between two templates.
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the generation was asked to stop.
+        """
+        return self.cancel_event.is_set()
+
+    def poll(self) -> list[tuple]:
+        """
+        Get the events emitted since the previous call, without waiting.
+        """
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        """
+        Generate the entities, in the background thread.
+        """
+        try:
+            results = self.engine.generate(
+                self.entities,
+                progress=lambda done, total, result: self.events.put(
+                    ("progress", done, total, result.table)
+                ),
+                cancel=self.cancel_event,
+            )
+        except Exception as e:
+            self.events.put(("error", f"{type(e).__name__}: {e}"))
+        else:
+            self.events.put(("done", results))
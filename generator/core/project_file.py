@@ -0,0 +1,199 @@
+"""
+Module containing the project file format.
+
+A project is saved as a single zip file:
+
+    index.json        format version, project names, columns of the fields
+                      and, for each entity, its name, number of fields and
+                      member
+    entities/<n>.json fields of an entity, one list of values per field in
+                      the order of the columns
+
+Opening a project only reads the index: the fields of an entity are read
+when they are first used, by its editor or by the generation. Saving copies
+the members of the entities that were not read as they are.
+
+date: 18/10/2026
+"""
+
+import json
+import os
+import zipfile
+
+from generator.core.logger import logger
+from generator.core.project_store import ProjectStore
+
+PROJECT_EXTENSION = ".hexapi"
+PROJECT_FORMAT = "hexapi-project"
+PROJECT_VERSION = 1
+INDEX_MEMBER = "index.json"
+
+# Keys of a field, in the order of the values stored for each field
+FIELD_COLUMNS = ["name", "type", "comment", "test_value", "is_id", "nullable"]
+
+
+class ProjectFileError(ValueError):
+    """
+    Raised when a file is not a project, or was written by a newer version.
+    """
+
+
+def encode_fields(fields: list[dict]) -> bytes:
+    """
+    Encode the fields of an entity as rows of values.
+    """
+    rows = [[field.get(column) for column in FIELD_COLUMNS] for field in fields]
+    return json.dumps(rows, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def decode_fields(content: bytes, columns: list[str]) -> list[dict]:
+    """
+    Decode the fields of an entity written by encode_fields.
+    """
+    return [dict(zip(columns, row)) for row in json.loads(content)]
+
+
+class ProjectReader:
+    """
+    Class reading the entities of an open project file on demand.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a project file and read its index.
+
+        Raises:
+            ProjectFileError: If the file is not a project of a known version.
+        """
+        self.path = path
+        try:
+            self.zip = zipfile.ZipFile(path)
+            index = json.loads(self.zip.read(INDEX_MEMBER))
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise ProjectFileError(f"{path} is not a project file: {e}") from e
+        if index.get("format") != PROJECT_FORMAT:
+            raise ProjectFileError(f"{path} is not a project file")
+        if index.get("version", 0) > PROJECT_VERSION:
+            raise ProjectFileError(
+                f"{path} was saved by a newer version of the generator"
+            )
+        self.index = index
+
+    def read_raw(self, member: str) -> bytes:
+        """
+        Read the encoded fields of an entity.
+        """
+        return self.zip.read(member)
+
+    def loader(self, entry: dict):
+        """
+        Get the function reading the fields of an entity of the index.
+        """
+        return EntityLoader(self, entry["member"], self.index["columns"])
+
+    def close(self):
+        self.zip.close()
+
+
+class EntityLoader:
+    """
+    Class reading the fields of one entity of a project file.
+    """
+
+    def __init__(self, reader: ProjectReader, member: str, columns: list[str]):
+        self.reader = reader
+        self.member = member
+        self.columns = columns
+
+    def __call__(self) -> list[dict]:
+        return decode_fields(self.reader.read_raw(self.member), self.columns)
+
+
+def open_project(path: str) -> ProjectStore:
+    """
+    Open a project, reading only its index.
+
+    A JSON specification (see generator.cli) is also accepted, and read at
+    once.
+
+    Returns:
+        The store of the project. Its reader keeps the file open until
+        close_project() is called.
+
+    Raises:
+        ProjectFileError: If the file is not a project.
+    """
+    if not zipfile.is_zipfile(path):
+        try:
+            store = ProjectStore.load(path)
+        except (UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+            raise ProjectFileError(f"{path} is not a project file: {e}") from e
+        return store
+
+    reader = ProjectReader(path)
+    index = reader.index
+    store = ProjectStore(index["company"], index["project"], index["package"])
+    for entry in index["entities"]:
+        store.add_lazy_entity(entry["name"], reader.loader(entry), entry["fields"])
+    store.mark_clean()
+    store.reader = reader
+    logger.info("Project %s opened (%d entities)", path, len(store))
+    return store
+
+
+def close_project(store: ProjectStore):
+    """
+    Close the file a project was read from, once every entity is read or the
+    project is no longer used.
+    """
+    if store.reader is not None:
+        store.reader.close()
+        store.reader = None
+
+
+def save_project(store: ProjectStore, path: str):
+    """
+    Save a project to a single file, replacing it atomically.
+
+    The entities not read since the project was opened are copied without
+    being decoded. The store then reads them from the new file.
+    """
+    entries = []
+    tmp_path = path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for position, name in enumerate(store.entity_names()):
+            member = f"entities/{position}.json"
+            loader = store.pending_loader(name)
+            if isinstance(loader, EntityLoader):
+                content = loader.reader.read_raw(loader.member)
+                if loader.columns != FIELD_COLUMNS:
+                    content = encode_fields(decode_fields(content, loader.columns))
+            else:
+                content = encode_fields(store.get_fields(name))
+            archive.writestr(member, content)
+            entries.append(
+                {"name": name, "fields": store.field_count(name), "member": member}
+            )
+        index = {
+            "format": PROJECT_FORMAT,
+            "version": PROJECT_VERSION,
+            "company": store.company,
+            "project": store.project,
+            "package": store.package,
+            "columns": FIELD_COLUMNS,
+            "entities": entries,
+        }
+        archive.writestr(INDEX_MEMBER, json.dumps(index, separators=(",", ":")))
+
+    # The previous file may be the one the pending entities are read from
+    close_project(store)
+    os.replace(tmp_path, path)
+    reader = ProjectReader(path)
+    for entry in entries:
+        if store.pending_loader(entry["name"]) is not None:
+            store.add_lazy_entity(
+                entry["name"], reader.loader(entry), entry["fields"], replace=True
+            )
+    store.reader = reader
+    store.mark_clean()
+    logger.info("Project saved to %s (%d entities)", path, len(store))
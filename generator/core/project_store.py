@@ -0,0 +1,289 @@
+"""
+Module containing the ProjectStore class.
+
+The store is the single in-memory model of the project edited in the GUI: the
+board, the entity editors and the generation all read and write it, instead
+of exchanging temp/<entity>.json files. It records which entities changed
+since the last save. It is written to disk at once, in a project file (see
+generator.core.project_file) or by save() in the format of the specification
+read by the command line (see generator.cli).
+
+date: 18/10/2026
+"""
+
+import json
+import os
+
+from generator.core.generator import build_generation_data
+from generator.core.logger import logger
+from generator.core.model import Entity, Field, Project
+
+
+class ProjectStore:
+    """
+    Class holding the project, its entities and their fields, in order.
+    """
+
+    def __init__(self, company: str = "", project: str = "", package: str = ""):
+        """
+        Initialize an empty project.
+
+        Args:
+            company (str): Name of the company.
+            project (str): Name of the project.
+            package (str): Java package of the project.
+        """
+        self.company = company
+        self.project = project
+        self.package = package
+        # Fields of each entity, by entity name, in creation order. None until
+        # the fields of an entity opened from a file are read.
+        self._entities = {}
+        # Functions reading the fields of the entities not read yet, and the
+        # number of fields of these entities, see add_lazy_entity()
+        self._loaders = {}
+        # File the entities not read yet come from, see project_file
+        self.reader = None
+        # Entities added, modified or renamed since the last save
+        self.dirty = set()
+        # Whether the project names or the list of entities changed
+        self.structure_dirty = False
+
+    def __contains__(self, entity_name: str) -> bool:
+        return entity_name in self._entities
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the project changed since the last save.
+        """
+        return self.structure_dirty or bool(self.dirty)
+
+    def entity_names(self) -> list[str]:
+        """
+        Get the names of the entities, in creation order.
+        """
+        return list(self._entities)
+
+    def set_project_info(self, company: str, project: str, package: str):
+        """
+        Set the names of the project.
+        """
+        if (company, project, package) != (self.company, self.project, self.package):
+            self.company, self.project, self.package = company, project, package
+            self.structure_dirty = True
+
+    def add_entity(self, entity_name: str, fields: list[dict] = None):
+        """
+        Add an entity.
+
+        Raises:
+            ValueError: If an entity already has this name.
+        """
+        if entity_name in self._entities:
+            raise ValueError(f"The entity '{entity_name}' already exists")
+        self._entities[entity_name] = [dict(field) for field in fields or []]
+        self.dirty.add(entity_name)
+        self.structure_dirty = True
+
+    def add_lazy_entity(
+        self, entity_name: str, loader, field_count: int, replace: bool = False
+    ):
+        """
+        Add an entity whose fields are only read when first used.
+
+        Args:
+            entity_name (str): Name of the entity.
+            loader (callable): Returns the list of the fields of the entity.
+            field_count (int): Number of fields of the entity.
+            replace (bool): Whether to replace the loader of an entity not
+                read yet, instead of adding a new entity.
+        """
+        if replace:
+            if self._entities.get(entity_name, []) is not None:
+                raise ValueError(f"The entity '{entity_name}' is already read")
+        elif entity_name in self._entities:
+            raise ValueError(f"The entity '{entity_name}' already exists")
+        else:
+            self.dirty.add(entity_name)
+            self.structure_dirty = True
+        self._entities[entity_name] = None
+        self._loaders[entity_name] = (loader, field_count)
+
+    def pending_loader(self, entity_name: str):
+        """
+        Get the function reading the fields of an entity, None once read.
+        """
+        pending = self._loaders.get(entity_name)
+        return pending[0] if pending else None
+
+    def field_count(self, entity_name: str) -> int:
+        """
+        Get the number of fields of an entity, without reading them.
+        """
+        pending = self._loaders.get(entity_name)
+        if pending:
+            return pending[1]
+        return len(self._entities[entity_name])
+
+    def _fields(self, entity_name: str) -> list[dict]:
+        """
+        Get the fields of an entity, reading them on first use.
+        """
+        fields = self._entities[entity_name]
+        if fields is None:
+            loader, _ = self._loaders.pop(entity_name)
+            fields = self._entities[entity_name] = loader()
+        return fields
+
+    def get_fields(self, entity_name: str) -> list[dict]:
+        """
+        Get a copy of the fields of an entity.
+
+        Raises:
+            KeyError: If the entity does not exist.
+        """
+        return [dict(field) for field in self._fields(entity_name)]
+
+    def set_fields(self, entity_name: str, fields: list[dict]):
+        """
+        Replace the fields of an entity.
+
+        Raises:
+            KeyError: If the entity does not exist.
+        """
+        if entity_name not in self._entities:
+            raise KeyError(entity_name)
+        fields = [dict(field) for field in fields]
+        if fields != self._fields(entity_name):
+            self._entities[entity_name] = fields
+            self.dirty.add(entity_name)
+
+    def rename_entity(self, old_name: str, new_name: str):
+        """
+        Rename an entity, keeping its position.
+
+        Raises:
+            KeyError: If the entity does not exist.
+            ValueError: If another entity already has the new name.
+        """
+        if old_name == new_name:
+            return
+        if old_name not in self._entities:
+            raise KeyError(old_name)
+        if new_name in self._entities:
+            raise ValueError(f"The entity '{new_name}' already exists")
+        self._entities = {
+            (new_name if name == old_name else name): fields
+            for name, fields in self._entities.items()
+        }
+        if old_name in self._loaders:
+            self._loaders[new_name] = self._loaders.pop(old_name)
+        self.dirty.discard(old_name)
+        self.dirty.add(new_name)
+        self.structure_dirty = True
+
+    def delete_entity(self, entity_name: str):
+        """
+        Delete an entity, if it exists.
+        """
+        if entity_name in self._entities:
+            del self._entities[entity_name]
+            self._loaders.pop(entity_name, None)
+            self.dirty.discard(entity_name)
+            self.structure_dirty = True
+
+    def mark_clean(self):
+        """
+        Forget the changes, once the project is saved.
+        """
+        self.dirty.clear()
+        self.structure_dirty = False
+
+    def build_generation_data(self) -> list[dict]:
+        """
+        Build the data given to the templates for every entity.
+
+        The data is built from the model on each call, the model itself is
+        never modified, so generating twice gives the same data.
+        """
+        return [
+            build_generation_data(
+                self.company, self.project, self.package, name, self.get_fields(name)
+            )
+            for name in self._entities
+        ]
+
+    def to_spec(self) -> dict:
+        """
+        Get the project as a specification, see generator.cli.
+        """
+        return {
+            "company": self.company,
+            "project": self.project,
+            "package": self.package,
+            "entities": [
+                {"name": name, "fields": self.get_fields(name)}
+                for name in self._entities
+            ],
+        }
+
+    def to_project(self) -> Project:
+        """
+        Get the model of the project, see generator.core.model.
+        """
+        return Project(
+            self.company,
+            self.project,
+            self.package,
+            [
+                Entity(name, [Field.from_dict(f) for f in self.get_fields(name)])
+                for name in self._entities
+            ],
+        )
+
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectStore":
+        """
+        Build a store from the model of a project, see generator.core.model.
+        """
+        store = cls(project.company, project.project, project.package)
+        for entity in project.entities:
+            store.add_entity(entity.name, [field.to_dict() for field in entity.fields])
+        store.mark_clean()
+        return store
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "ProjectStore":
+        """
+        Build a store from a specification, see generator.cli.
+        """
+        store = cls(
+            spec.get("company", ""), spec.get("project", ""), spec.get("package", "")
+        )
+        for entity in spec.get("entities", []):
+            store.add_entity(entity["name"], entity.get("fields", []))
+        store.mark_clean()
+        return store
+
+    def save(self, path: str):
+        """
+        Write the whole project to a file at once, replacing it atomically.
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_spec(), f, indent=1, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        logger.info("Project saved to %s (%d entities)", path, len(self))
+        self.mark_clean()
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectStore":
+        """
+        Read a project written by save().
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_spec(json.load(f))
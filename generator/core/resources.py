@@ -0,0 +1,35 @@
+"""
+Module containing the location of the resources shipped with the generator.
+
+Resources (templates, configuration, assets) are resolved relative to the
+generator package, so that it works whatever the current directory. In a
+frozen build, they are next to the executable, see setup.py.
+
+date: 18/10/2026
+"""
+
+import os
+import sys
+
+
+def get_package_root() -> str:
+    """
+    Get the directory of the generator package.
+    """
+    if getattr(sys, "frozen", False):
+        return os.path.join(os.path.dirname(sys.executable), "generator")
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+PACKAGE_ROOT = get_package_root()
+
+
+def resource_path(*parts: str) -> str:
+    """
+    Get the absolute path of a resource of the generator package.
+
+    Args:
+        parts (str): Path of the resource relative to the package, such as
+            "config", "settings.json".
+    """
+    return os.path.join(PACKAGE_ROOT, *parts)
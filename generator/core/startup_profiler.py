@@ -0,0 +1,129 @@
+"""
+Module containing the startup profiler.
+
+The profiler records the time spent importing each module, in the spirit of
+python -X importtime, and the time to the first paint of the main window, then
+writes them to a JSON report.
+
+Usage:
+    python main.py --profile-startup [report.json]
+
+date: 18/10/2026
+"""
+
+import builtins
+import json
+import sys
+import threading
+import time
+
+DEFAULT_REPORT = "startup_profile.json"
+
+
+class StartupProfiler:
+    """
+    Class recording the imports and the milestones of the startup.
+    """
+
+    def __init__(self, report_path: str = DEFAULT_REPORT):
+        """
+        Initialize the profiler.
+
+        Args:
+            report_path (str): Path of the JSON report.
+        """
+        self.report_path = report_path
+        self.start_time = time.perf_counter()
+        self.imports = []
+        self.milestones = {}
+        self._local = threading.local()
+        self._original_import = None
+
+    def start(self):
+        """
+        Start recording the imports.
+        """
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def stop(self):
+        """
+        Stop recording the imports.
+        """
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """
+        Replacement of __import__ timing the first import of each module.
+        """
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        # Time spent in the imports done by this one, to get its self time.
+        # Each thread has its own stack, as imports may run in the background.
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            self.imports.append(
+                {
+                    "module": name,
+                    "self_ms": round((cumulative - children) * 1000, 3),
+                    "cumulative_ms": round(cumulative * 1000, 3),
+                    "depth": len(stack),
+                    "thread": threading.current_thread().name,
+                }
+            )
+
+    def mark(self, milestone: str):
+        """
+        Record the time elapsed since the start of the profiler.
+
+        Args:
+            milestone (str): Name of the milestone, such as "first_paint".
+        """
+        self.milestones[milestone] = round(
+            (time.perf_counter() - self.start_time) * 1000, 3
+        )
+
+    def report(self) -> dict:
+        """
+        Build the report, imports sorted from the slowest.
+        """
+        top_level = [
+            entry
+            for entry in self.imports
+            if entry["depth"] == 0 and entry["thread"] == "MainThread"
+        ]
+        return {
+            "milestones_ms": self.milestones,
+            # Imports done by the main thread, before and after the first paint
+            "import_total_ms": round(
+                sum(entry["cumulative_ms"] for entry in top_level), 3
+            ),
+            "imports": sorted(
+                self.imports, key=lambda entry: entry["cumulative_ms"], reverse=True
+            ),
+        }
+
+    def write_report(self) -> str:
+        """
+        Write the report to its JSON file.
+
+        Returns:
+            The path of the report.
+        """
+        with open(self.report_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=1)
+        return self.report_path
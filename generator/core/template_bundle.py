@@ -0,0 +1,109 @@
+"""
+Module containing the precompiled template bundle.
+
+The bundle is a directory of Python modules compiled from the Jinja2 templates
+with Environment.compile_templates, plus their bytecode and an index of the
+digests of the sources they were compiled from. Loading a template from the
+bundle skips the lexing, parsing and code generation of Jinja2.
+
+date: 18/10/2026
+"""
+
+import compileall
+import hashlib
+import json
+import os
+import py_compile
+import shutil
+
+import jinja2
+
+from generator.core.logger import logger
+
+BUNDLE_INDEX = "index.json"
+BUNDLE_VERSION = 1
+
+
+def hash_source(source: str) -> str:
+    """
+    Get the SHA-256 digest of the source of a template.
+    """
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def is_template(name: str) -> bool:
+    """
+    Whether a file of the templates directory is a Jinja2 template.
+    """
+    return name.endswith(".j2")
+
+
+def build_template_bundle(env: jinja2.Environment, bundle_root: str) -> dict:
+    """
+    Precompile every template of an environment into a bundle.
+
+    The environment must be configured (options and filters) exactly as the
+    one that will load the bundle.
+
+    Args:
+        env (Environment): Environment whose loader lists the templates.
+        bundle_root (str): Directory of the bundle, replaced if it exists.
+
+    Returns:
+        The digests of the compiled templates, by template name.
+    """
+    names = env.list_templates(filter_func=is_template)
+    digests = {name: hash_source(env.loader.get_source(env, name)[0]) for name in names}
+
+    shutil.rmtree(bundle_root, ignore_errors=True)
+    env.compile_templates(
+        bundle_root,
+        filter_func=is_template,
+        zip=None,
+        ignore_errors=False,
+        log_function=logger.debug,
+    )
+    # The bytecode does not depend on the modification time of the modules,
+    # which is not preserved when the bundle is copied into a frozen build.
+    compileall.compile_dir(
+        bundle_root,
+        quiet=1,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+
+    index = {
+        "version": BUNDLE_VERSION,
+        "jinja2": jinja2.__version__,
+        "templates": digests,
+    }
+    with open(os.path.join(bundle_root, BUNDLE_INDEX), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    logger.info("%d templates precompiled into %s", len(digests), bundle_root)
+    return digests
+
+
+def load_bundle_index(bundle_root: str):
+    """
+    Load the index of a bundle.
+
+    Returns:
+        The digests of the compiled templates by template name, or None if
+        there is no usable bundle: missing, unreadable, or compiled by another
+        version of the bundle format or of Jinja2.
+    """
+    path = os.path.join(bundle_root, BUNDLE_INDEX)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable template bundle %s: %s", path, e)
+        return None
+    if (
+        index.get("version") != BUNDLE_VERSION
+        or index.get("jinja2") != jinja2.__version__
+    ):
+        logger.info("Ignoring template bundle %s built by another version", path)
+        return None
+    return index.get("templates", {})
@@ -0,0 +1,156 @@
+"""
+Module containing the validation of a project.
+
+The whole model is checked in one pass before any template is rendered, and
+every problem is reported at once: a project with a reserved word as a field
+name in its last entity fails before the first file is written, and all its
+mistakes can be fixed in one go.
+
+date: 18/10/2026
+"""
+
+import re
+
+from generator.core.model import Entity, Project
+
+# Keywords and literals of Java, which cannot name a field or a package
+JAVA_KEYWORDS = frozenset(
+    (
+        "_ abstract assert boolean break byte case catch char class const "
+        "continue default do double else enum extends false final finally float "
+        "for goto if implements import instanceof int interface long native new "
+        "null package private protected public return short static strictfp "
+        "super switch synchronized this throw throws transient true try void "
+        "volatile while"
+    ).split()
+)
+
+_IDENTIFIER = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*")
+_PACKAGE = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*(?:\.[A-Za-z_$][A-Za-z0-9_$]*)*")
+
+
+class ProjectValidationError(ValueError):
+    """
+    Raised when a project cannot be generated, with all its problems.
+    """
+
+    def __init__(self, problems: list[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+class ProjectValidator:
+    """
+    Class checking a project, one entity at a time.
+
+    The names of the entities already checked are remembered, so that the
+    entities of a project read as a stream are checked as they come.
+    """
+
+    def __init__(self):
+        # Entity names seen so far, in lower case as in the generated paths
+        self._entity_names = set()
+        # Entity names already reported as duplicates
+        self._duplicates = set()
+
+    def check_project(self, project: Project) -> list[str]:
+        """
+        Check the names and the package of a project, not its entities.
+
+        Returns:
+            The problems found, empty if there are none.
+        """
+        problems = []
+        missing = project.missing_keys()
+        if missing:
+            problems.append(f"Missing project keys: {', '.join(missing)}")
+        package = project.package
+        if package and (
+            not _PACKAGE.fullmatch(package)
+            or any(part in JAVA_KEYWORDS for part in package.split("."))
+        ):
+            problems.append(f"The package '{package}' is not a valid Java package")
+        return problems
+
+    def check_entity(self, entity: Entity) -> list[str]:
+        """
+        Check an entity and its fields.
+
+        Returns:
+            The problems found, empty if there are none.
+        """
+        name = entity.name
+        if not name:
+            return ["An entity has no name"]
+        problems = []
+        key = name.lower()
+        if key in self._entity_names:
+            if key not in self._duplicates:
+                self._duplicates.add(key)
+                problems.append(f"The entity '{name}' is defined more than once")
+        else:
+            self._entity_names.add(key)
+        if not _IDENTIFIER.fullmatch(name):
+            problems.append(f"The entity name '{name}' is not a valid Java name")
+        if not entity.fields:
+            problems.append(f"The entity '{name}' has no fields")
+            return problems
+
+        has_id = False
+        seen = set()
+        duplicates = set()
+        for field in entity.fields:
+            field_name = field.name
+            has_id = has_id or field.is_id
+            if not field_name:
+                problems.append(f"The entity '{name}' has a field with no name")
+                continue
+            if field_name in JAVA_KEYWORDS:
+                problems.append(
+                    f"The field '{name}.{field_name}' is a Java reserved word"
+                )
+            elif not _IDENTIFIER.fullmatch(field_name):
+                problems.append(
+                    f"The field '{name}.{field_name}' is not a valid Java name"
+                )
+            if field_name in seen and field_name not in duplicates:
+                duplicates.add(field_name)
+                problems.append(
+                    f"The field '{name}.{field_name}' is defined more than once"
+                )
+            seen.add(field_name)
+        if not has_id:
+            problems.append(f"The entity '{name}' has no id field")
+        return problems
+
+
+def validate_project(project: Project) -> list[str]:
+    """
+    Check a whole project before it is generated.
+
+    Returns:
+        Every problem found, in the order of the entities, empty if the
+        project can be generated.
+    """
+    validator = ProjectValidator()
+    problems = validator.check_project(project)
+    if not project.entities:
+        problems.append("The project has no entities")
+    for entity in project.entities:
+        problems.extend(validator.check_entity(entity))
+    return problems
+
+
+def format_problems(problems: list[str], limit: int = None) -> str:
+    """
+    Format problems as a list, one per line.
+
+    Args:
+        problems (list[str]): Problems, see validate_project.
+        limit (int): Number of problems shown, all by default.
+    """
+    shown = problems if limit is None else problems[:limit]
+    lines = [f"- {problem}" for problem in shown]
+    if len(problems) > len(shown):
+        lines.append(f"... and {len(problems) - len(shown)} more")
+    return "\n".join(lines)
@@ -0,0 +1,105 @@
+"""
+Module containing the view model of an entity.
+
+The view model is built once per entity, before its templates are rendered:
+the fields are normalized (the legacy "nom" and "isId" keys are read as
+"name" and "is_id") and every string the templates need is precomputed, so
+that rendering is pure substitution and every template sees the same fields.
+
+Each field of the view model holds:
+
+    name, type, comment, test_value, is_id, nullable
+                        the canonical keys
+    Name                name with its first letter in upper case
+    getter, setter      names of the accessors generated by Lombok
+    column              name of the column, in snake_case
+    nullable_literal    "true" or "false", as written in Java
+    import              class to import for the type, None for java.lang
+    column_definition   DDL of the column of the type, None if unknown
+
+The entity gets the "id_field" (the first field marked as id, else the first
+field) and the sorted "imports" of its fields.
+
+date: 18/10/2026
+"""
+
+from generator.core.java_types import type_registry
+from generator.core.naming import to_column_name
+
+# Key marking the template data whose view model is built
+VIEW_MODEL_KEY = "id_field"
+
+# Identifier used by the templates when an entity has no field
+DEFAULT_ID_FIELD = {"name": "id", "type": "Long"}
+
+
+def capitalize_name(name: str) -> str:
+    """
+    Upper case the first letter of a name, keeping the others as they are.
+    """
+    return name[:1].upper() + name[1:]
+
+
+def build_field_view(field: dict, registry=None) -> dict:
+    """
+    Build the view of a field.
+
+    Args:
+        field (dict): Field of the entity, with "name" or "nom".
+        registry (JavaTypeRegistry): Types, the shared registry by default.
+
+    Returns:
+        A new dict, the other keys of the field are kept.
+    """
+    registry = registry or type_registry
+    name = field.get("name") or field.get("nom") or ""
+    capitalized = capitalize_name(name)
+    nullable = bool(field.get("nullable", False))
+    view = dict(field)
+    view.update(
+        {
+            "name": name,
+            "type": field.get("type", ""),
+            "comment": field.get("comment") or "",
+            "test_value": field.get("test_value") or "",
+            "is_id": bool(field.get("is_id", field.get("isId", False))),
+            "nullable": nullable,
+            "Name": capitalized,
+            "getter": f"get{capitalized}",
+            "setter": f"set{capitalized}",
+            "column": to_column_name(name),
+            "nullable_literal": "true" if nullable else "false",
+            "import": registry.import_for(field.get("type", "")),
+            "column_definition": registry.column_definition_for(field.get("type", "")),
+        }
+    )
+    # The legacy keys of the fields, kept for the custom templates
+    view.pop("nom", None)
+    view.pop("isId", None)
+    return view
+
+
+def build_view_model(data: dict, registry=None) -> dict:
+    """
+    Build the view model of an entity from its template data.
+
+    Args:
+        data (dict): Template data of the entity, see build_generation_data.
+        registry (JavaTypeRegistry): Types, the shared registry by default.
+
+    Returns:
+        data itself if its view model is already built, a new dict otherwise.
+    """
+    if VIEW_MODEL_KEY in data:
+        return data
+    fields = [build_field_view(field, registry) for field in data["fields"]]
+    id_field = next((field for field in fields if field["is_id"]), None)
+    if id_field is None:
+        id_field = fields[0] if fields else build_field_view(DEFAULT_ID_FIELD)
+    imports = sorted({field["import"] for field in fields if field["import"]})
+    return {
+        **data,
+        "fields": fields,
+        "id_field": id_field,
+        "imports": imports,
+    }
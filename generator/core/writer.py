@@ -0,0 +1,203 @@
+"""
+Module containing the writer of the generated files.
+
+date: 18/10/2026
+"""
+
+import filecmp
+import os
+import threading
+
+from generator.core.logger import logger
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def encode_text(content: str) -> bytes:
+    """
+    Encode a rendered template as it is written on disk.
+
+    Newlines are translated as a file opened in text mode would do, so that
+    the output stays identical to a plain open(path, "w").
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
+
+class OutputWriter:
+    """
+    Class writing the generated files.
+
+    Directories are created once, files whose content did not change are not
+    touched, and changed files are written to a temporary file then moved in
+    place with os.replace, so that a reader never sees a half-written file.
+    """
+
+    def __init__(self, max_directories: int = None):
+        """
+        Initialize the writer.
+
+        Args:
+            max_directories (int): Number of created directories to remember,
+                unlimited by default. The streaming pipeline bounds it so that
+                its memory does not grow with the size of the model.
+        """
+        self.files_written = 0
+        self.files_skipped = 0
+        self.bytes_written = 0
+        self.max_directories = max_directories
+        self._directories = {}
+
+    def plan(self, output_paths):
+        """
+        Create the directories of every output file up front.
+
+        Args:
+            output_paths (iterable[str]): Paths of the files to write.
+        """
+        directories = {os.path.dirname(path) for path in output_paths}
+        for directory in sorted(directories - self._directories.keys()):
+            self._make_directory(directory)
+
+    def _make_directory(self, directory: str):
+        """
+        Create a directory if it was not created by this writer yet.
+        """
+        if directory and directory not in self._directories:
+            os.makedirs(directory, exist_ok=True)
+            logger.debug("Directory created if necessary: %s", directory)
+        self._directories[directory] = None
+        if (
+            self.max_directories is not None
+            and len(self._directories) > self.max_directories
+        ):
+            # Forget the oldest directory
+            del self._directories[next(iter(self._directories))]
+
+    def write(self, output_path: str, content: str) -> bool:
+        """
+        Write a file if its content changed.
+
+        Args:
+            output_path (str): Path of the file.
+            content (str): Rendered content.
+
+        Returns:
+            True if the file was written, False if it was already up to date.
+        """
+        data = encode_text(content)
+        if self._is_unchanged(output_path, data):
+            self.files_skipped += 1
+            logger.debug("File unchanged, not written: %s", output_path)
+            return False
+
+        self._write_atomic(output_path, (data,))
+        self.files_written += 1
+        self.bytes_written += len(data)
+        logger.debug("File written: %s", output_path)
+        return True
+
+    def write_stream(self, output_path: str, chunks) -> bool:
+        """
+        Write a file from an iterable of text chunks, in bounded memory.
+
+        The chunks are streamed to a temporary file. If the result is identical
+        to the existing file, the temporary file is dropped and the existing
+        file is left untouched.
+
+        Returns:
+            True if the file was written, False if it was already up to date.
+        """
+        tmp_path, size = self._write_temporary(
+            output_path, (encode_text(chunk) for chunk in chunks)
+        )
+        try:
+            if os.path.exists(output_path) and filecmp.cmp(
+                tmp_path, output_path, shallow=False
+            ):
+                os.remove(tmp_path)
+                self.files_skipped += 1
+                logger.debug("File unchanged, not written: %s", output_path)
+                return False
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            self._remove_quietly(tmp_path)
+            raise
+
+        self.files_written += 1
+        self.bytes_written += size
+        logger.debug("File written: %s", output_path)
+        return True
+
+    def _write_atomic(self, output_path: str, blocks):
+        """
+        Write blocks of bytes to a temporary file, then move it in place.
+        """
+        tmp_path, _ = self._write_temporary(output_path, blocks)
+        try:
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            self._remove_quietly(tmp_path)
+            raise
+
+    def _write_temporary(self, output_path: str, blocks):
+        """
+        Write blocks of bytes to a temporary file next to output_path.
+
+        Returns:
+            The path of the temporary file and the number of bytes written.
+        """
+        directory = os.path.dirname(output_path)
+        if directory not in self._directories:
+            self._make_directory(directory)
+        tmp_path = os.path.join(
+            directory,
+            f".{os.path.basename(output_path)}.{os.getpid()}."
+            f"{threading.get_ident()}.tmp",
+        )
+        # Unlike tempfile.mkstemp, os.open applies the umask to the mode
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for block in blocks:
+                    f.write(block)
+                    size += len(block)
+        except BaseException:
+            self._remove_quietly(tmp_path)
+            raise
+        return tmp_path, size
+
+    @staticmethod
+    def _remove_quietly(path: str):
+        """
+        Remove a temporary file, ignoring errors.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _is_unchanged(output_path: str, data: bytes) -> bool:
+        """
+        Whether the file already holds exactly these bytes.
+        """
+        try:
+            if os.path.getsize(output_path) != len(data):
+                return False
+            with open(output_path, "rb") as f:
+                return f.read() == data
+        except OSError:
+            return False
+
+    def stats(self) -> dict:
+        """
+        Get the statistics of the written files.
+        """
+        return {
+            "files_written": self.files_written,
+            "files_skipped": self.files_skipped,
+            "bytes_written": self.bytes_written,
+        }
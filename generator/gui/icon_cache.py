@@ -0,0 +1,247 @@
+"""
+Module containing the cache of the pre-scaled icons.
+
+The icons are resized once per theme and display scale with PIL, then saved
+as PNG files that Tk reads by itself: PIL is not needed to start the GUI. The
+cache is built with the executable (see setup.py) or on first use, and an icon
+is resized again when the modification time of its source changes.
+
+date: 18/10/2026
+"""
+
+import json
+import os
+import tkinter as tk
+
+from generator.core.logger import logger
+from generator.core.resources import resource_path
+
+ASSETS_DIR = resource_path("assets")
+CACHE_DIR = resource_path("assets", "cache")
+CACHE_INDEX = "index.json"
+CACHE_VERSION = 1
+
+# Display scales prepared when building the cache, others are built on use
+DEFAULT_SCALES = (1.0, 1.25, 1.5, 2.0)
+
+# Icons of the GUI: source by theme, relative to the assets directory, and
+# size in pixels at scale 1. A height of None keeps the ratio of the source.
+ICONS = {
+    "delete": {
+        "sources": {
+            "light": "icons/delete_light_mode.png",
+            "dark": "icons/delete.png",
+        },
+        "size": (18, 18),
+    },
+    "intro_add_entity": {
+        "sources": {
+            "light": "images/intro/add_entity.png",
+            "dark": "images/intro/add_entity.png",
+        },
+        "size": (400, None),
+    },
+}
+
+
+def scale_percent(scale: float) -> int:
+    """
+    Round a display scale to a step of 25%, the variants kept in the cache.
+    """
+    return max(50, int(round(scale * 4) * 25))
+
+
+def get_display_scale(widget) -> float:
+    """
+    Get the scale of the display of a widget, 1.0 at 96 DPI.
+    """
+    return widget.winfo_fpixels("1i") / 96
+
+
+def target_size(size: tuple, percent: int, source_size: tuple) -> tuple:
+    """
+    Get the size of an icon at a given scale.
+
+    Args:
+        size (tuple): Width and height at scale 1, the height may be None.
+        percent (int): Scale, in percent.
+        source_size (tuple): Width and height of the source image.
+
+    Returns:
+        The width and height in pixels.
+    """
+    width = max(1, round(size[0] * percent / 100))
+    if size[1] is None:
+        height = round(source_size[1] * width / source_size[0])
+    else:
+        height = round(size[1] * percent / 100)
+    return width, max(1, height)
+
+
+class IconCache:
+    """
+    Class giving the icons of the GUI as PhotoImages, read from the cache.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, assets_dir: str = ASSETS_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory of the resized icons.
+            assets_dir (str): Directory of the source images.
+        """
+        self.cache_dir = cache_dir
+        self.assets_dir = assets_dir
+        self.icons = ICONS
+        # PhotoImages already loaded, by (name, theme, percent)
+        self.images = {}
+        self._index = None
+
+    @property
+    def index(self) -> dict:
+        """
+        Modification times of the sources of the cached files, by file name.
+        """
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, CACHE_INDEX), "rb") as f:
+                    data = json.load(f)
+                self._index = data["files"] if data["version"] == CACHE_VERSION else {}
+            except (OSError, ValueError, KeyError):
+                self._index = {}
+        return self._index
+
+    def source_path(self, name: str, theme: str) -> str:
+        """
+        Get the path of the source image of an icon.
+        """
+        return os.path.join(self.assets_dir, self.icons[name]["sources"][theme])
+
+    def cached_path(self, name: str, theme: str, percent: int) -> str:
+        """
+        Get the path of an icon in the cache, built or not.
+        """
+        return os.path.join(self.cache_dir, f"{name}-{theme}@{percent}.png")
+
+    def is_fresh(self, name: str, theme: str, percent: int) -> bool:
+        """
+        Whether an icon is in the cache and its source did not change.
+        """
+        path = self.cached_path(name, theme, percent)
+        mtime = self.index.get(os.path.basename(path))
+        try:
+            source_mtime = os.stat(self.source_path(name, theme)).st_mtime_ns
+        except OSError:
+            return False
+        return mtime == source_mtime and os.path.exists(path)
+
+    def build(self, name: str, theme: str, percent: int) -> str:
+        """
+        Resize an icon with PIL and save it in the cache.
+
+        Returns:
+            The path of the resized icon.
+
+        Raises:
+            ImportError: If PIL is not installed.
+        """
+        from PIL import Image
+
+        source = self.source_path(name, theme)
+        path = self.cached_path(name, theme, percent)
+        source_mtime = os.stat(source).st_mtime_ns
+        with Image.open(source) as image:
+            size = target_size(self.icons[name]["size"], percent, image.size)
+            resized = image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        resized.save(path, format="PNG", optimize=True)
+        self.index[os.path.basename(path)] = source_mtime
+        self._save_index()
+        return path
+
+    def build_all(self, scales=DEFAULT_SCALES) -> list[str]:
+        """
+        Build every stale icon of every theme at the given scales.
+
+        Returns:
+            The paths of the icons resized.
+        """
+        built = []
+        for name, spec in self.icons.items():
+            for theme in spec["sources"]:
+                for percent in sorted({scale_percent(scale) for scale in scales}):
+                    if not self.is_fresh(name, theme, percent):
+                        built.append(self.build(name, theme, percent))
+        return built
+
+    def get(self, name: str, master=None, theme: str = None, scale: float = None):
+        """
+        Get an icon, resized for the theme and the display.
+
+        Args:
+            name (str): Name of the icon, a key of ICONS.
+            master (tk.Misc): Widget of the Tk application, the default root
+                if None.
+            theme (str): Theme, the current one if None.
+            scale (float): Display scale, the one of master if None.
+
+        Returns:
+            A tk.PhotoImage, to keep referenced while it is shown.
+        """
+        if theme is None:
+            from generator.gui.theme_manager import theme_manager
+
+            theme = theme_manager.current_theme
+        if scale is None:
+            scale = get_display_scale(master) if master is not None else 1.0
+        percent = scale_percent(scale)
+        key = (name, theme, percent)
+        if key not in self.images:
+            self.images[key] = self._load(name, theme, percent, master)
+        return self.images[key]
+
+    def _load(self, name: str, theme: str, percent: int, master):
+        """
+        Load an icon from the cache, building it first if it is stale.
+        """
+        if not self.is_fresh(name, theme, percent):
+            try:
+                self.build(name, theme, percent)
+            except (ImportError, OSError) as e:
+                # Without PIL, or a read-only cache, Tk shrinks the source by
+                # an integer factor instead
+                logger.warning("Icon %s could not be cached: %s", name, e)
+                return self._load_source(name, theme, percent, master)
+        return tk.PhotoImage(master=master, file=self.cached_path(name, theme, percent))
+
+    def _load_source(self, name: str, theme: str, percent: int, master):
+        """
+        Load the source of an icon with Tk only, roughly resized.
+        """
+        image = tk.PhotoImage(master=master, file=self.source_path(name, theme))
+        width, _ = target_size(
+            self.icons[name]["size"], percent, (image.width(), image.height())
+        )
+        factor = round(image.width() / width)
+        return image.subsample(factor) if factor > 1 else image
+
+    def _save_index(self):
+        """
+        Write the index of the cache, replacing the previous one at once.
+        """
+        path = os.path.join(self.cache_dir, CACHE_INDEX)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "files": self.index}, f, indent=1)
+        os.replace(path + ".tmp", path)
+
+
+# Singleton instance
+icon_cache = IconCache()
+
+
+def get_icon(name: str, master=None, theme: str = None, scale: float = None):
+    """
+    Get an icon of the GUI from the cache, see IconCache.get.
+    """
+    return icon_cache.get(name, master, theme, scale)
@@ -1,18 +1,11 @@
-import os
 import tkinter as tk
 from tkinter import ttk
 
-from PIL import Image, ImageTk
-
+from generator.core.logger import logger
+from generator.gui.icon_cache import get_icon
 from generator.gui.style import FONT_FAMILY
 from generator.gui.theme_manager import theme_manager
 
-# Chemin absolu vers l'image d'illustration
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-ASSETS_PATH = os.path.join(
-    CURRENT_DIR, "..", "assets", "images", "intro", "add_entity.png"
-)
-
 
 def show_intro_popup(parent):
     """
@@ -32,7 +25,7 @@ def show_intro_popup(parent):
                 "Use the + button to add an entity, and define its fields "
                 "(name, type, test value...)."
             ),
-            "image": ASSETS_PATH,
+            "image": "intro_add_entity",
         },
         {
             "title": "Step 2 : Automatic generation",
@@ -55,23 +48,12 @@ def show_intro_popup(parent):
 
         if "image" in data:
             try:
-                pil_image = Image.open(data["image"])
-
-                # Redimensionner proportionnellement (max 400px de large)
-                max_width = 400
-                width, height = pil_image.size
-                if width > max_width:
-                    ratio = max_width / width
-                    pil_image = pil_image.resize(
-                        (int(width * ratio), int(height * ratio)),
-                        resample=Image.Resampling.LANCZOS,
-                    )
-
-                image = ImageTk.PhotoImage(pil_image)
+                # Resized to 400px wide in the cache of the icons
+                image = get_icon(data["image"], popup)
                 image_label.configure(image=image)
                 image_label.image = image
             except Exception as e:
-                print(f"Erreur lors du chargement de l'image: {e}")
+                logger.warning("Intro image could not be loaded: %s", e)
                 image_label.configure(image="")
         else:
             image_label.configure(image="")
@@ -15,46 +15,21 @@ from generator.gui.theme_manager import theme_manager
 # === EntityBox Class ===
 
 
-class EntityBox(tk.Frame):
+class EntityBox(ttk.Frame):
     """
     Class representing an entity box in the table.
+
+    The box only uses ttk widgets: its colors come from the styles, switched
+    once by notify_theme_change(), so it does not subscribe to the theme.
     """
 
     def __init__(self, parent, entity_name, on_click, on_delete=None):
-        super().__init__(
-            parent,
-            bg=theme_manager.get("BG_BOX"),
-            highlightbackground=theme_manager.get("BORDER_COLOR"),
-            highlightthickness=1,
-            padx=16,
-            pady=12,
-        )
+        super().__init__(parent, style="Card.TFrame", padding=(16, 12))
         self.pack_propagate(False)
         self.entity_name = entity_name
         self.on_click = on_click
         self.on_delete = on_delete
         self._build_ui()
-        theme_manager.subscribe(self.apply_theme)
-
-    def apply_theme(self):
-        """
-        Apply the theme to the entity box.
-        """
-        self.configure(
-            bg=theme_manager.get("BG_BOX"),
-            highlightbackground=theme_manager.get("BORDER_COLOR"),
-        )
-        for widget in self.winfo_children():
-            if isinstance(widget, tk.Label):
-                widget.configure(
-                    bg=theme_manager.get("BG_BOX"), fg=theme_manager.get("TEXT_COLOR")
-                )
-            elif isinstance(widget, ttk.Button):
-                # Préserver le style Red.TButton pour le bouton Delete
-                if widget.cget("text") == "Delete":
-                    widget.configure(style="Red.TButton")
-                else:
-                    widget.configure(style="TButton")
 
     def _build_ui(self):
         """
@@ -62,12 +37,10 @@ class EntityBox(tk.Frame):
         """
         self.columnconfigure(0, weight=1)
 
-        self.label = tk.Label(
+        self.label = ttk.Label(
             self,
             text=self.entity_name,
-            font=(FONT_FAMILY, FONT_SIZE_LABEL, "bold"),
-            bg=theme_manager.get("BG_BOX"),
-            fg=theme_manager.get("TEXT_COLOR"),
+            style="BoxTitle.TLabel",
         )
         self.label.grid(row=0, column=0, sticky="w")
 
@@ -173,7 +146,7 @@ class EntityBoard(tk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-        self.entity_container = tk.Frame(self.canvas, bg=theme_manager.get("BG_BOX"))
+        self.entity_container = ttk.Frame(self.canvas, style="Box.TFrame")
         self.container_window = self.canvas.create_window(
             (0, 0),
             window=self.entity_container,
@@ -213,7 +186,6 @@ class EntityBoard(tk.Frame):
             bg=theme_manager.get("BG_BOX"), fg=theme_manager.get("TEXT_COLOR")
         )
         self.canvas.configure(bg=theme_manager.get("BG_BOX"))
-        self.entity_container.configure(bg=theme_manager.get("BG_BOX"))
 
     def add_entity(self, entity_name):
         """
@@ -241,6 +213,15 @@ class EntityBoard(tk.Frame):
             self.entity_container.update_idletasks()
             self.update_idletasks()
 
+    def clear(self):
+        """
+        Delete every entity from the entity board.
+        """
+        for entity_box in self.entities.values():
+            entity_box.destroy()
+        self.entities.clear()
+        self.update_idletasks()
+
     def update_entity_name(self, old_name, new_name):
         """
         Update the name of an entity.
@@ -4,29 +4,38 @@ Module containing the EntityEditorWindow class.
 date: 05/06/2025
 """
 
-import json
-import os
 import tkinter as tk
 from tkinter import ttk
 
 from generator.core.fake_utils import get_fake_value
 from generator.core.logger import logger
+from generator.gui.layout.field_list import VirtualFieldList
 from generator.gui.style import FONT_FAMILY, FONT_SIZE_LABEL, PADDING
 from generator.gui.theme_manager import theme_manager
-from generator.gui.utils.theme_utils import apply_theme_recursive
-from generator.gui.widgets import add_field, create_scrollable_fields_frame
 
 
 class EntityEditorWindow(tk.Toplevel):
     """
     Class representing the entity editor window.
+
+    The window is built from ttk widgets, recolored by the styles when the
+    theme changes, and does not subscribe to the theme itself.
     """
 
-    def __init__(self, master, entity_name, on_name_change, dev_mode=False):
+    def __init__(self, master, store, entity_name, on_name_change, dev_mode=False):
         """
         Initialize the entity editor window.
+
+        Args:
+            master (tk.Widget): Main window.
+            store (ProjectStore): Project holding the fields of the entity.
+            entity_name (str): Name of the edited entity.
+            on_name_change (callable): Called with (old_name, new_name) when
+                the entity is renamed.
+            dev_mode (bool): Whether to show the development tools.
         """
         super().__init__(master)
+        self.store = store
         self.title(f"Entity Editor - {entity_name}")
         self.geometry("1000x600")
         self.entity_name = entity_name
@@ -34,48 +43,24 @@ class EntityEditorWindow(tk.Toplevel):
         self.dev_mode = dev_mode
         self.fields = []
         self._name_changed = False
-        self._theme_callback = self.apply_theme
+        self.configure(bg=theme_manager.get("BG_BOX"))
         self._build_ui()
         self._load_data()
-        self.apply_theme()
-        theme_manager.subscribe(self._theme_callback)
 
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
-    def apply_theme(self):
-        """
-        Apply the theme to the entity editor.
-        """
-        if not self.winfo_exists():
-            logger.warning("apply_theme() called on destroyed window")
-            return
-        logger.info("apply_theme() called on %s", self.entity_name)
-        self.configure(bg=theme_manager.get("BG"))
-        apply_theme_recursive(self)
-
     def _build_ui(self):
         """
         Build the UI of the entity editor.
         """
-        main_container = tk.Frame(
-            self,
-            bg=theme_manager.get("BG_BOX"),
-            padx=PADDING,
-            pady=PADDING,
-        )
+        main_container = ttk.Frame(self, style="Box.TFrame", padding=PADDING)
         main_container.pack(fill="both", expand=True)
 
         # === Top row : entity name
-        top_row = tk.Frame(main_container, bg=theme_manager.get("BG_BOX"))
+        top_row = ttk.Frame(main_container, style="Box.TFrame")
         top_row.pack(fill="x", pady=(0, PADDING))
 
-        name_label = tk.Label(
-            top_row,
-            text="Entity Name :",
-            font=(FONT_FAMILY, FONT_SIZE_LABEL, "bold"),
-            fg=theme_manager.get("TEXT_COLOR"),
-            bg=theme_manager.get("BG_BOX"),
-        )
+        name_label = ttk.Label(top_row, text="Entity Name :", style="BoxTitle.TLabel")
         name_label.pack(side="left", padx=(0, 8))
 
         self.name_entry = ttk.Entry(
@@ -88,25 +73,22 @@ class EntityEditorWindow(tk.Toplevel):
         self.name_entry.pack(side="left", fill="x", expand=True)
 
         # === Fields section
-        fields_section = tk.LabelFrame(
+        fields_section = ttk.Labelframe(
             main_container,
             text="Fields",
-            padx=PADDING,
-            pady=PADDING,
-            font=(FONT_FAMILY, FONT_SIZE_LABEL, "bold"),
-            bg=theme_manager.get("BG_BOX"),
-            fg=theme_manager.get("TEXT_COLOR"),
+            padding=PADDING,
+            style="Box.TLabelframe",
         )
         fields_section.pack(fill="both", expand=True, pady=(0, PADDING))
 
-        self.fields_frame = create_scrollable_fields_frame(
-            fields_section,
-            bg_color=theme_manager.get("BG_BOX"),
-            entity_name=self.entity_name,
+        # Only the visible rows have widgets, see VirtualFieldList
+        self.field_list = VirtualFieldList(
+            fields_section, bg_color=theme_manager.get("BG_BOX")
         )
+        self.field_list.pack(fill="both", expand=True)
 
         # === Footer with buttons
-        buttons_frame = tk.Frame(main_container, bg=theme_manager.get("BG_BOX"))
+        buttons_frame = ttk.Frame(main_container, style="Box.TFrame")
         buttons_frame.pack(fill="x", pady=(PADDING, 0))
 
         def add_auto_field():
@@ -119,7 +101,7 @@ class EntityEditorWindow(tk.Toplevel):
                 "is_id": False,
                 "nullable": True,
             }
-            add_field(self.fields_frame, field_data)
+            self.field_list.add(field_data)
 
         ttk.Button(
             buttons_frame,
@@ -156,63 +138,29 @@ class EntityEditorWindow(tk.Toplevel):
 
     def _load_data(self):
         """
-        Load the data from the JSON file.
+        Load the fields of the entity from the store.
         """
-        json_path = f"temp/{self.entity_name}.json"
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for field_data in data:
-                        add_field(self.fields_frame, field_data)
-            except Exception as e:
-                logger.error("Error loading JSON %s: %s", self.entity_name, e)
+        try:
+            self.field_list.set_fields(self.store.get_fields(self.entity_name))
+        except KeyError:
+            logger.error("Entity %s not found in the project", self.entity_name)
 
     def _save_data(self):
         """
-        Save the data to the JSON file.
+        Save the fields of the entity to the store.
         """
         try:
             new_name = self.name_entry.get().strip()
             name_changed = new_name and new_name != self.entity_name
             old_name = self.entity_name
-            if name_changed:
-                self.entity_name = new_name
-
-            fields_data = []
-            for field_widget in self.fields_frame.winfo_children():
-                if isinstance(field_widget, tk.Frame):
-                    field_data = {
-                        "name": field_widget.name_entry.get(),
-                        "type": field_widget.type_combobox.get(),
-                        "comment": field_widget.comment_entry.get(),
-                        "test_value": field_widget.test_entry.get(),
-                        "is_id": field_widget.is_id_var.get(),
-                        "nullable": field_widget.nullable_var.get(),
-                    }
-                    fields_data.append(field_data)
-
-            # Save in the new file first
-            new_json_path = f"temp/{self.entity_name}.json"
-            with open(new_json_path, "w", encoding="utf-8") as f:
-                json.dump(fields_data, f, indent=2)
-
-            # If the name has changed, delete the old file
-            if name_changed:
-                old_json_path = f"temp/{old_name}.json"
-                if os.path.exists(old_json_path):
-                    try:
-                        os.remove(old_json_path)
-                    except OSError as e:
-                        logger.warning(
-                            "Could not delete old file %s: %s",
-                            old_json_path,
-                            e,
-                        )
 
             if name_changed and not self._name_changed:
-                self._name_changed = True
                 self.on_name_change(old_name, new_name)
+                self._name_changed = True
+            if name_changed:
+                self.entity_name = new_name
+
+            self.store.set_fields(self.entity_name, self.field_list.get_fields())
 
             logger.info("Data saved for %s", self.entity_name)
             self.destroy()
@@ -225,7 +173,6 @@ class EntityEditorWindow(tk.Toplevel):
         Handle the closing event of the entity editor.
         """
         try:
-            theme_manager.unsubscribe(self._theme_callback)
             if not hasattr(self, "_is_being_deleted"):
                 self._save_data()
         except Exception as e:
@@ -237,8 +184,7 @@ class EntityEditorWindow(tk.Toplevel):
         """
         Clear the fields of the entity editor.
         """
-        for widget in self.fields_frame.winfo_children():
-            widget.destroy()
+        self.field_list.clear()
 
     def _generate_fake_data(self):
         """
@@ -320,8 +266,7 @@ class EntityEditorWindow(tk.Toplevel):
                     "nullable": True,
                 },
             ]
-            for field_data in fake_fields:
-                add_field(self.fields_frame, field_data)
+            self.field_list.set_fields(fake_fields)
 
         def on_no():
             dialog.destroy()
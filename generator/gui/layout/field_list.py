@@ -0,0 +1,389 @@
+"""
+Module containing the VirtualFieldList class.
+
+The fields of an entity are kept in a list of dicts and only the rows visible
+in the canvas have widgets: when scrolling, the same rows are moved and bound
+to other fields instead of creating about ten widgets per field. An entity
+with hundreds of fields opens and scrolls as fast as one with five.
+
+date: 18/10/2026
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from generator.core.fake_utils import get_fake_value
+from generator.core.java_types import type_registry
+from generator.gui import widgets
+from generator.gui.theme_manager import theme_manager
+
+# Height of a row in pixels, the same for every row
+ROW_HEIGHT = 48
+
+# Text entries of a row: key of the field and placeholder
+TEXT_COLUMNS = [
+    ("name", "Name of the field"),
+    ("comment", "Comment"),
+    ("test_value", "Test value"),
+]
+
+
+def new_field(field_data: dict = None) -> dict:
+    """
+    Build a field with every key the editor reads.
+
+    Args:
+        field_data (dict): Values of the field, the missing keys get a default.
+
+    Returns:
+        A new dict, the given one is not modified.
+    """
+    field = {
+        "name": "",
+        "type": type_registry.names()[0],
+        "comment": "",
+        "test_value": "",
+        "is_id": False,
+        "nullable": False,
+    }
+    field.update(field_data or {})
+    return field
+
+
+def visible_range(offset: int, height: int, row_height: int, count: int) -> range:
+    """
+    Get the indexes of the rows shown in a viewport.
+
+    Args:
+        offset (int): Position of the top of the viewport, in pixels.
+        height (int): Height of the viewport, in pixels.
+        row_height (int): Height of a row, in pixels.
+        count (int): Number of rows.
+
+    Returns:
+        The range of the indexes of the rows, even partially, visible.
+    """
+    offset = max(offset, 0)
+    first = min(offset // row_height, count)
+    last = min((offset + max(height, 0) - 1) // row_height + 1, count)
+    return range(first, max(first, last))
+
+
+class FieldRow(ttk.Frame):
+    """
+    Class representing a row of the field list, bound in turn to the fields
+    scrolled into view.
+    """
+
+    def __init__(self, parent, on_delete):
+        """
+        Initialize the row.
+
+        Args:
+            parent (tk.Canvas): Canvas of the field list.
+            on_delete (callable): Called with the index of the field to delete.
+        """
+        super().__init__(parent, style="Box.TFrame", padding=(0, 4))
+        self.on_delete = on_delete
+        self.index = None
+        self.field = None
+        # Set while the widgets are filled from the field, to not write back
+        self._loading = False
+        self._build_ui()
+
+    def _build_ui(self):
+        """
+        Build the widgets of the row, once.
+        """
+        self.number_label = ttk.Label(self, style="Box.TLabel", width=4)
+        self.number_label.grid(row=0, column=0, padx=(0, 8), sticky="w")
+
+        self.vars = {}
+        self.entries = {}
+        self.placeholders = {}
+        for key, placeholder in TEXT_COLUMNS:
+            var = tk.StringVar()
+            entry = ttk.Entry(self, textvariable=var, style="CleanDark.TEntry")
+            entry.bind("<FocusIn>", lambda e, key=key: self._hide_placeholder(key))
+            entry.bind("<FocusOut>", lambda e, key=key: self._show_placeholder(key))
+            var.trace_add("write", lambda *args, key=key: self._on_text_change(key))
+            self.vars[key] = var
+            self.entries[key] = entry
+            self.placeholders[key] = placeholder
+
+        self.type_var = tk.StringVar()
+        self.type_combobox = ttk.Combobox(
+            self,
+            values=type_registry.labels(),
+            textvariable=self.type_var,
+            state="readonly",
+            style="Custom.TCombobox",
+            width=15,
+        )
+        self.type_combobox.bind("<<ComboboxSelected>>", self._on_type_selected)
+
+        self.is_id_var = tk.BooleanVar()
+        self.nullable_var = tk.BooleanVar()
+        for key, var in (("is_id", self.is_id_var), ("nullable", self.nullable_var)):
+            var.trace_add("write", lambda *args, key=key, var=var: self._set(key, var))
+        id_check = ttk.Checkbutton(
+            self, text="id", variable=self.is_id_var, style="Custom.TCheckbutton"
+        )
+        nullable_check = ttk.Checkbutton(
+            self,
+            text="Nullable",
+            variable=self.nullable_var,
+            style="Custom.TCheckbutton",
+        )
+
+        if widgets.DELETE_ICON is None:
+            widgets.load_icons(self)
+        self.delete_btn = ttk.Button(
+            self,
+            image=widgets.DELETE_ICON,
+            command=lambda: self.on_delete(self.index),
+            style="Red.TButton",
+            width=1,
+        )
+
+        self.entries["name"].grid(row=0, column=1, padx=(0, 8), sticky="ew")
+        self.type_combobox.grid(row=0, column=2, padx=(0, 8), sticky="ew")
+        self.entries["comment"].grid(row=0, column=3, padx=(0, 8), sticky="ew")
+        self.entries["test_value"].grid(row=0, column=4, padx=(0, 8), sticky="ew")
+        id_check.grid(row=0, column=5, padx=(0, 8), sticky="w")
+        nullable_check.grid(row=0, column=6, padx=(0, 8), sticky="w")
+        self.delete_btn.grid(row=0, column=7, padx=(0, 0), sticky="e")
+
+        self.grid_columnconfigure(1, weight=2)
+        self.grid_columnconfigure(2, weight=2)
+        self.grid_columnconfigure(3, weight=3)
+        self.grid_columnconfigure(4, weight=2)
+
+    def bind_field(self, index: int, field: dict):
+        """
+        Show a field in the row.
+
+        Args:
+            index (int): Position of the field in the list.
+            field (dict): Field, updated in place by the edits.
+        """
+        # The focused entry would keep the text of the previous field
+        try:
+            focused = self.focus_get()
+        except KeyError:
+            # Raised by Tk when the focus is in the list of a Combobox
+            focused = None
+        if focused in self.entries.values():
+            self.master.focus_set()
+        self.index = index
+        self.field = field
+        self._loading = True
+        try:
+            self.number_label.configure(text=f"#{index + 1}")
+            for key in self.vars:
+                self._show_placeholder(key)
+            self.type_var.set(type_registry.label_for(field["type"]))
+            self.is_id_var.set(bool(field["is_id"]))
+            self.nullable_var.set(bool(field["nullable"]))
+        finally:
+            self._loading = False
+
+    def _show_placeholder(self, key: str):
+        """
+        Show the value of the field, or the placeholder if it is empty.
+        """
+        value = self.field[key] if self.field else ""
+        entry = self.entries[key]
+        loading, self._loading = self._loading, True
+        try:
+            if value:
+                self.vars[key].set(value)
+                entry.configure(foreground=theme_manager.get("TEXT_COLOR"))
+            else:
+                self.vars[key].set(self.placeholders[key])
+                entry.configure(foreground="gray")
+            entry._has_placeholder = not value
+        finally:
+            self._loading = loading
+
+    def _hide_placeholder(self, key: str):
+        """
+        Clear the placeholder when the entry gets the focus.
+        """
+        entry = self.entries[key]
+        if getattr(entry, "_has_placeholder", False):
+            entry._has_placeholder = False
+            self.vars[key].set("")
+            entry.configure(foreground=theme_manager.get("TEXT_COLOR"))
+
+    def _on_text_change(self, key: str):
+        """
+        Write the text typed in an entry to the field.
+        """
+        if not getattr(self.entries[key], "_has_placeholder", False):
+            self._set(key, self.vars[key])
+
+    def _on_type_selected(self, event=None):
+        """
+        Change the type of the field and generate a matching test value.
+        """
+        if self.field is not None:
+            field_type = type_registry.name_for(self.type_var.get())
+            self.field["type"] = field_type
+            self.field["test_value"] = get_fake_value(field_type)
+            self._show_placeholder("test_value")
+        self.type_combobox.icursor(tk.END)
+        self.type_combobox.selection_clear()
+
+    def _set(self, key: str, var):
+        """
+        Write the value of a variable to the field.
+        """
+        if not self._loading and self.field is not None:
+            self.field[key] = var.get()
+
+
+class VirtualFieldList(ttk.Frame):
+    """
+    Class representing the scrollable list of the fields of an entity.
+
+    The rows take their colors from the ttk styles, only the canvas and the
+    text colors of the visible entries follow the theme in apply_theme().
+    """
+
+    def __init__(self, parent, bg_color, fields=None):
+        """
+        Initialize the field list.
+
+        Args:
+            parent (tk.Widget): Parent widget.
+            bg_color (str): Background color.
+            fields (list[dict]): Initial fields.
+        """
+        super().__init__(parent, style="Box.TFrame")
+        self.fields = [new_field(field) for field in fields or []]
+        self.rows = []
+        self.windows = []
+
+        self.canvas = tk.Canvas(
+            self, bg=bg_color, highlightthickness=0, yscrollincrement=ROW_HEIGHT
+        )
+        self.scrollbar = ttk.Scrollbar(
+            self, orient="vertical", command=self.canvas.yview
+        )
+        # Every scroll, from the bar, the wheel or the code, rebinds the rows
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Destroy>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+        self._update_scrollregion()
+        theme_manager.subscribe(self.apply_theme)
+
+    def apply_theme(self):
+        """
+        Apply the theme to the canvas and to the visible rows.
+        """
+        self.canvas.configure(bg=theme_manager.get("BG_BOX"))
+        widgets.load_icons(self)
+        for row in self.rows:
+            row.delete_btn.configure(image=widgets.DELETE_ICON)
+            row.index = None
+        self.refresh()
+
+    def get_fields(self) -> list[dict]:
+        """
+        Get a copy of the fields, in order.
+        """
+        return [dict(field) for field in self.fields]
+
+    def set_fields(self, fields: list[dict]):
+        """
+        Replace the fields.
+        """
+        self.fields = [new_field(field) for field in fields]
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def add(self, field_data: dict = None):
+        """
+        Add a field at the end of the list and scroll to it.
+        """
+        self.fields.append(new_field(field_data))
+        self._update_scrollregion()
+        self.canvas.yview_moveto(1.0)
+        self.refresh()
+
+    def delete(self, index: int):
+        """
+        Delete the field at the given position.
+        """
+        if index is not None and 0 <= index < len(self.fields):
+            del self.fields[index]
+            self._update_scrollregion()
+            self.refresh()
+
+    def clear(self):
+        """
+        Delete every field.
+        """
+        self.set_fields([])
+
+    def refresh(self):
+        """
+        Bind the rows to the fields visible in the canvas.
+        """
+        visible = visible_range(
+            int(self.canvas.canvasy(0)),
+            self.canvas.winfo_height(),
+            ROW_HEIGHT,
+            len(self.fields),
+        )
+        for offset, (row, window) in enumerate(zip(self.rows, self.windows)):
+            index = visible.start + offset
+            if index not in visible:
+                self.canvas.itemconfigure(window, state="hidden")
+                continue
+            # A deletion shifts the fields: rebind even if the index is the same
+            if row.index != index or row.field is not self.fields[index]:
+                row.bind_field(index, self.fields[index])
+            self.canvas.coords(window, 0, index * ROW_HEIGHT)
+            self.canvas.itemconfigure(window, state="normal")
+
+    def _update_scrollregion(self):
+        """
+        Size the scroll region for every field, with or without a row.
+        """
+        self.canvas.configure(
+            scrollregion=(0, 0, 0, max(len(self.fields) * ROW_HEIGHT, 1))
+        )
+
+    def _on_scroll(self, first, last):
+        """
+        Update the scrollbar and the rows after a scroll.
+        """
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def _on_resize(self, event):
+        """
+        Create the rows needed to fill the canvas and stretch them.
+        """
+        needed = event.height // ROW_HEIGHT + 2
+        while len(self.rows) < needed:
+            row = FieldRow(self.canvas, on_delete=self.delete)
+            self.rows.append(row)
+            self.windows.append(
+                self.canvas.create_window(
+                    0, 0, window=row, anchor="nw", height=ROW_HEIGHT, state="hidden"
+                )
+            )
+        for window in self.windows:
+            self.canvas.itemconfigure(window, width=event.width)
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -0,0 +1,128 @@
+"""
+Module containing the GenerationDialog class.
+
+date: 18/10/2026
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from generator.core.progress import GenerationProgress
+from generator.gui.style import FONT_FAMILY, FONT_SIZE_LABEL, PADDING
+from generator.gui.theme_manager import theme_manager
+
+# Delay between two reads of the events of the generation, in milliseconds
+POLL_INTERVAL_MS = 100
+
+
+class GenerationDialog(tk.Toplevel):
+    """
+    Class showing the progress of a generation running in the background.
+
+    The dialog polls the events of a BackgroundGeneration with root.after, so
+    the window stays responsive, and calls on_done(results, cancelled) once
+    the generation stopped. results is None if the generation failed, error
+    then holding the description of the failure.
+    """
+
+    def __init__(self, parent, job, on_done):
+        """
+        Initialize the dialog.
+
+        Args:
+            parent (tk.Widget): Main window.
+            job (BackgroundGeneration): Generation to follow, not started yet.
+            on_done (callable): Called with (results, cancelled, error).
+        """
+        super().__init__(parent, bg=theme_manager.get("BG_BOX"))
+        self.job = job
+        self.on_done = on_done
+        self.progress = GenerationProgress(len(job.entities))
+        self.title("Generation")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+        self._build_ui()
+
+    def _build_ui(self):
+        """
+        Build the UI of the dialog.
+        """
+        container = tk.Frame(self, bg=theme_manager.get("BG_BOX"), padx=PADDING)
+        container.pack(fill="both", expand=True, pady=PADDING)
+
+        self.entity_label = tk.Label(
+            container,
+            text="Preparing the generation...",
+            font=(FONT_FAMILY, FONT_SIZE_LABEL, "bold"),
+            fg=theme_manager.get("TEXT_COLOR"),
+            bg=theme_manager.get("BG_BOX"),
+            anchor="w",
+        )
+        self.entity_label.pack(fill="x")
+
+        self.progress_bar = ttk.Progressbar(
+            container,
+            mode="determinate",
+            maximum=max(self.progress.total, 1),
+            length=400,
+        )
+        self.progress_bar.pack(fill="x", pady=(12, 8))
+
+        self.status_label = tk.Label(
+            container,
+            text=self.progress.describe(),
+            font=(FONT_FAMILY, 10),
+            fg=theme_manager.get("TEXT_COLOR"),
+            bg=theme_manager.get("BG_BOX"),
+            anchor="w",
+        )
+        self.status_label.pack(fill="x")
+
+        self.cancel_button = ttk.Button(container, text="Cancel", command=self.cancel)
+        self.cancel_button.pack(anchor="e", pady=(12, 0))
+
+    def start(self):
+        """
+        Start the generation and follow its progress.
+        """
+        self.job.start()
+        self.after(POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self):
+        """
+        Ask the generation to stop between two templates.
+        """
+        if not self.job.cancelled:
+            self.job.cancel()
+            self.cancel_button.state(["disabled"])
+            self.entity_label.configure(text="Cancelling...")
+
+    def _poll(self):
+        """
+        Apply the events emitted by the generation since the previous poll.
+        """
+        for event in self.job.poll():
+            kind = event[0]
+            if kind == "progress":
+                _, done, total, table = event
+                self.progress.update(done)
+                self.progress_bar.configure(value=done)
+                self.status_label.configure(text=self.progress.describe())
+                if not self.job.cancelled:
+                    self.entity_label.configure(text=f"Generated {table}")
+            elif kind == "done":
+                self._finish(event[1], None)
+                return
+            elif kind == "error":
+                self._finish(None, event[1])
+                return
+        self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _finish(self, results, error):
+        """
+        Close the dialog and report the outcome of the generation.
+        """
+        cancelled = self.job.cancelled
+        self.destroy()
+        self.on_done(results, cancelled, error)
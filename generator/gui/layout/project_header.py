@@ -138,3 +138,15 @@ class ProjectHeader(tk.Frame):
         """
         value = self.package_name.get()
         return value if value != "Ex: com.mycompany.project" else ""
+
+    def set_values(self, company, project, package):
+        """
+        Show the names of a project, the placeholder for an empty one.
+        """
+        for entry, value, placeholder in (
+            (self.company_name, company, "Ex: My Company"),
+            (self.project_name, project, "Ex: my-project"),
+            (self.package_name, package, "Ex: com.mycompany.project"),
+        ):
+            entry.delete(0, "end")
+            entry.insert(0, value or placeholder)
@@ -5,14 +5,24 @@ date: 05/06/2025
 """
 
 # === Imports ===
-import json
 import os
-import shutil
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+from generator.core import __version__
 from generator.core.config_manager import load_settings, save_settings
-from generator.core.logger import logger
+from generator.core.fake_utils import (
+    DEFAULT_LOCALE,
+    configure_fake_values,
+    get_fake_value_pool,
+)
+from generator.core.logger import logger, setup_logging
+from generator.core.project_file import close_project
+from generator.core.project_file import open_project as open_project_file
+from generator.core.project_file import save_project as save_project_file
+from generator.core.project_store import ProjectStore
+from generator.core.validation import format_problems, validate_project
 from generator.gui.intro import show_intro_popup
 from generator.gui.layout.entity_board import EntityBoard
 from generator.gui.layout.entity_editor import EntityEditorWindow
@@ -21,36 +31,22 @@ from generator.gui.menubar import create_menu_bar
 from generator.gui.style import FONT_FAMILY, FONT_SIZE_LABEL, PADDING, apply_style
 from generator.gui.theme_manager import theme_manager
 from generator.gui.widgets import load_icons
-from generator.scripts.generate_entity import generate_all_templates
 
 # === Constants ===
-VERSION = "0.1.0"  # Version of the application
+VERSION = __version__  # Version of the application
 WINDOW_TITLE = "HexAPI Generator"
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 900
 WINDOW_MIN_WIDTH = 1000
 WINDOW_MIN_HEIGHT = 700
 
-ui_refs = {}  # References to the UI elements
+# Files offered when exporting the API as an archive
+ARCHIVE_TYPES = [("Zip archive", "*.zip"), ("Tar.gz archive", "*.tar.gz")]
 
+# Number of validation problems listed in the error message
+MAX_SHOWN_PROBLEMS = 15
 
-def clean_folders():
-    """
-    Clean the temp and output folders.
-    """
-    temp_dir = "temp"
-    output_dir = "output"
-    if os.path.exists(temp_dir):
-        logger.info("Cleaning temp folder: %s", temp_dir)
-        shutil.rmtree(temp_dir)
-    os.makedirs(temp_dir)
-    logger.info("Temp folder created: %s", temp_dir)
-
-    if os.path.exists(output_dir):
-        logger.info("Cleaning output folder: %s", output_dir)
-        shutil.rmtree(output_dir)
-    os.makedirs(output_dir)
-    logger.info("Output folder created: %s", output_dir)
+ui_refs = {}  # References to the UI elements
 
 
 def create_main_window():
@@ -118,12 +114,22 @@ def show_error_message(parent, message):
     dialog.wait_window()
 
 
-def setup_main_interface(root, dev_mode=False):
+def setup_main_interface(root, dev_mode=False, store=None):
     """
     Setup the main interface.
-    """
 
-    entities_data = {}  # {entity_name: {fields: [field_data]}}
+    Args:
+        root (tk.Tk): Main window.
+        dev_mode (bool): Whether to show the development tools.
+        store (ProjectStore): Project shared by the board, the editors and
+            the generation, a new empty one if None.
+
+    Returns:
+        The actions on the project file used by the menu bar: "new",
+        "open" (path), "save" (path), "path", "is_dirty" and "export", which
+        generates the API into an archive.
+    """
+    store = store if store is not None else ProjectStore()
     entity_editors = {}  # {entity_name: EntityEditorWindow}
 
     # --- Internal functions (must be defined before use) ---
@@ -140,6 +146,7 @@ def setup_main_interface(root, dev_mode=False):
 
         editor = EntityEditorWindow(
             root,
+            store,
             entity_name,
             on_name_change=update_entity_name,
             dev_mode=dev_mode,
@@ -156,12 +163,12 @@ def setup_main_interface(root, dev_mode=False):
         name = base_name
 
         # Generate a unique name
-        while name in entities_data:
+        while name in store:
             name = f"{base_name}{suffix}"
             suffix += 1
 
         logger.info("Creating entity %s", name)
-        entities_data[name] = []
+        store.add_entity(name)
         entity_board.add_entity(name)
         open_entity_editor(name)
 
@@ -192,17 +199,7 @@ def setup_main_interface(root, dev_mode=False):
                 del entity_editors[entity_name]
 
             # Delete the entity data
-            if entity_name in entities_data:
-                del entities_data[entity_name]
-
-            # Delete the temporary JSON file
-            json_path = f"temp/{entity_name}.json"
-            if os.path.exists(json_path):
-                logger.info("Deleting temporary JSON file %s", json_path)
-                try:
-                    os.remove(json_path)
-                except OSError as e:
-                    logger.error("Error deleting JSON file: %s", e)
+            store.delete_entity(entity_name)
 
             # Delete the entity from the board
             if entity_name in entity_board.entities:
@@ -211,9 +208,13 @@ def setup_main_interface(root, dev_mode=False):
         finally:
             operations_in_progress.remove(operation_key)
 
-    def generate_all_entities():
+    def generate_all_entities(archive=False):
         """
         Generate all entities.
+
+        Args:
+            archive (bool): Whether to write the files into a zip or tar.gz
+                archive instead of a directory.
         """
         logger.info("Generating all entities")
         company = header.get_company()
@@ -227,78 +228,126 @@ def setup_main_interface(root, dev_mode=False):
             return
 
         # Check if entities are set
-        if not entities_data:
+        if not len(store):
             show_error_message(root, "No entities have been created yet")
             return
 
-        # Ask the user to choose the output directory
-        output_dir = filedialog.askdirectory(
-            title="Choisir le dossier de destination",
-            initialdir=os.path.abspath("output"),
-        )
+        # The whole project is checked before anything is written
+        project_model = store.to_project()
+        project_model.company = company
+        project_model.project = project
+        project_model.package = package
+        problems = validate_project(project_model)
+        if problems:
+            logger.error("The project cannot be generated: %s", "; ".join(problems))
+            show_error_message(
+                root,
+                "The project cannot be generated:\n"
+                + format_problems(problems, MAX_SHOWN_PROBLEMS),
+            )
+            return
 
-        if not output_dir:  # If the user cancels the selection
+        if archive:
+            # The archive holds the same tree as the output directory
+            destination = filedialog.asksaveasfilename(
+                title="Exporter l'API",
+                defaultextension=".zip",
+                initialfile=f"{project}.zip",
+                filetypes=ARCHIVE_TYPES,
+            )
+            output_dir = ""
+        else:
+            # Ask the user to choose the output directory
+            destination = output_dir = filedialog.askdirectory(
+                title="Choisir le dossier de destination",
+                initialdir=os.path.abspath("output"),
+            )
+
+        if not destination:  # If the user cancels the selection
             return
 
-        for entity_name, editor in list(entity_editors.items()):
+        # The data is built from the store on each run, it is never wrapped
+        # twice in the project metadata
+        store.set_project_info(company, project, package)
+        entities = store.build_generation_data()
+
+        # Imported on first use, jinja2 is not needed to show the window
+        from generator.core.archive import ArchiveWriter
+        from generator.core.engine import CANCELLED, GenerationEngine
+        from generator.core.progress import BackgroundGeneration
+        from generator.gui.layout.generation_dialog import GenerationDialog
+
+        writer = None
+        if archive:
             try:
-                # Check if the editor still exists
-                try:
-                    editor.winfo_exists()
-                except tk.TclError:
-                    logger.info(
-                        "Editor %s does not exist, deleting reference", entity_name
-                    )
-                    del entity_editors[entity_name]
-                    continue
-
-                # Get the data from the temporary JSON file
-                json_path = f"temp/{entity_name}.json"
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Inject meta datas
-                data = {
-                    "company": {
-                        "lowercase": company.lower(),
-                        "uppercase": company.upper(),
-                    },
-                    "project": {
-                        "lowercase": project.lower(),
-                        "uppercase": project.upper(),
-                    },
-                    "package_name": package,
-                    "table": entity_name.lower(),
-                    "Table": entity_name[0].upper() + entity_name[1:],
-                    "fields": data,
-                }
-                logger.info("Injecting meta datas for %s", entity_name)
-
-                # Save the data
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
-
-                if not data:
-                    show_error_message(
-                        root,
-                        f"The entity '{entity_name}' has no fields. "
-                        "Please add at least one field before generating.",
+                writer = ArchiveWriter(destination, root=output_dir)
+            except (OSError, ValueError) as e:
+                logger.error("Unable to create the archive %s: %s", destination, e)
+                show_error_message(root, f"Unable to create the archive: {e}")
+                return
+
+        def on_generation_done(results, cancelled, error):
+            """
+            Report the outcome of the generation run in the background.
+            """
+            generate_btn.state(["!disabled"])
+            if writer is not None:
+                # A cancelled or failed export leaves no partial archive
+                if cancelled or error is not None:
+                    writer.abort()
+                else:
+                    try:
+                        writer.close()
+                    except OSError as e:
+                        error = f"{type(e).__name__}: {e}"
+            if error is not None:
+                logger.error("Generation failed: %s", error)
+                show_error_message(root, f"Generation failed: {error}")
+                return
+            errors = [
+                f"Error generating {result.table}: {result.error}"
+                for result in results
+                if not result.ok and result.error != CANCELLED
+            ]
+            errors.extend(
+                f"Error writing {path}: {project_error}"
+                for path, project_error in engine.project_errors.items()
+            )
+            if errors:
+                show_error_message(root, "\n".join(errors))
+                return
+            if cancelled:
+                if writer is not None:
+                    messagebox.showinfo(
+                        "Generation cancelled", "The archive was not written"
                     )
-                    logger.error("No data found for %s", entity_name)
                     return
-                if not os.path.exists(json_path):
-                    logger.error("File JSON not found for %s", entity_name)
-                    continue
-                logger.info("Generating templates for %s", entity_name)
-                generate_all_templates(json_path=json_path, output_root=output_dir)
-            except Exception as e:
-                logger.error("Error generating %s: %s", entity_name, e)
-                show_error_message(root, f"Error generating {entity_name}: {e}")
+                generated = sum(1 for result in results if result.ok)
+                messagebox.showinfo(
+                    "Generation cancelled",
+                    f"{generated}/{len(results)} entities were generated "
+                    f"in {output_dir}",
+                )
                 return
-        messagebox.showinfo(
-            "Generation completed",
-            f"All entities have been generated successfully in {output_dir}",
+            messagebox.showinfo(
+                "Generation completed",
+                f"All entities have been generated successfully in {destination}",
+            )
+
+        logger.info("Generating templates for %d entities", len(entities))
+        # The generation runs in a background thread, the dialog follows its
+        # progress so that the window stays responsive
+        # Threads, not processes: forking the Tk process from the background
+        # thread is unsafe, and the threads see the Cancel event
+        engine = GenerationEngine(
+            output_root=output_dir,
+            executor="thread",
+            incremental=not archive,
+            writer=writer,
         )
+        job = BackgroundGeneration(engine, entities)
+        generate_btn.state(["disabled"])
+        GenerationDialog(root, job, on_generation_done).start()
 
     def update_entity_name(old_name, new_name):
         """
@@ -313,6 +362,10 @@ def setup_main_interface(root, dev_mode=False):
         operations_in_progress.add(operation_key)
 
         try:
+            # Raises before anything is renamed if the name is already used
+            if old_name in store:
+                store.rename_entity(old_name, new_name)
+
             if old_name in entity_editors:
                 try:
                     editor = entity_editors.pop(old_name)
@@ -323,15 +376,6 @@ def setup_main_interface(root, dev_mode=False):
                     if old_name in entity_editors:
                         del entity_editors[old_name]
 
-            if old_name in entities_data:
-                entities_data[new_name] = entities_data.pop(old_name)
-
-            # Rename the JSON file if necessary
-            old_json_path = f"temp/{old_name}.json"
-            new_json_path = f"temp/{new_name}.json"
-            if os.path.exists(old_json_path):
-                os.rename(old_json_path, new_json_path)
-
             if old_name in entity_board.entities:
                 box = entity_board.entities.pop(old_name)
                 box.rename(new_name)
@@ -438,32 +482,122 @@ def setup_main_interface(root, dev_mode=False):
     ui_refs["generate_btn"] = generate_btn
     ui_refs["version_label"] = version_label
 
+    # --- Project file ---
+    project_path = {"path": None}
 
-def main():
+    def sync_project_info():
+        """
+        Copy the names typed in the header to the store.
+        """
+        store.set_project_info(
+            header.get_company(), header.get_project(), header.get_package()
+        )
+
+    def load_project(new_store, path=None):
+        """
+        Replace the project shown by another one.
+        """
+        nonlocal store
+        for editor in entity_editors.values():
+            try:
+                editor._is_being_deleted = True
+                editor.destroy()
+            except tk.TclError:
+                pass  # The editor is already closed
+        entity_editors.clear()
+        entity_board.clear()
+        close_project(store)
+
+        store = new_store
+        project_path["path"] = path
+        header.set_values(store.company, store.project, store.package)
+        # Only the names are needed, the fields are read when an editor
+        # opens or when generating
+        for entity_name in store.entity_names():
+            entity_board.add_entity(entity_name)
+        logger.info("Project loaded: %d entities", len(store))
+
+    def save_project(path):
+        """
+        Save the project to a file.
+        """
+        sync_project_info()
+        save_project_file(store, path)
+        project_path["path"] = path
+
+    def is_dirty():
+        """
+        Whether the project changed since it was opened or saved.
+        """
+        sync_project_info()
+        return store.is_dirty
+
+    return {
+        "new": lambda: load_project(ProjectStore()),
+        "open": lambda path: load_project(open_project_file(path), path),
+        "save": save_project,
+        "path": lambda: project_path["path"],
+        "is_dirty": is_dirty,
+        "export": lambda: generate_all_entities(archive=True),
+    }
+
+
+def preload_generation(profiler=None):
+    """
+    Import the generation engine and compile the templates in the background,
+    so that neither the first paint nor the first generation wait for them.
+
+    Args:
+        profiler (StartupProfiler): Profiler whose report is written once the
+            preload is done.
+    """
+
+    def preload():
+        try:
+            import generator.core.engine  # noqa: F401
+            from generator.core.class_generator import get_renderer
+
+            get_renderer().compile_all()
+        except Exception as e:
+            logger.warning("Preload of the generation failed: %s", e)
+        if profiler:
+            profiler.mark("generation_ready")
+            profiler.stop()
+            logger.info("Startup profile written to %s", profiler.write_report())
+
+    threading.Thread(target=preload, name="preload", daemon=True).start()
+
+
+def main(profiler=None):
     """
     Main function.
+
+    Args:
+        profiler (StartupProfiler): Profiler of the startup, see
+            main.py --profile-startup.
     """
+    setup_logging()
     logger.info("Starting application")
-    clean_folders()
     root = create_main_window()
     apply_style(root)
-    load_icons()
     settings = load_settings()
+    configure_fake_values(locale=settings.get("faker_locale", DEFAULT_LOCALE))
     if settings.get("first_launch"):
         show_intro_popup(root)
         settings["first_launch"] = False
         save_settings(settings)
-    setup_main_interface(root, dev_mode=True)
+    project_actions = setup_main_interface(root, dev_mode=True)
 
     def on_theme_change():
         """
-        Apply the theme to the main window.
-        """
-        apply_style(root)
-        root.configure(bg=theme_manager.get("BG"))
+        Apply the theme to the frames of the main window.
 
+        The ttk styles are switched by notify_theme_change() and the other
+        components subscribe themselves, the widget tree is not walked.
+        """
         for key, widget in ui_refs.items():
-            if widget:
+            # The board and the header apply the theme themselves
+            if widget and not hasattr(widget, "apply_theme"):
                 try:
                     if key == "entity_section_container":
                         widget.configure(bg=theme_manager.get("BG_BOX"))
@@ -484,26 +618,22 @@ def main():
                 bg=theme_manager.get("BG"), fg=theme_manager.get("TEXT_COLOR")
             )
 
-        def refresh_recursively(widget):
-            """
-            Refresh the widget recursively.
-            """
-            try:
-                if hasattr(widget, "apply_theme"):
-                    widget.apply_theme()
-                elif isinstance(widget, tk.Entry):
-                    widget.configure(style="CleanDark.TEntry")
-            except Exception as e:
-                logger.warning("Theme refresh failed for %s: %s", widget, e)
-            for child in widget.winfo_children():
-                refresh_recursively(child)
-
-        refresh_recursively(root)
-
     theme_manager.subscribe(on_theme_change)
 
     # Create the menu after the subscription
-    create_menu_bar(root)
+    create_menu_bar(root, project_actions)
 
+    def after_first_paint():
+        """
+        Load what the window does not need to be shown.
+        """
+        root.update_idletasks()
+        if profiler:
+            profiler.mark("first_paint")
+        load_icons()
+        get_fake_value_pool().warm_up()
+        preload_generation(profiler)
+
+    root.after_idle(after_first_paint)
     root.mainloop()
     logger.info("Stopping application")
@@ -9,18 +9,31 @@ import platform
 import subprocess
 import tkinter as tk
 import webbrowser
-from tkinter import messagebox, scrolledtext
+from tkinter import filedialog, messagebox, scrolledtext
 
 from generator.core.logger import LOG_DIR, logger
+from generator.core.project_file import PROJECT_EXTENSION, ProjectFileError
+from generator.core.resources import resource_path
 from generator.gui.style import get_current_theme
 from generator.gui.theme_manager import notify_theme_change, theme_manager
 
 FONT_FAMILY = "Segoe UI"
 
+# Files offered by the open and save dialogs
+PROJECT_TYPES = [
+    ("HexAPI project", f"*{PROJECT_EXTENSION}"),
+    ("JSON specification", "*.json"),
+]
 
-def create_menu_bar(root):
+
+def create_menu_bar(root, project_actions):
     """
     Create and attach the menu bar to the main window.
+
+    Args:
+        root (tk.Tk): Main window.
+        project_actions (dict): Actions on the project file, see
+            setup_main_interface.
     """
 
     menu_bar = tk.Menu(
@@ -36,12 +49,12 @@ def create_menu_bar(root):
     )
     root.config(menu=menu_bar)
 
-    _add_file_menu(menu_bar)
+    _add_file_menu(menu_bar, project_actions)
     _add_preferences_menu(menu_bar, root)
     _add_help_menu(menu_bar)
 
 
-def _add_file_menu(menu_bar):
+def _add_file_menu(menu_bar, project_actions):
     """
     Add the file menu to the menu bar.
     """
@@ -56,9 +69,19 @@ def _add_file_menu(menu_bar):
         relief="flat",
         font=(FONT_FAMILY, 10),
     )
-    file_menu.add_command(label="New", command=_new_project)
-    file_menu.add_command(label="Open a JSON project...", command=_open_project)
-    file_menu.add_command(label="Save", command=_save_project)
+    file_menu.add_command(label="New", command=lambda: _new_project(project_actions))
+    file_menu.add_command(
+        label="Open a project...", command=lambda: _open_project(project_actions)
+    )
+    file_menu.add_command(label="Save", command=lambda: _save_project(project_actions))
+    file_menu.add_command(
+        label="Save as...",
+        command=lambda: _save_project(project_actions, save_as=True),
+    )
+    file_menu.add_separator()
+    file_menu.add_command(
+        label="Export as archive...", command=project_actions["export"]
+    )
     file_menu.add_separator()
     file_menu.add_command(label="Quit", command=_quit_app)
     menu_bar.add_cascade(label="File", menu=file_menu)
@@ -126,37 +149,64 @@ def on_toggle_theme(root):
 # === Callbacks ===
 
 
-def _new_project():
+def _confirm_discard(project_actions):
+    """
+    Ask before discarding the changes of the current project.
+    """
+    if not project_actions["is_dirty"]():
+        return True
+    return messagebox.askyesno(
+        "Unsaved changes",
+        "The current project has unsaved changes. Discard them?",
+    )
+
+
+def _new_project(project_actions):
     """
     Create a new project.
     """
     logger.info("Creation of a new project")
-    messagebox.showinfo(
-        "Feature not available yet",
-        "This feature will be available in a future update.",
-    )
+    if _confirm_discard(project_actions):
+        project_actions["new"]()
 
 
-def _open_project():
+def _open_project(project_actions):
     """
     Open an existing project.
     """
     logger.info("Opening an existing project")
-    messagebox.showinfo(
-        "Feature not available yet",
-        "This feature will be available in a future update.",
-    )
+    if not _confirm_discard(project_actions):
+        return
+    path = filedialog.askopenfilename(title="Open a project", filetypes=PROJECT_TYPES)
+    if not path:
+        return
+    try:
+        project_actions["open"](path)
+    except (OSError, ProjectFileError) as e:
+        logger.error("Error opening the project %s: %s", path, e)
+        messagebox.showerror("Error", f"Unable to open the project:\n{e}")
 
 
-def _save_project():
+def _save_project(project_actions, save_as=False):
     """
-    Save the current project.
+    Save the current project, asking for a file the first time.
     """
     logger.info("Saving the current project")
-    messagebox.showinfo(
-        "Feature not available yet",
-        "This feature will be available in a future update.",
-    )
+    path = project_actions["path"]()
+    # A JSON specification that was opened is saved as a project file
+    if save_as or not path or not path.endswith(PROJECT_EXTENSION):
+        path = filedialog.asksaveasfilename(
+            title="Save the project",
+            defaultextension=PROJECT_EXTENSION,
+            filetypes=PROJECT_TYPES[:1],
+        )
+        if not path:
+            return
+    try:
+        project_actions["save"](path)
+    except OSError as e:
+        logger.error("Error saving the project %s: %s", path, e)
+        messagebox.showerror("Error", f"Unable to save the project:\n{e}")
 
 
 def _quit_app():
@@ -250,7 +300,7 @@ def _show_roadmap():
 
     # Read and display the content of the roadmap file
     try:
-        with open("generator/config/roadmap.txt", "r", encoding="utf-8") as f:
+        with open(resource_path("config", "roadmap.txt"), "r", encoding="utf-8") as f:
             content = f.read()
             text_widget.insert(tk.END, content)
             text_widget.configure(state="disabled")  # Make the text read-only
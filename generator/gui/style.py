@@ -53,7 +53,8 @@ THEMES = {
     },
 }
 
-CURRENT_THEME = load_settings().get("theme", "light")
+# Read from the settings on first use, see get_current_theme()
+CURRENT_THEME = None
 
 # === Polices ===
 FONT_FAMILY = "Segoe UI"
@@ -77,7 +78,7 @@ def get_style(name):
     """
     Get the style for a given name.
     """
-    return THEMES[CURRENT_THEME][name]
+    return THEMES[get_current_theme()][name]
 
 
 def switch_theme():
@@ -85,7 +86,7 @@ def switch_theme():
     Switch the theme.
     """
     global CURRENT_THEME
-    CURRENT_THEME = "dark" if CURRENT_THEME == "light" else "light"
+    CURRENT_THEME = "dark" if get_current_theme() == "light" else "light"
     save_settings({"theme": CURRENT_THEME})
 
 
@@ -93,6 +94,9 @@ def get_current_theme():
     """
     Get the current theme.
     """
+    global CURRENT_THEME
+    if CURRENT_THEME is None:
+        CURRENT_THEME = load_settings().get("theme", "light")
     return CURRENT_THEME
 
 
@@ -193,6 +197,42 @@ def apply_style(root):
         fieldbackground=[("active", theme_manager.get("BG_INPUT"))],
     )
 
+    # Containers and labels drawn on the boxes: switching these styles
+    # recolors every entity and field without touching the widgets
+    style.configure("Box.TFrame", background=theme_manager.get("BG_BOX"))
+    style.configure(
+        "Card.TFrame",
+        background=theme_manager.get("BG_BOX"),
+        bordercolor=theme_manager.get("BORDER_COLOR"),
+        lightcolor=theme_manager.get("BORDER_COLOR"),
+        darkcolor=theme_manager.get("BORDER_COLOR"),
+        borderwidth=1,
+        relief="solid",
+    )
+    style.configure(
+        "Box.TLabel",
+        background=theme_manager.get("BG_BOX"),
+        foreground=theme_manager.get("TEXT_COLOR"),
+        font=(FONT_FAMILY, FONT_SIZE_LABEL),
+    )
+    style.configure(
+        "BoxTitle.TLabel",
+        background=theme_manager.get("BG_BOX"),
+        foreground=theme_manager.get("TEXT_COLOR"),
+        font=(FONT_FAMILY, FONT_SIZE_LABEL, "bold"),
+    )
+    style.configure(
+        "Box.TLabelframe",
+        background=theme_manager.get("BG_BOX"),
+        bordercolor=theme_manager.get("BORDER_COLOR"),
+    )
+    style.configure(
+        "Box.TLabelframe.Label",
+        background=theme_manager.get("BG_BOX"),
+        foreground=theme_manager.get("TEXT_COLOR"),
+        font=(FONT_FAMILY, FONT_SIZE_LABEL, "bold"),
+    )
+
 
 def make_label(parent, text, size=FONT_SIZE_SUBTITLE, bold=False):
     """
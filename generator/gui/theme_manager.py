@@ -4,6 +4,9 @@ Module containing the ThemeManager class.
 date: 05/06/2025
 """
 
+import inspect
+import weakref
+
 from generator.core.config_manager import load_settings, save_settings
 from generator.core.logger import logger
 from generator.gui.style import THEMES, apply_style
@@ -17,11 +20,25 @@ class ThemeManager:
     def __init__(self):
         """
         Initialize the ThemeManager.
+
+        The theme is read from the settings on first use, not at import.
         """
-        settings = load_settings()
-        self.current_theme = settings.get("theme", "light")
+        self._current_theme = None
         self.subscribers = []
 
+    @property
+    def current_theme(self):
+        """
+        Name of the current theme, "light" or "dark".
+        """
+        if self._current_theme is None:
+            self._current_theme = load_settings().get("theme", "light")
+        return self._current_theme
+
+    @current_theme.setter
+    def current_theme(self, value):
+        self._current_theme = value
+
     def get(self, key):
         """
         Get the value of a theme key.
@@ -39,44 +56,72 @@ class ThemeManager:
     def subscribe(self, callback):
         """
         Subscribe to the theme change.
+
+        A bound method is held weakly: the subscription ends with its object,
+        or when its widget is destroyed, without calling unsubscribe().
         """
-        self.subscribers.append(callback)
+        if inspect.ismethod(callback):
+            self.subscribers.append(weakref.WeakMethod(callback))
+        else:
+            self.subscribers.append(lambda: callback)
 
     def unsubscribe(self, callback):
         """
         Unsubscribe from the theme change.
         """
-        self.subscribers.remove(callback)
+        self.subscribers = [
+            ref for ref in self.subscribers if ref() not in (None, callback)
+        ]
+
+    def _live_subscribers(self) -> list:
+        """
+        Get the callbacks still alive and forget the others.
+        """
+        alive = []
+        live_refs = []
+        for ref in self.subscribers:
+            callback = ref()
+            if callback is None or not _widget_exists(callback):
+                continue
+            alive.append(callback)
+            live_refs.append(ref)
+        self.subscribers = live_refs
+        return alive
 
     def _notify_subscribers(self):
         """
         Notify the subscribers of the theme change.
         """
-        for callback in self.subscribers:
-            callback()
+        for callback in self._live_subscribers():
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("Theme refresh failed for %s: %s", callback, e)
 
 
-def notify_theme_change(root):
+def _widget_exists(callback) -> bool:
     """
-    Notify the subscribers of the theme change.
+    Whether the widget owning a callback, if any, is not destroyed.
     """
-    apply_style(root)
-    root.configure(bg=theme_manager.get("BG"))
+    widget = getattr(callback, "__self__", None)
+    if not hasattr(widget, "winfo_exists"):
+        return True
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        # The Tcl interpreter is gone
+        return False
 
-    def refresh_recursively(widget):
-        """
-        Refresh the widget recursively.
-        """
-        try:
-            if hasattr(widget, "apply_theme"):
-                widget.apply_theme()
-        except Exception as e:
-            logger.warning("Theme refresh failed for %s: %s", widget, e)
 
-        for child in widget.winfo_children():
-            refresh_recursively(child)
+def notify_theme_change(root):
+    """
+    Switch the ttk styles to the current theme.
 
-    refresh_recursively(root)
+    The widgets take their colors from the styles, so switching the styles
+    once recolors all of them: the widget tree is not walked.
+    """
+    apply_style(root)
+    root.configure(bg=theme_manager.get("BG"))
 
 
 # Singleton instance
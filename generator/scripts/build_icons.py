@@ -0,0 +1,45 @@
+"""
+Module containing the build step resizing the icons of the GUI.
+
+Usage:
+    python -m generator.scripts.build_icons
+
+date: 18/10/2026
+"""
+
+import argparse
+
+from generator.gui.icon_cache import CACHE_DIR, DEFAULT_SCALES, IconCache
+
+
+def build_icons(cache_dir: str = CACHE_DIR, scales=DEFAULT_SCALES) -> list[str]:
+    """
+    Resize the icons of every theme at the given display scales.
+
+    Args:
+        cache_dir (str): Directory of the cache of the icons.
+        scales (tuple[float]): Display scales, 1.0 at 96 DPI.
+
+    Returns:
+        The paths of the icons resized, the fresh ones are kept.
+    """
+    return IconCache(cache_dir).build_all(scales)
+
+
+def main(argv=None):
+    """
+    Run the build step from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m generator.scripts.build_icons",
+        description="Resize the icons of the GUI for each theme and scale.",
+    )
+    parser.add_argument("--output", default=CACHE_DIR)
+    parser.add_argument("--scales", type=float, nargs="+", default=list(DEFAULT_SCALES))
+    args = parser.parse_args(argv)
+    built = build_icons(args.output, args.scales)
+    print(f"{len(built)} icons resized into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Module containing the build step precompiling the Jinja2 templates.
+
+Usage:
+    python -m generator.scripts.build_templates
+
+date: 18/10/2026
+"""
+
+import argparse
+
+from generator.core.class_generator import (
+    TEMPLATES_BUNDLE,
+    TEMPLATES_DIR,
+    TemplateRenderer,
+)
+from generator.core.template_bundle import build_template_bundle
+
+
+def build_templates(
+    templates_root: str = TEMPLATES_DIR, bundle_root: str = TEMPLATES_BUNDLE
+) -> dict:
+    """
+    Precompile the templates into the bundle loaded by the renderer.
+
+    Args:
+        templates_root (str): Directory containing the Jinja2 templates.
+        bundle_root (str): Directory of the bundle.
+
+    Returns:
+        The digests of the compiled templates, by template name.
+    """
+    renderer = TemplateRenderer(templates_root, bundle_root=None)
+    return build_template_bundle(renderer.env, bundle_root)
+
+
+def main(argv=None):
+    """
+    Run the build step from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m generator.scripts.build_templates",
+        description="Precompile the Jinja2 templates of the generator.",
+    )
+    parser.add_argument("--templates", default=TEMPLATES_DIR)
+    parser.add_argument("--output", default=TEMPLATES_BUNDLE)
+    args = parser.parse_args(argv)
+    digests = build_templates(args.templates, args.output)
+    print(f"{len(digests)} templates precompiled into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
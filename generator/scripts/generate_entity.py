@@ -4,54 +4,98 @@ Module containing the generate_all_templates function.
 date: 05/06/2025
 """
 
-from generator.core.class_generator import render_template_to_output
+import logging
+import time
+
+from generator.core.class_generator import (
+    TEMPLATES_TO_GENERATE,
+    check_entity_data,
+    get_output_path,
+    get_renderer,
+    load_entity_json,
+    render_entity_to_output,
+)
+from generator.core.engine import GenerationEngine
 from generator.core.logger import logger
+from generator.core.view_model import build_view_model
+from generator.core.writer import OutputWriter
+
 
-TEMPLATES_TO_GENERATE = [
-    "generator/templates/src/main/java/api/adapters/"
-    "datasources/xxx/model/XxxEntity.java.j2",
-    "generator/templates/src/main/java/api/adapters/"
-    "datasources/xxx/XxxMapper.java.j2",
-    "generator/templates/src/main/java/api/adapters/"
-    "datasources/xxx/XxxPanacheAdapter.java.j2",
-    "generator/templates/src/main/java/api/adapters/"
-    "rest/controllers/xxx/XxxController.java.j2",
-    "generator/templates/src/main/java/api/adapters/"
-    "rest/controllers/xxx/XxxMapper.java.j2",
-    "generator/templates/src/main/java/api/adapters/"
-    "rest/controllers/xxx/model/XxxSchema.java.j2",
-    "generator/templates/src/main/java/api/application/"
-    "xxx/XxxDatasourcePort.java.j2",
-    "generator/templates/src/main/java/api/application/" "xxx/XxxService.java.j2",
-    "generator/templates/src/main/java/api/application/" "xxx/model/Xxx.java.j2",
-    "generator/templates/src/main/resources/application.properties.j2",
-    "generator/templates/src/main/java/api/Application.java.j2",
-]
-
-
-def generate_all_templates(json_path: str, output_root: str = "output"):
+def generate_entity_templates(
+    data: dict, output_root: str = "output", incremental: bool = False
+) -> list[str]:
     """
-    Generate all the templates for an entity.
+    Generate all the templates for an already loaded entity.
+
+    Args:
+        data (dict): Entity model, as built by the GUI from its ProjectStore.
+        output_root (str): Root directory where the files will be written.
+        incremental (bool): Skip the files that did not change since the
+            previous run, according to the manifest of output_root.
+
+    Returns:
+        The paths of the generated files.
     """
-    logger.info("Starting the generation of the templates for %s", json_path)
-    try:
-        for template_path in TEMPLATES_TO_GENERATE:
-            logger.info("Generation of the template: %s", template_path)
-            try:
-                render_template_to_output(
-                    json_path=json_path,
+    check_entity_data(data)
+    # Built once for every template of the entity
+    data = build_view_model(data)
+    if incremental:
+        engine = GenerationEngine(output_root=output_root, workers=1, incremental=True)
+        (result,) = engine.generate([data])
+        if not result.ok:
+            raise RuntimeError(result.error)
+        if engine.project_errors:
+            raise RuntimeError("; ".join(engine.project_errors.values()))
+        return result.files
+    start = time.perf_counter()
+    renderer = get_renderer()
+    renderer.compile_all(TEMPLATES_TO_GENERATE)
+    writer = OutputWriter()
+    writer.plan(
+        get_output_path(data, template_path, output_root)
+        for template_path in TEMPLATES_TO_GENERATE
+    )
+    generated = []
+    for template_path in TEMPLATES_TO_GENERATE:
+        try:
+            generated.append(
+                render_entity_to_output(
+                    data=data,
                     template_path=template_path,
                     output_root=output_root,
+                    writer=writer,
                 )
-                logger.info("Template generated successfully: %s", template_path)
-            except Exception as e:
-                logger.error(
-                    "Error during the generation of the template %s: %s",
-                    template_path,
-                    e,
-                )
-                raise
-        logger.info("Generation of the templates completed for %s", json_path)
-    except Exception as e:
-        logger.error("Error during the generation of the templates: %s", e)
-        raise
+            )
+        except Exception as e:
+            logger.error("Error during the generation of %s: %s", data["Table"], e)
+            raise
+
+    # One summary line per run, the details of each template are at DEBUG
+    stats = writer.stats()
+    logger.info(
+        "Generated %s: %d templates in %.3fs, %d file(s) written (%d bytes), "
+        "%d unchanged",
+        data["Table"],
+        len(generated),
+        time.perf_counter() - start,
+        stats["files_written"],
+        stats["bytes_written"],
+        stats["files_skipped"],
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Template cache: %s", renderer.cache_info())
+    return generated
+
+
+def generate_all_templates(
+    json_path: str, output_root: str = "output", incremental: bool = False
+) -> list[str]:
+    """
+    Generate all the templates for an entity stored in a JSON file.
+
+    The file is read once, then every template is rendered from memory.
+    """
+    data = load_entity_json(json_path)
+    return generate_entity_templates(
+        data, output_root=output_root, incremental=incremental
+    )
@@ -1,4 +1,28 @@
-from generator.gui.main import main
+import argparse
+import multiprocessing
+
+from generator.core.startup_profiler import DEFAULT_REPORT, StartupProfiler
 
 if __name__ == "__main__":
-    main()
+    # Required by the process pool of the generation engine in frozen builds
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description="HexAPI Generator")
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const=DEFAULT_REPORT,
+        metavar="REPORT",
+        help=f"write the import times and the time to first paint to REPORT "
+        f"(default: {DEFAULT_REPORT})",
+    )
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler(args.profile_startup)
+        profiler.start()
+
+    from generator.gui.main import main
+
+    main(profiler)
@@ -3,6 +3,29 @@ import sys
 
 from cx_Freeze import Executable, setup
 
+try:
+    from cx_Freeze.command.build_exe import build_exe
+except ImportError:  # cx_Freeze < 7
+    from cx_Freeze import build_exe
+
+
+class BuildExe(build_exe):
+    """
+    Build the assets of the executable before freezing it, only when the
+    executable is built (not for --version or the metadata queries).
+    """
+
+    def run(self):
+        from generator.scripts.build_icons import build_icons
+        from generator.scripts.build_templates import build_templates
+
+        # Précompiler les templates Jinja2 pour que l'exécutable ne les parse pas
+        build_templates()
+        # Redimensionner les icônes pour que l'exécutable n'ait pas besoin de PIL
+        build_icons()
+        super().run()
+
+
 # Inclure ton script principal
 executables = [
     Executable(
@@ -24,6 +47,7 @@ buildOptions = dict(
     includes=[],
     include_files=[
         ("generator/templates", "generator/templates"),
+        ("generator/templates_compiled", "generator/templates_compiled"),
         ("generator/gui/style.py", "generator/gui"),
         ("generator/config/settings.json", "generator/config/settings.json"),
         ("generator/config/roadmap.txt", "generator/config/roadmap.txt"),
@@ -40,5 +64,6 @@ setup(
     version="0.1.0",
     description="HexAPI Generator GUI",
     options=dict(build_exe=buildOptions),
+    cmdclass=dict(build_exe=BuildExe),
     executables=executables,
 )
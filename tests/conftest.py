@@ -0,0 +1,116 @@
+import copy
+
+import pytest
+
+from generator.core.logger import setup_logging, shutdown_logging
+
+# Template data of an entity, as built by build_generation_data
+_ENTITY_DATA = {
+    "company": {"lowercase": "acme", "uppercase": "ACME"},
+    "project": {"lowercase": "shop", "uppercase": "SHOP"},
+    "package_name": "com.acme.shop",
+    "table": "product",
+    "Table": "Product",
+    "fields": [
+        {
+            "name": "id",
+            "type": "Long",
+            "comment": "Unique ID",
+            "test_value": "1",
+            "is_id": True,
+            "nullable": False,
+        },
+        {
+            "name": "createdAt",
+            "type": "LocalDateTime",
+            "comment": "Creation date",
+            "test_value": "2025-01-01T00:00:00",
+            "is_id": False,
+            "nullable": True,
+        },
+    ],
+}
+
+# Project specification, as read by the command line
+_PROJECT_SPEC = {
+    "company": "Acme",
+    "project": "Shop",
+    "package": "com.acme.shop",
+    "entities": [
+        {
+            "name": "Product",
+            "fields": [
+                {"name": "id", "type": "Long", "is_id": True, "nullable": False},
+                {"name": "label", "type": "String", "nullable": True},
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def log_dir(tmp_path_factory):
+    """
+    Write the log file of the whole session to a temporary directory: the
+    command line and the benchmarks set the logging up in ./logs otherwise.
+    """
+    path = tmp_path_factory.mktemp("logs")
+    setup_logging(str(path))
+    yield path
+    shutdown_logging()
+
+
+@pytest.fixture
+def entity_data():
+    """
+    Template data of a Product entity, a new copy for each test.
+    """
+    return copy.deepcopy(_ENTITY_DATA)
+
+
+@pytest.fixture
+def project_spec():
+    """
+    Specification of a project with a Product entity, a new copy for each test.
+    """
+    return copy.deepcopy(_PROJECT_SPEC)
+
+
+def _numbered_entities(count):
+    for i in range(count):
+        data = copy.deepcopy(_ENTITY_DATA)
+        data["table"] = f"product{i}"
+        data["Table"] = f"Product{i}"
+        yield data
+
+
+@pytest.fixture
+def make_entities():
+    """
+    Build the template data of the entities Product0, Product1...
+    """
+    return lambda count: list(_numbered_entities(count))
+
+
+@pytest.fixture
+def lazy_entities():
+    """
+    Yield the template data of the entities Product0, Product1... one at a time.
+    """
+    return _numbered_entities
+
+
+@pytest.fixture
+def read_tree():
+    """
+    Read the files of a directory, by path relative to it.
+    """
+
+    def read(root):
+        return {
+            path.relative_to(root).as_posix(): path.read_bytes()
+            for path in root.rglob("*")
+            if path.is_file()
+        }
+
+    return read
@@ -0,0 +1,103 @@
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from generator.core.archive import ArchiveWriter, get_archive_format
+from generator.core.engine import GenerationEngine
+from generator.core.pipeline import run_pipeline
+
+
+def read_zip(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def read_tar(path):
+    with tarfile.open(path) as archive:
+        return {
+            member.name: archive.extractfile(member).read()
+            for member in archive.getmembers()
+        }
+
+
+def test_archive_format_from_extension():
+    assert get_archive_format("api.zip") == "zip"
+    assert get_archive_format("API.TAR.GZ") == "tar.gz"
+    assert get_archive_format("api.tgz") == "tar.gz"
+    with pytest.raises(ValueError, match="Unknown archive extension"):
+        get_archive_format("api.rar")
+
+
+@pytest.mark.parametrize(
+    "name, read", [("api.zip", read_zip), ("api.tar.gz", read_tar)]
+)
+def test_engine_archive_matches_directory(
+    tmp_path, name, read, make_entities, read_tree
+):
+    entities = make_entities(2)
+    GenerationEngine(output_root=str(tmp_path / "output"), workers=1).generate(entities)
+
+    path = str(tmp_path / name)
+    with ArchiveWriter(path, root="output") as writer:
+        results = GenerationEngine(
+            output_root="output", workers=1, writer=writer
+        ).generate(entities)
+
+    assert all(result.ok for result in results)
+    assert read(path) == read_tree(tmp_path / "output")
+    assert not os.path.exists(tmp_path / "output" / "output")
+    assert writer.stats()["files_written"] == len(read(path))
+
+
+@pytest.mark.parametrize("compression", ["deflate", "store"])
+def test_pipeline_streams_into_zip(compression, lazy_entities):
+    target = io.BytesIO()
+    writer = ArchiveWriter(target, root="output", compression=compression, level=1)
+    run_pipeline(lazy_entities(2), writer=writer)
+    writer.close()
+
+    with zipfile.ZipFile(target) as archive:
+        infos = archive.infolist()
+    expected = zipfile.ZIP_DEFLATED if compression == "deflate" else zipfile.ZIP_STORED
+    assert len(infos) == writer.files_written
+    assert {info.compress_type for info in infos} == {expected}
+    assert all(not info.filename.startswith("output") for info in infos)
+
+
+def test_stored_tar_gz_is_a_plain_tar(tmp_path):
+    path = str(tmp_path / "api.tar.gz")
+    with ArchiveWriter(path, root="", compression="store") as writer:
+        writer.write("a/A.java", "class A {}\n")
+
+    assert writer.archive_format == "tar"
+    with tarfile.open(path, "r:") as archive:
+        assert archive.getnames() == ["a/A.java"]
+
+
+def test_failed_archive_keeps_previous_file(tmp_path):
+    path = tmp_path / "api.zip"
+    path.write_bytes(b"previous")
+
+    with pytest.raises(RuntimeError):
+        with ArchiveWriter(str(path)) as writer:
+            writer.write("output/A.java", "class A {}\n")
+            raise RuntimeError("boom")
+
+    assert path.read_bytes() == b"previous"
+    assert os.listdir(tmp_path) == ["api.zip"]
+
+
+def test_archive_rejects_duplicates_and_invalid_options(tmp_path):
+    with ArchiveWriter(io.BytesIO()) as writer:
+        writer.write("output/A.java", "class A {}\n")
+        with pytest.raises(ValueError, match="already holds A.java"):
+            writer.write("output/A.java", "class B {}\n")
+    with pytest.raises(ValueError, match="compression"):
+        ArchiveWriter(io.BytesIO(), compression="lzma")
+    with pytest.raises(ValueError, match="level"):
+        ArchiveWriter(io.BytesIO(), level=10)
+    with pytest.raises(ValueError, match="incrementally"):
+        GenerationEngine(incremental=True, writer=ArchiveWriter(io.BytesIO()))
@@ -0,0 +1,163 @@
+import json
+import os
+import re
+
+import pytest
+
+from generator.core import view_model
+from generator.core.class_generator import (
+    TEMPLATES_TO_GENERATE,
+    TemplateRenderer,
+    replace_camel_case_with_underscore,
+)
+from generator.scripts.generate_entity import (
+    generate_all_templates,
+    generate_entity_templates,
+)
+
+
+def test_renderer_compiles_each_template_once(entity_data):
+    renderer = TemplateRenderer()
+    renderer.compile_all()
+    assert renderer.cache_info() == {
+        "hits": 0,
+        "misses": len(TEMPLATES_TO_GENERATE),
+        "size": len(TEMPLATES_TO_GENERATE),
+    }
+
+    for _ in range(3):
+        for template_path in TEMPLATES_TO_GENERATE:
+            renderer.render(template_path, entity_data)
+
+    info = renderer.cache_info()
+    assert info["misses"] == len(TEMPLATES_TO_GENERATE)
+    assert info["hits"] == 3 * len(TEMPLATES_TO_GENERATE)
+
+
+def test_renderer_applies_filters(entity_data):
+    renderer = TemplateRenderer()
+    rendered = renderer.render(TEMPLATES_TO_GENERATE[0], entity_data)
+    assert (
+        '@Column(name = "created_at", nullable = true, '
+        'columnDefinition = "TIMESTAMP")' in rendered
+    )
+    assert "import java.time.LocalDateTime;" in rendered
+
+
+def test_schema_fields_match_the_constructor_arguments(entity_data):
+    renderer = TemplateRenderer()
+    render = {
+        name: renderer.render(
+            next(path for path in TEMPLATES_TO_GENERATE if path.endswith(suffix)),
+            entity_data,
+        )
+        for name, suffix in (
+            ("domain", "application/xxx/model/Xxx.java.j2"),
+            ("schema", "rest/controllers/xxx/model/XxxSchema.java.j2"),
+            ("mapper", "rest/controllers/xxx/XxxMapper.java.j2"),
+        )
+    }
+    domain_fields = re.findall(r"private \w+ (\w+);", render["domain"])
+    schema_fields = re.findall(r"private \w+ (\w+);", render["schema"])
+    to_domain = re.findall(r"this\.get(\w+)\(\)", render["schema"])
+    to_schema = re.search(r"new ProductSchema\((.*)\);", render["mapper"]).group(1)
+    from_schema = re.search(r"new Product\((.*)\);", render["mapper"]).group(1)
+
+    assert domain_fields == schema_fields == ["id", "createdAt"]
+    assert to_domain == ["Id", "CreatedAt"]
+    assert re.findall(r"product\.get(\w+)\(\)", to_schema) == to_domain
+    assert re.findall(r"productSchema\.get(\w+)\(\)", from_schema) == to_domain
+
+
+def test_replace_camel_case_with_underscore():
+    assert replace_camel_case_with_underscore("createdAt") == "created_at"
+
+
+def test_generate_all_templates_writes_every_file(tmp_path, entity_data):
+    json_path = tmp_path / "Product.json"
+    json_path.write_text(json.dumps(entity_data), encoding="utf-8")
+    output_root = tmp_path / "output"
+
+    generate_all_templates(str(json_path), output_root=str(output_root))
+
+    generated = [p for p in output_root.rglob("*") if p.is_file()]
+    assert len(generated) == len(TEMPLATES_TO_GENERATE)
+    assert (
+        output_root
+        / "acme/shop/src/main/java/com/acme/shop/api/adapters"
+        / "datasources/product/model/ProductEntity.java"
+    ).exists()
+
+
+def test_generate_all_templates_reads_json_once(tmp_path, monkeypatch, entity_data):
+    json_path = tmp_path / "Product.json"
+    json_path.write_text(json.dumps(entity_data), encoding="utf-8")
+    loads = []
+    original_load = json.load
+
+    def counting_load(f):
+        loads.append(f.name)
+        return original_load(f)
+
+    monkeypatch.setattr(json, "load", counting_load)
+    generate_all_templates(str(json_path), output_root=str(tmp_path / "output"))
+
+    assert loads == [str(json_path)]
+
+
+def test_generate_entity_templates_from_memory(tmp_path, entity_data):
+    generated = generate_entity_templates(entity_data, output_root=str(tmp_path))
+    assert len(generated) == len(TEMPLATES_TO_GENERATE)
+    assert all(os.path.exists(path) for path in generated)
+
+
+def test_view_model_is_built_once_per_entity(tmp_path, monkeypatch, entity_data):
+    calls = []
+    original = view_model.build_field_view
+
+    def counting_build(field, registry=None):
+        calls.append(field["name"])
+        return original(field, registry)
+
+    monkeypatch.setattr(view_model, "build_field_view", counting_build)
+    generate_entity_templates(entity_data, output_root=str(tmp_path))
+
+    assert calls == ["id", "createdAt"]
+
+
+def test_every_template_uses_the_id_field(tmp_path, entity_data):
+    entity_data["fields"][0].update(name="ref", type="String")
+    renderer = TemplateRenderer()
+
+    rendered = "\n".join(
+        renderer.render(template_path, entity_data)
+        for template_path in TEMPLATES_TO_GENERATE
+    )
+
+    assert "Long id" not in rendered
+    assert "public Optional<Product> findById(String ref)" in rendered
+    assert '@GetMapping("/{ref}")' in rendered
+    assert "getById(@PathVariable String ref)" in rendered
+    assert "updatedProduct.setRef(ref);" in rendered
+
+
+def test_every_file_using_the_id_type_imports_it(entity_data):
+    entity_data["fields"][0]["type"] = "UUID"
+    renderer = TemplateRenderer()
+
+    using_uuid = []
+    for template_path in TEMPLATES_TO_GENERATE:
+        rendered = renderer.render(template_path, entity_data)
+        if re.search(r"\bUUID\b", rendered):
+            using_uuid.append(os.path.basename(template_path))
+            assert "import java.util.UUID;" in rendered, template_path
+
+    assert len(using_uuid) == 7
+
+
+def test_generate_entity_templates_rejects_incomplete_data(tmp_path, entity_data):
+    with pytest.raises(ValueError, match="package_name"):
+        generate_entity_templates(
+            {k: v for k, v in entity_data.items() if k != "package_name"},
+            output_root=str(tmp_path),
+        )
@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from generator.core.class_generator import TEMPLATES_TO_GENERATE, TemplateRenderer
+from generator.core.engine import CANCELLED, GenerationEngine, generate_entities
+from generator.scripts.generate_entity import generate_entity_templates
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_output_matches_serial(tmp_path, executor, make_entities, read_tree):
+    entities = make_entities(4)
+    for data in entities:
+        generate_entity_templates(data, output_root=str(tmp_path / "serial"))
+
+    results = generate_entities(
+        entities,
+        output_root=str(tmp_path / "parallel"),
+        workers=2,
+        executor=executor,
+    )
+
+    assert all(result.ok for result in results)
+    assert [len(result.files) for result in results] == [len(TEMPLATES_TO_GENERATE)] * 4
+    assert read_tree(tmp_path / "parallel") == read_tree(tmp_path / "serial")
+
+
+def test_errors_are_reported_per_entity_in_order(tmp_path, make_entities):
+    entities = make_entities(3)
+    del entities[1]["package_name"]
+
+    results = GenerationEngine(
+        output_root=str(tmp_path), workers=2, executor="thread"
+    ).generate(entities)
+
+    assert [result.table for result in results] == ["Product0", "Product1", "Product2"]
+    assert [result.ok for result in results] == [True, False, True]
+    assert "package_name" in results[1].error
+    assert results[1].files == []
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_project_file_errors_are_not_blamed_on_an_entity(
+    tmp_path, monkeypatch, make_entities, reverse
+):
+    entities = make_entities(3)
+    if reverse:
+        entities.reverse()
+    render = TemplateRenderer.render
+
+    def failing_render(self, template_path, data):
+        if template_path.endswith("Application.java.j2"):
+            raise RuntimeError("broken template")
+        return render(self, template_path, data)
+
+    monkeypatch.setattr(TemplateRenderer, "render", failing_render)
+    engine = GenerationEngine(output_root=str(tmp_path), workers=1)
+    results = engine.generate(entities)
+
+    assert all(result.ok for result in results)
+    ((path, error),) = engine.project_errors.items()
+    assert path.endswith("api/Application.java")
+    assert error == "RuntimeError: broken template"
+    assert all(path not in result.files for result in results)
+    assert all(
+        len(result.files) == len(TEMPLATES_TO_GENERATE) - 1 for result in results
+    )
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        GenerationEngine(executor="fork")
+    with pytest.raises(ValueError):
+        GenerationEngine(workers=0)
+
+
+def test_progress_is_reported_after_each_entity(tmp_path, make_entities):
+    calls = []
+
+    GenerationEngine(output_root=str(tmp_path)).generate(
+        make_entities(3),
+        progress=lambda done, total, result: calls.append((done, total, result.table)),
+    )
+
+    assert calls == [(1, 3, "Product0"), (2, 3, "Product1"), (3, 3, "Product2")]
+
+
+def test_cancel_stops_between_entities(tmp_path, read_tree, make_entities):
+    cancel = threading.Event()
+    engine = GenerationEngine(output_root=str(tmp_path))
+
+    results = engine.generate(
+        make_entities(3), progress=lambda *args: cancel.set(), cancel=cancel
+    )
+
+    assert engine.cancelled
+    assert [result.error for result in results] == [None, CANCELLED, CANCELLED]
+    written = read_tree(tmp_path)
+    assert written and all("Product0" in path for path in written)
+
+
+def test_cancel_stops_the_thread_pool_between_templates(
+    tmp_path, monkeypatch, make_entities, read_tree
+):
+    cancel = threading.Event()
+    renders = []
+    original_render = TemplateRenderer.render
+
+    def render(self, template_path, data):
+        renders.append(template_path)
+        cancel.set()
+        return original_render(self, template_path, data)
+
+    monkeypatch.setattr(TemplateRenderer, "render", render)
+    engine = GenerationEngine(output_root=str(tmp_path), workers=2, executor="thread")
+
+    results = engine.generate(make_entities(4), cancel=cancel)
+
+    assert engine.cancelled
+    assert all(result.error == CANCELLED for result in results)
+    # Each worker stops after the template it was rendering
+    assert len(renders) <= 2
+    assert not tmp_path.exists() or read_tree(tmp_path) == {}
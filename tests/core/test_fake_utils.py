@@ -1,6 +1,9 @@
+import subprocess
+import sys
+
 import pytest
 
-from generator.core.fake_utils import get_fake_value
+from generator.core.fake_utils import REFILL_THRESHOLD, FakeValuePool, get_fake_value
 
 
 @pytest.mark.parametrize(
@@ -22,3 +25,41 @@ def test_get_fake_value_generates_data(field_type):
     value = get_fake_value(field_type)
     assert isinstance(value, str)
     assert value != ""
+
+
+def test_unknown_type_has_no_fake_value():
+    assert get_fake_value("Unknown") == ""
+
+
+def test_seeded_pools_are_reproducible():
+    first = FakeValuePool(seed=42, size=4)
+    second = FakeValuePool(seed=42, size=4)
+    second.get("Long")
+
+    strings = [first.get("String") for _ in range(10)]
+    second.warm_up()
+    second.wait()
+
+    assert [second.get("String") for _ in range(10)] == strings
+
+
+def test_pool_is_refilled_in_background():
+    pool = FakeValuePool(seed=1, size=16)
+    pool.warm_up()
+    pool.wait()
+
+    for _ in range(12):
+        pool.get("UUID")
+    pool.wait()
+
+    assert len(pool._pools["UUID"]) >= REFILL_THRESHOLD
+
+
+def test_faker_is_built_lazily():
+    code = (
+        "import sys, generator.core.fake_utils as f; "
+        "assert 'faker' not in sys.modules; "
+        "f.get_fake_value('String'); "
+        "assert 'faker' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
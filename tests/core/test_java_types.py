@@ -0,0 +1,88 @@
+import pytest
+
+from generator.core.class_generator import TEMPLATES_TO_GENERATE, get_renderer
+from generator.core.fake_utils import FakeValuePool
+from generator.core.generator import build_project_data
+from generator.core.java_imports import TYPE_IMPORTS
+from generator.core.java_types import (
+    DEFAULT_TYPES,
+    JavaType,
+    JavaTypeRegistry,
+    type_registry,
+)
+from generator.core.view_model import build_view_model
+
+ENTITY_TEMPLATE = TEMPLATES_TO_GENERATE[0]
+
+
+def test_registry_describes_every_default_type():
+    assert type_registry.names() == [
+        "String",
+        "Integer",
+        "Long",
+        "Boolean",
+        "Double",
+        "BigDecimal",
+        "ZonedDateTime",
+        "LocalDate",
+        "LocalDateTime",
+        "UUID",
+    ]
+    assert "List" in type_registry
+    assert TYPE_IMPORTS["List"] == "java.util.List"
+    assert type_registry.column_definition_for("Long") == "BIGINT"
+    assert type_registry.column_definition_for("Unknown") is None
+    assert type_registry.import_for("String") is None
+    assert type_registry.import_for("Unknown") is None
+
+
+def test_entity_imports_zoned_date_time(entity_data):
+    entity_data["fields"][1]["type"] = "ZonedDateTime"
+
+    rendered = get_renderer().render(ENTITY_TEMPLATE, entity_data)
+
+    assert "import java.time.ZonedDateTime;" in rendered
+
+
+def test_imports_are_computed_once_per_entity(entity_data):
+    data = build_view_model(entity_data)
+
+    assert data["imports"] == ["java.time.LocalDateTime"]
+    assert build_view_model(data) is data
+    assert "imports" not in entity_data
+
+
+def test_registry_labels_and_custom_types():
+    registry = JavaTypeRegistry(DEFAULT_TYPES)
+    registry.register(
+        JavaType(
+            "Money",
+            import_path="org.joda.money.Money",
+            label="Money (Joda)",
+            fake_factory=lambda faker: "EUR 10.00",
+        )
+    )
+
+    assert registry.labels()[-1] == "Money (Joda)"
+    assert registry.name_for("Money (Joda)") == "Money"
+    assert registry.label_for("Money") == "Money (Joda)"
+    assert FakeValuePool(size=2, registry=registry).get("Money") == "EUR 10.00"
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(JavaType("Money"))
+    assert "Money" not in type_registry
+
+
+def test_project_spec_declares_custom_types(project_spec):
+    project_spec["types"] = [
+        {"name": "Money", "import": "org.joda.money.Money", "column": "NUMERIC(19, 4)"}
+    ]
+    project_spec["entities"][0]["fields"].append({"name": "price", "type": "Money"})
+
+    (data,) = build_project_data(project_spec)
+
+    assert data["imports"] == ["org.joda.money.Money"]
+    assert data["fields"][-1]["column_definition"] == "NUMERIC(19, 4)"
+    assert 'columnDefinition = "NUMERIC(19, 4)")' in get_renderer().render(
+        ENTITY_TEMPLATE, data
+    )
+    assert "Money" not in type_registry
@@ -0,0 +1,54 @@
+import logging
+import os
+import subprocess
+import sys
+from logging.handlers import QueueHandler
+
+from generator.core import logger as logger_module
+from generator.core.logger import logger, setup_logging, shutdown_logging
+from generator.scripts.generate_entity import generate_entity_templates
+
+
+def test_file_logs_are_written_by_a_background_thread(tmp_path):
+    setup_logging(str(tmp_path))
+
+    assert logger_module.queue_handler in logger.handlers
+    assert logger_module.file_handler not in logger.handlers
+    assert isinstance(logger_module.queue_handler, QueueHandler)
+    assert logger_module.queue_listener.handlers == (logger_module.file_handler,)
+    assert logger_module.queue_listener._thread is not None
+
+
+def test_logging_can_be_set_up_again(tmp_path):
+    shutdown_logging()
+    assert logger_module.queue_listener is None
+    assert all(isinstance(h, logging.NullHandler) for h in logger.handlers)
+
+    setup_logging(str(tmp_path / "first"))
+    logger.warning("First run")
+    shutdown_logging()
+    setup_logging(str(tmp_path / "second"))
+
+    log = (tmp_path / "first" / "hexapi.log").read_text(encoding="utf-8")
+    assert "First run" in log
+    assert (tmp_path / "second" / "hexapi.log").exists()
+
+
+def test_import_has_no_side_effect(tmp_path):
+    code = (
+        "import logging, os, generator.api, generator.gui.main; "
+        "assert not os.listdir('.'), os.listdir('.'); "
+        "handlers = logging.getLogger('hexapi').handlers; "
+        "assert all(isinstance(h, logging.NullHandler) for h in handlers)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True)
+
+
+def test_generation_logs_one_summary_line(tmp_path, caplog, entity_data):
+    caplog.set_level(logging.INFO, logger="hexapi")
+
+    generate_entity_templates(entity_data, output_root=str(tmp_path))
+
+    (record,) = [r for r in caplog.records if r.levelno >= logging.INFO]
+    assert record.getMessage().startswith("Generated Product: 11 templates")
@@ -0,0 +1,68 @@
+import copy
+import json
+import os
+
+from generator.core.class_generator import PROJECT_TEMPLATES, TEMPLATES_TO_GENERATE
+from generator.core.engine import generate_entities
+from generator.core.manifest import MANIFEST_FILE, GenerationManifest
+
+ENTITY_TEMPLATES = len(TEMPLATES_TO_GENERATE) - len(PROJECT_TEMPLATES)
+
+
+def mtimes(results):
+    return {
+        path: os.stat(path).st_mtime_ns
+        for result in results
+        for path in result.files + result.skipped
+    }
+
+
+def test_second_run_skips_unchanged_units(tmp_path, make_entities):
+    entities = make_entities(3)
+    first = generate_entities(entities, str(tmp_path), workers=1, incremental=True)
+    assert (tmp_path / MANIFEST_FILE).exists()
+    assert all(result.skipped == [] for result in first)
+    before = mtimes(first)
+
+    second = generate_entities(entities, str(tmp_path), workers=1, incremental=True)
+
+    assert all(result.ok and result.files == [] for result in second)
+    assert [len(result.skipped) for result in second] == [
+        len(TEMPLATES_TO_GENERATE)
+    ] * 3
+    assert mtimes(second) == before
+
+
+def test_only_changed_entity_is_regenerated(tmp_path, make_entities):
+    entities = make_entities(3)
+    generate_entities(entities, str(tmp_path), workers=1, incremental=True)
+
+    changed = copy.deepcopy(entities)
+    changed[1]["fields"][0]["comment"] = "Primary key"
+    results = generate_entities(changed, str(tmp_path), workers=1, incremental=True)
+
+    assert [len(result.files) for result in results] == [0, ENTITY_TEMPLATES, 0]
+
+
+def test_modified_output_is_regenerated(tmp_path, make_entities):
+    entities = make_entities(1)
+    (result,) = generate_entities(entities, str(tmp_path), incremental=True)
+    edited = result.files[0]
+    with open(edited, "a", encoding="utf-8") as f:
+        f.write("// manual edit\n")
+
+    (result,) = generate_entities(entities, str(tmp_path), incremental=True)
+
+    assert result.files == [edited]
+
+
+def test_unreadable_manifest_regenerates_everything(tmp_path, make_entities):
+    entities = make_entities(1)
+    generate_entities(entities, str(tmp_path), incremental=True)
+    (tmp_path / MANIFEST_FILE).write_text("{not json", encoding="utf-8")
+
+    assert GenerationManifest.load(str(tmp_path)).entries == {}
+    (result,) = generate_entities(entities, str(tmp_path), incremental=True)
+    assert len(result.files) == len(TEMPLATES_TO_GENERATE)
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert len(manifest["files"]) == len(TEMPLATES_TO_GENERATE)
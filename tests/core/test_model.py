@@ -0,0 +1,60 @@
+import pytest
+
+from generator.core.generator import build_project_data
+from generator.core.model import Entity, Field, Project
+from generator.core.project_store import ProjectStore
+
+
+def test_project_round_trips_through_json(project_spec):
+    project_spec["types"] = [{"name": "Money", "import": "org.joda.money.Money"}]
+
+    project = Project.from_dict(project_spec)
+
+    assert Project.from_json(project.to_json()) == project
+    assert project.to_dict()["types"] == project_spec["types"]
+    assert project.entity("Product").fields[1] == Field(
+        "label", "String", nullable=True
+    )
+    assert project.entity("Order") is None
+    assert "types" not in Project("Acme", "Shop", "com.acme.shop").to_dict()
+
+
+def test_fields_read_the_legacy_keys():
+    field = Field.from_dict({"nom": "createdAt", "type": "LocalDateTime", "isId": 1})
+
+    assert field.to_dict() == {
+        "name": "createdAt",
+        "type": "LocalDateTime",
+        "comment": "",
+        "test_value": "",
+        "is_id": True,
+        "nullable": False,
+    }
+    assert Entity("Product", [field]).id_fields == [field]
+
+
+def test_model_objects_have_no_dict():
+    field = Field("id", "Long", is_id=True)
+
+    with pytest.raises(AttributeError):
+        field.label = "Id"
+    assert not hasattr(Project(), "__dict__")
+
+
+def test_model_and_specification_build_the_same_data(project_spec):
+    project = Project.from_dict(project_spec)
+
+    assert build_project_data(project) == build_project_data(project_spec)
+    with pytest.raises(TypeError):
+        build_project_data([project_spec])
+    with pytest.raises(ValueError, match="Missing project keys: package"):
+        build_project_data(Project("Acme", "Shop", entities=project.entities))
+
+
+def test_store_converts_to_the_model(project_spec):
+    project = Project.from_dict(project_spec)
+
+    store = ProjectStore.from_project(project)
+
+    assert not store.is_dirty
+    assert store.to_project() == project
@@ -1,4 +1,14 @@
-from generator.core.naming import to_camel_case, to_kebab_case, to_pascal_case
+from generator.core.naming import (
+    bulk_name_variants,
+    clear_naming_cache,
+    generate_name_variants,
+    name_variants,
+    to_camel_case,
+    to_column_name,
+    to_kebab_case,
+    to_pascal_case,
+    to_snake_case,
+)
 
 
 def test_to_pascal_case():
@@ -11,3 +21,41 @@ def test_to_camel_case():
 
 def test_to_kebab_case():
     assert to_kebab_case("FreezePeriod") == "freeze-periods"
+
+
+def test_name_variants_in_one_pass():
+    clear_naming_cache()
+    variants = name_variants("  Période de gel! ")
+
+    assert variants == {
+        "original": "Periode de gel",
+        "PascalCase": "PeriodeDeGel",
+        "camelCase": "periodeDeGel",
+        "lowercase": "periodedegel",
+        "kebab-case": "periode de gels",
+        "snake_case": "periode_de_gel",
+        "column": "periode_de_gel",
+    }
+    assert to_pascal_case("  Période de gel! ") == "PeriodeDeGel"
+    assert generate_name_variants("nom de famille") == {
+        "original": "nom de famille",
+        "PascalCase": "NomDeFamille",
+        "camelCase": "nomDeFamille",
+        "lowercase": "nomdefamille",
+    }
+
+
+def test_name_variants_are_cached_and_copied():
+    clear_naming_cache()
+    variants = name_variants("user id")
+    variants["camelCase"] = "changed"
+
+    assert to_camel_case("user id") == "userId"
+    assert to_snake_case("user id") == "user_id"
+    assert bulk_name_variants(["a", "user id", "a"]).keys() == {"a", "user id"}
+
+
+def test_to_column_name_matches_entity_template():
+    assert to_column_name("userId") == "user_id"
+    assert to_column_name("createdAt") == "created_at"
+    assert to_column_name("label") == "label"
@@ -0,0 +1,92 @@
+import io
+import json
+import logging
+import tracemalloc
+
+import pytest
+
+from generator.core.class_generator import (
+    PROJECT_TEMPLATES,
+    TEMPLATES_TO_GENERATE,
+    get_renderer,
+)
+from generator.core.logger import logger
+from generator.core.pipeline import read_entities_jsonl, run_pipeline
+from generator.scripts.generate_entity import generate_entity_templates
+
+
+def peak_memory(tmp_path, lazy_entities, count):
+    get_renderer().compile_all()
+    run_pipeline(lazy_entities(1), output_root=str(tmp_path / "warmup"))
+    tracemalloc.start()
+    try:
+        run_pipeline(lazy_entities(count), output_root=str(tmp_path / str(count)))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def test_pipeline_output_matches_serial(
+    tmp_path, make_entities, lazy_entities, read_tree
+):
+    for data in make_entities(3):
+        generate_entity_templates(data, output_root=str(tmp_path / "serial"))
+
+    writer = run_pipeline(lazy_entities(3), output_root=str(tmp_path / "stream"))
+
+    assert read_tree(tmp_path / "stream") == read_tree(tmp_path / "serial")
+    entity_templates = len(TEMPLATES_TO_GENERATE) - len(PROJECT_TEMPLATES)
+    assert writer.stats()["files_written"] == 3 * entity_templates + len(
+        PROJECT_TEMPLATES
+    )
+
+
+def test_pipeline_memory_stays_flat(tmp_path, lazy_entities):
+    # Keep the log records out of the memory captured by pytest
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        small = peak_memory(tmp_path, lazy_entities, 20)
+        large = peak_memory(tmp_path, lazy_entities, 200)
+    finally:
+        logger.setLevel(level)
+
+    assert large < 512 * 1024
+    assert large < small * 2
+
+
+def test_read_entities_jsonl(tmp_path, entity_data):
+    path = tmp_path / "project.jsonl"
+    lines = [
+        {"company": "Acme", "project": "Shop", "package": "com.acme.shop"},
+        {"name": "Product", "fields": entity_data["fields"]},
+        {"name": "Order", "fields": entity_data["fields"]},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+
+    entities = read_entities_jsonl(str(path))
+
+    assert next(entities)["Table"] == "Product"
+    assert next(entities)["package_name"] == "com.acme.shop"
+
+
+def test_read_entities_jsonl_checks_each_entity(tmp_path, entity_data):
+    path = tmp_path / "project.jsonl"
+    lines = [
+        {"company": "Acme", "project": "Shop", "package": "com.acme.shop"},
+        {"name": "Product", "fields": entity_data["fields"]},
+        {"name": "Product", "fields": entity_data["fields"]},
+    ]
+    text = "\n".join(json.dumps(line) for line in lines)
+    path.write_text(text, encoding="utf-8")
+
+    # A file is checked as a whole before the first entity
+    with pytest.raises(ValueError, match="Line 3: The entity 'Product' is defined"):
+        next(read_entities_jsonl(str(path)))
+
+    # A stream is checked one entity at a time
+    entities = read_entities_jsonl(io.StringIO(text))
+    assert next(entities)["Table"] == "Product"
+    with pytest.raises(ValueError, match="Line 3: The entity 'Product' is defined"):
+        next(entities)
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from generator.core.engine import (
+    CANCELLED,
+    GenerationCancelled,
+    GenerationEngine,
+    render_entity_templates,
+)
+from generator.core.progress import BackgroundGeneration, GenerationProgress
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for_events(job):
+    job.thread.join(timeout=30)
+    return job.poll()
+
+
+def test_progress_rate_and_eta():
+    clock = FakeClock()
+    progress = GenerationProgress(300, clock=clock)
+    assert progress.rate == 0.0
+    assert progress.eta is None
+    assert progress.describe() == "0/300 entities"
+
+    clock.now += 2
+    progress.update(100)
+
+    assert progress.fraction == 100 / 300
+    assert progress.rate == 50.0
+    assert progress.eta == 4.0
+    assert progress.describe() == "100/300 entities - 50.0 entities/s - ETA 4s"
+
+
+def test_background_generation_emits_progress_then_results(tmp_path, make_entities):
+    job = BackgroundGeneration(
+        GenerationEngine(output_root=str(tmp_path)), make_entities(2)
+    )
+    job.start()
+
+    events = wait_for_events(job)
+
+    assert [event[:3] for event in events[:2]] == [
+        ("progress", 1, 2),
+        ("progress", 2, 2),
+    ]
+    kind, results = events[-1]
+    assert kind == "done"
+    assert all(result.ok for result in results)
+
+
+def test_background_generation_cancelled_before_start(tmp_path, make_entities):
+    job = BackgroundGeneration(
+        GenerationEngine(output_root=str(tmp_path)), make_entities(2)
+    )
+    job.cancel()
+    job.start()
+
+    kind, results = wait_for_events(job)[-1]
+
+    assert job.cancelled
+    assert kind == "done"
+    assert [result.error for result in results] == [CANCELLED, CANCELLED]
+    assert not any(tmp_path.rglob("*.java"))
+
+
+def test_background_generation_reports_unexpected_errors(tmp_path):
+    class BrokenEngine:
+        def generate(self, entities, progress=None, cancel=None):
+            raise RuntimeError("disk full")
+
+    job = BackgroundGeneration(BrokenEngine(), [])
+    job.start()
+
+    assert wait_for_events(job) == [("error", "RuntimeError: disk full")]
+
+
+def test_render_stops_between_templates(tmp_path, make_entities):
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(GenerationCancelled):
+        render_entity_templates(
+            make_entities(1)[0], ["a.j2", "b.j2"], str(tmp_path), cancel
+        )
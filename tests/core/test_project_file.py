@@ -0,0 +1,111 @@
+import json
+import zipfile
+
+import pytest
+
+from generator.core.project_file import (
+    INDEX_MEMBER,
+    ProjectFileError,
+    close_project,
+    open_project,
+    save_project,
+)
+from generator.core.project_store import ProjectStore
+
+FIELDS = [
+    {
+        "name": "id",
+        "type": "Long",
+        "comment": "Unique ID",
+        "test_value": "1",
+        "is_id": True,
+        "nullable": False,
+    },
+    {
+        "name": "label",
+        "type": "String",
+        "comment": "",
+        "test_value": "abc",
+        "is_id": False,
+        "nullable": True,
+    },
+]
+
+
+def make_store(count=3):
+    store = ProjectStore("Acme", "shop", "com.acme.shop")
+    for i in range(count):
+        store.add_entity(f"Entity{i}", FIELDS)
+    return store
+
+
+def test_open_reads_only_the_index(tmp_path):
+    path = str(tmp_path / "shop.hexapi")
+    save_project(make_store(2000), path)
+
+    store = open_project(path)
+
+    assert len(store) == 2000
+    assert (store.company, store.project, store.package) == (
+        "Acme",
+        "shop",
+        "com.acme.shop",
+    )
+    assert all(store.pending_loader(name) for name in store.entity_names())
+    assert store.field_count("Entity1999") == 2
+    assert store.get_fields("Entity1999") == FIELDS
+    assert store.pending_loader("Entity1999") is None
+    assert not store.is_dirty
+    close_project(store)
+
+
+def test_save_keeps_unread_and_modified_entities(tmp_path):
+    path = str(tmp_path / "shop.hexapi")
+    save_project(make_store(), path)
+    store = open_project(path)
+    store.set_fields("Entity1", FIELDS[:1])
+    store.rename_entity("Entity2", "Customer")
+    assert store.is_dirty
+
+    # Saved over the file the unread entities come from
+    save_project(store, path)
+    assert not store.is_dirty
+    assert store.get_fields("Entity0") == FIELDS
+    close_project(store)
+
+    reopened = open_project(path)
+    assert reopened.to_spec() == {
+        "company": "Acme",
+        "project": "shop",
+        "package": "com.acme.shop",
+        "entities": [
+            {"name": "Entity0", "fields": FIELDS},
+            {"name": "Entity1", "fields": FIELDS[:1]},
+            {"name": "Customer", "fields": FIELDS},
+        ],
+    }
+    close_project(reopened)
+
+
+def test_json_specification_is_opened(tmp_path):
+    path = str(tmp_path / "shop.json")
+    make_store().save(path)
+
+    store = open_project(path)
+
+    assert store.to_spec() == make_store().to_spec()
+
+
+def test_other_files_are_rejected(tmp_path):
+    text = tmp_path / "notes.txt"
+    text.write_text("not a project")
+    newer = tmp_path / "newer.hexapi"
+    with zipfile.ZipFile(newer, "w") as archive:
+        archive.writestr(
+            INDEX_MEMBER, json.dumps({"format": "hexapi-project", "version": 99})
+        )
+
+    with pytest.raises(ProjectFileError):
+        open_project(str(text))
+    with pytest.raises(ProjectFileError, match="newer version"):
+        open_project(str(newer))
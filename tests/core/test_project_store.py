@@ -0,0 +1,77 @@
+import pytest
+
+from generator.core.generator import build_project_data
+from generator.core.project_store import ProjectStore
+
+FIELDS = [
+    {"name": "id", "type": "Long", "is_id": True, "nullable": False},
+    {"name": "label", "type": "String", "is_id": False, "nullable": True},
+]
+
+
+def make_store():
+    store = ProjectStore("Acme", "shop", "com.acme.shop")
+    store.add_entity("Product", FIELDS)
+    store.add_entity("Order", FIELDS[:1])
+    store.mark_clean()
+    return store
+
+
+def test_generation_data_is_not_wrapped_twice():
+    store = make_store()
+
+    first = store.build_generation_data()
+    second = store.build_generation_data()
+
+    assert first == second
+    # The fields of the view model keep the keys of the model
+    assert [
+        {key: field[key] for key in FIELDS[0]} for field in first[0]["fields"]
+    ] == FIELDS
+    assert first == build_project_data(store.to_spec())
+
+
+def test_changes_are_tracked_until_saved(tmp_path):
+    store = make_store()
+    assert not store.is_dirty
+
+    store.set_fields("Order", FIELDS[:1])
+    assert not store.is_dirty
+
+    store.set_fields("Order", FIELDS)
+    store.rename_entity("Product", "Item")
+    assert store.dirty == {"Order", "Item"}
+    assert store.entity_names() == ["Item", "Order"]
+
+    store.save(str(tmp_path / "shop.json"))
+    assert not store.is_dirty
+
+
+def test_save_and_load_round_trip(tmp_path):
+    store = make_store()
+    path = str(tmp_path / "shop.json")
+
+    store.save(path)
+    loaded = ProjectStore.load(path)
+
+    assert loaded.to_spec() == store.to_spec()
+    assert not loaded.is_dirty
+
+
+def test_returned_fields_are_copies():
+    store = make_store()
+
+    store.get_fields("Product")[0]["name"] = "changed"
+
+    assert store.get_fields("Product") == FIELDS
+
+
+def test_name_conflicts_are_rejected():
+    store = make_store()
+
+    with pytest.raises(ValueError):
+        store.add_entity("Product")
+    with pytest.raises(ValueError):
+        store.rename_entity("Order", "Product")
+    with pytest.raises(KeyError):
+        store.set_fields("Missing", FIELDS)
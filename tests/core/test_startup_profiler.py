@@ -0,0 +1,33 @@
+import json
+import sys
+
+from generator.core.startup_profiler import StartupProfiler
+
+
+def test_profiler_records_imports_and_milestones(tmp_path, monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    profiler = StartupProfiler(str(tmp_path / "profile.json"))
+    profiler.start()
+    try:
+        import colorsys  # noqa: F401
+    finally:
+        profiler.stop()
+    profiler.mark("first_paint")
+
+    report = json.loads(open(profiler.write_report(), encoding="utf-8").read())
+
+    (entry,) = [item for item in report["imports"] if item["module"] == "colorsys"]
+    assert entry["cumulative_ms"] >= entry["self_ms"] >= 0
+    assert report["milestones_ms"]["first_paint"] > 0
+    assert report["import_total_ms"] >= entry["cumulative_ms"]
+
+
+def test_profiler_restores_import():
+    import builtins
+
+    original = builtins.__import__
+    profiler = StartupProfiler()
+    profiler.start()
+    profiler.stop()
+
+    assert builtins.__import__ is original
@@ -0,0 +1,64 @@
+import json
+import shutil
+
+from generator.core.class_generator import (
+    TEMPLATES_DIR,
+    TEMPLATES_ROOT,
+    TEMPLATES_TO_GENERATE,
+    TemplateRenderer,
+)
+from generator.core.template_bundle import BUNDLE_INDEX, load_bundle_index
+from generator.scripts.build_templates import build_templates
+
+
+def test_renderer_loads_precompiled_templates(tmp_path, entity_data):
+    bundle = str(tmp_path / "bundle")
+    digests = build_templates(bundle_root=bundle)
+    assert len(digests) == len(TEMPLATES_TO_GENERATE)
+
+    renderer = TemplateRenderer(bundle_root=bundle)
+    source_renderer = TemplateRenderer(bundle_root=None)
+    for template_path in TEMPLATES_TO_GENERATE:
+        assert renderer.render(template_path, entity_data) == source_renderer.render(
+            template_path, entity_data
+        )
+        assert renderer.template_digest(
+            template_path
+        ) == source_renderer.template_digest(template_path)
+    assert renderer.precompiled == len(TEMPLATES_TO_GENERATE)
+
+
+def test_renderer_compiles_changed_sources(tmp_path, entity_data):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates)
+    bundle = str(tmp_path / "bundle")
+    build_templates(str(templates), bundle)
+    template_path = TEMPLATES_TO_GENERATE[0]
+    source = templates / template_path.replace(TEMPLATES_ROOT + "/", "")
+    source.write_text("changed {{ Table }}", encoding="utf-8")
+
+    renderer = TemplateRenderer(str(templates), bundle)
+
+    assert renderer.render(template_path, entity_data) == "changed Product"
+    assert renderer.precompiled == 0
+
+
+def test_renderer_uses_bundle_without_sources(tmp_path, entity_data):
+    bundle = str(tmp_path / "bundle")
+    digests = build_templates(bundle_root=bundle)
+    renderer = TemplateRenderer(str(tmp_path / "missing"), bundle)
+    template_path = TEMPLATES_TO_GENERATE[0]
+
+    assert "class ProductEntity" in renderer.render(template_path, entity_data)
+    assert renderer.template_digest(template_path) in digests.values()
+
+
+def test_bundle_of_another_version_is_ignored(tmp_path):
+    bundle = tmp_path / "bundle"
+    build_templates(bundle_root=str(bundle))
+    index = json.loads((bundle / BUNDLE_INDEX).read_text(encoding="utf-8"))
+    index["jinja2"] = "0.0"
+    (bundle / BUNDLE_INDEX).write_text(json.dumps(index), encoding="utf-8")
+
+    assert load_bundle_index(str(bundle)) is None
+    assert load_bundle_index(str(tmp_path / "missing")) is None
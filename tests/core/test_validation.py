@@ -0,0 +1,74 @@
+import pytest
+
+from generator.core.generator import build_project_data
+from generator.core.model import Entity, Field, Project
+from generator.core.validation import (
+    ProjectValidationError,
+    format_problems,
+    validate_project,
+)
+
+
+def make_entity(name, *field_names):
+    fields = [Field("id", "Long", is_id=True)]
+    fields += [Field(field_name) for field_name in field_names]
+    return Entity(name, fields)
+
+
+def test_valid_project_has_no_problems(project_spec):
+    assert validate_project(Project.from_dict(project_spec)) == []
+
+
+def test_every_problem_is_reported_at_once():
+    project = Project(
+        "Acme",
+        "Shop",
+        "com.acme.new",
+        [
+            make_entity("Product", "class", "label", "label", "unit price"),
+            Entity("Empty"),
+            make_entity("product"),
+            make_entity("product"),
+            Entity("Order", [Field("label")]),
+        ],
+    )
+
+    assert validate_project(project) == [
+        "The package 'com.acme.new' is not a valid Java package",
+        "The field 'Product.class' is a Java reserved word",
+        "The field 'Product.label' is defined more than once",
+        "The field 'Product.unit price' is not a valid Java name",
+        "The entity 'Empty' has no fields",
+        "The entity 'product' is defined more than once",
+        "The entity 'Order' has no id field",
+    ]
+
+
+def test_project_keys_and_package_are_checked():
+    problems = validate_project(Project(package="1acme"))
+
+    assert problems == [
+        "Missing project keys: company, project",
+        "The package '1acme' is not a valid Java package",
+        "The project has no entities",
+    ]
+
+
+def test_invalid_project_fails_before_rendering(project_spec):
+    project = Project.from_dict(project_spec)
+    project.entities[0].fields[1].name = "default"
+
+    with pytest.raises(ProjectValidationError) as info:
+        build_project_data(project)
+
+    assert info.value.problems == [
+        "The field 'Product.default' is a Java reserved word"
+    ]
+
+
+def test_problems_are_formatted_as_a_list():
+    problems = [f"Problem {i}" for i in range(4)]
+
+    assert format_problems(problems, limit=2) == (
+        "- Problem 0\n- Problem 1\n... and 2 more"
+    )
@@ -0,0 +1,56 @@
+import copy
+
+from generator.core.class_generator import TEMPLATES_TO_GENERATE, get_renderer
+from generator.core.view_model import build_field_view, build_view_model
+
+
+def test_field_view_precomputes_the_names():
+    view = build_field_view({"nom": "createdAt", "type": "LocalDateTime", "isId": 0})
+
+    assert view == {
+        "name": "createdAt",
+        "type": "LocalDateTime",
+        "comment": "",
+        "test_value": "",
+        "is_id": False,
+        "nullable": False,
+        "Name": "CreatedAt",
+        "getter": "getCreatedAt",
+        "setter": "setCreatedAt",
+        "column": "created_at",
+        "nullable_literal": "false",
+        "import": "java.time.LocalDateTime",
+        "column_definition": "TIMESTAMP",
+    }
+
+
+def test_view_model_picks_the_id_field(entity_data):
+    entity_data["fields"].reverse()
+    before = copy.deepcopy(entity_data)
+
+    view = build_view_model(entity_data)
+
+    assert view["id_field"]["name"] == "id"
+    empty = build_view_model(dict(entity_data, fields=[]))
+    assert empty["id_field"]["getter"] == "getId"
+    assert entity_data == before
+
+
+def test_every_template_sees_the_same_fields(entity_data):
+    for field in entity_data["fields"]:
+        field["nom"] = field.pop("name")
+    renderer = get_renderer()
+
+    rendered = "\n".join(
+        renderer.render(template_path, entity_data)
+        for template_path in TEMPLATES_TO_GENERATE
+    )
+
+    assert "private LocalDateTime createdAt;" in rendered
+    assert "getCreatedAt()" in rendered
+    assert (
+        '@Column(name = "created_at", nullable = true, '
+        'columnDefinition = "TIMESTAMP")' in rendered
+    )
+    assert "Product getById(Long id);" in rendered
+    assert " ;" not in rendered
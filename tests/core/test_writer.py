@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from generator.core.writer import OutputWriter, encode_text
+
+
+def test_writer_creates_directories_once(tmp_path, monkeypatch):
+    paths = [str(tmp_path / "model" / f"File{i}.java") for i in range(3)]
+    created = []
+    original_makedirs = os.makedirs
+
+    def counting_makedirs(path, *args, **kwargs):
+        created.append(path)
+        return original_makedirs(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "makedirs", counting_makedirs)
+    writer = OutputWriter()
+    writer.plan(paths)
+    for path in paths:
+        writer.write(path, "class A {}\n")
+
+    assert created == [str(tmp_path / "model")]
+    assert writer.stats() == {
+        "files_written": 3,
+        "files_skipped": 0,
+        "bytes_written": 3 * len(encode_text("class A {}\n")),
+    }
+
+
+def test_writer_skips_identical_content(tmp_path):
+    path = str(tmp_path / "A.java")
+    OutputWriter().write(path, "class A {}\n")
+    mtime = os.stat(path).st_mtime_ns
+
+    writer = OutputWriter()
+    assert writer.write(path, "class A {}\n") is False
+    assert writer.write(path, "class B {}\n") is True
+
+    assert writer.stats()["files_skipped"] == 1
+    assert writer.stats()["files_written"] == 1
+    assert os.stat(path).st_mtime_ns >= mtime
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "class B {}\n"
+
+
+def test_interrupted_write_keeps_previous_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "A.java")
+    OutputWriter().write(path, "class A {}\n")
+
+    def failing_replace(src, dst):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(KeyboardInterrupt):
+        OutputWriter().write(path, "class B {}\n")
+
+    assert os.listdir(tmp_path) == ["A.java"]
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "class A {}\n"
@@ -0,0 +1,30 @@
+from generator.gui.layout.field_list import new_field, visible_range
+
+
+def test_visible_range_covers_partially_visible_rows():
+    assert visible_range(0, 100, 48, 300) == range(0, 3)
+    assert visible_range(50, 100, 48, 300) == range(1, 4)
+    assert visible_range(96, 96, 48, 300) == range(2, 4)
+
+
+def test_visible_range_is_bounded_by_the_number_of_rows():
+    assert visible_range(0, 1000, 48, 5) == range(0, 5)
+    assert visible_range(480, 100, 48, 5) == range(5, 5)
+    assert visible_range(0, 100, 48, 0) == range(0, 0)
+    assert visible_range(-20, 0, 48, 5) == range(0, 0)
+
+
+def test_new_field_fills_the_missing_keys():
+    data = {"name": "price", "type": "BigDecimal"}
+
+    field = new_field(data)
+
+    assert field == {
+        "name": "price",
+        "type": "BigDecimal",
+        "comment": "",
+        "test_value": "",
+        "is_id": False,
+        "nullable": False,
+    }
+    assert data == {"name": "price", "type": "BigDecimal"}
@@ -0,0 +1,71 @@
+import os
+
+from PIL import Image
+
+from generator.gui.icon_cache import IconCache, scale_percent, target_size
+
+ICONS = {
+    "delete": {
+        "sources": {"light": "light.png", "dark": "dark.png"},
+        "size": (18, 18),
+    },
+    "intro": {"sources": {"light": "intro.png"}, "size": (400, None)},
+}
+
+
+def open_cache(tmp_path):
+    cache = IconCache(str(tmp_path / "cache"), str(tmp_path / "assets"))
+    cache.icons = ICONS
+    return cache
+
+
+def make_cache(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    Image.new("RGBA", (24, 24), (255, 255, 255, 255)).save(assets / "light.png")
+    Image.new("RGBA", (24, 24), (31, 31, 31, 255)).save(assets / "dark.png")
+    Image.new("RGBA", (1200, 880)).save(assets / "intro.png")
+    return open_cache(tmp_path)
+
+
+def test_scale_is_rounded_to_cached_variants():
+    assert scale_percent(1.0) == 100
+    assert scale_percent(1.3) == 125
+    assert scale_percent(2.0) == 200
+    assert scale_percent(0.1) == 50
+
+
+def test_target_size_keeps_the_ratio_without_height():
+    assert target_size((18, 18), 150, (24, 24)) == (27, 27)
+    assert target_size((400, None), 100, (1200, 880)) == (400, 293)
+
+
+def test_build_all_resizes_every_theme_and_scale(tmp_path):
+    cache = make_cache(tmp_path)
+
+    built = cache.build_all(scales=(1.0, 2.0))
+
+    assert len(built) == 6
+    with Image.open(cache.cached_path("delete", "dark", 200)) as image:
+        assert image.size == (36, 36)
+        assert image.getpixel((18, 18)) == (31, 31, 31, 255)
+    with Image.open(cache.cached_path("intro", "light", 100)) as image:
+        assert image.size == (400, 293)
+    assert cache.build_all(scales=(1.0, 2.0)) == []
+
+
+def test_changed_source_invalidates_its_icons(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.build_all(scales=(1.0,))
+    source = cache.source_path("delete", "light")
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    # A new cache reads the index written by the previous one
+    reloaded = open_cache(tmp_path)
+
+    assert not reloaded.is_fresh("delete", "light", 100)
+    assert reloaded.is_fresh("delete", "dark", 100)
+    assert reloaded.build_all(scales=(1.0,)) == [
+        reloaded.cached_path("delete", "light", 100)
+    ]
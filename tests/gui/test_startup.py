@@ -0,0 +1,12 @@
+import subprocess
+import sys
+
+
+def test_gui_import_defers_heavy_dependencies():
+    code = (
+        "import sys, generator.gui.main; "
+        "heavy = [m for m in sys.modules "
+        "if m.split('.')[0] in ('jinja2', 'PIL', 'faker')]; "
+        "assert not heavy, heavy"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,71 @@
+import gc
+
+from generator.gui.theme_manager import ThemeManager
+
+
+class Subscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def apply_theme(self):
+        self.calls += 1
+
+
+class DestroyedWidget(Subscriber):
+    def winfo_exists(self):
+        return 0
+
+
+def test_bound_methods_are_held_weakly():
+    manager = ThemeManager()
+    kept, dropped = Subscriber(), Subscriber()
+    manager.subscribe(kept.apply_theme)
+    manager.subscribe(dropped.apply_theme)
+
+    del dropped
+    gc.collect()
+    manager._notify_subscribers()
+
+    assert kept.calls == 1
+    assert len(manager.subscribers) == 1
+
+
+def test_destroyed_widgets_are_pruned():
+    manager = ThemeManager()
+    widget = DestroyedWidget()
+    manager.subscribe(widget.apply_theme)
+
+    manager._notify_subscribers()
+
+    assert widget.calls == 0
+    assert manager.subscribers == []
+
+
+def test_functions_are_held_until_unsubscribed():
+    manager = ThemeManager()
+    calls = []
+
+    def callback():
+        calls.append(1)
+
+    manager.subscribe(callback)
+    manager._notify_subscribers()
+    manager.unsubscribe(callback)
+    manager._notify_subscribers()
+
+    assert calls == [1]
+    assert manager.subscribers == []
+
+
+def test_failing_subscriber_does_not_stop_the_others():
+    manager = ThemeManager()
+    subscriber = Subscriber()
+
+    def broken():
+        raise RuntimeError("boom")
+
+    manager.subscribe(broken)
+    manager.subscribe(subscriber.apply_theme)
+    manager._notify_subscribers()
+
+    assert subscriber.calls == 1
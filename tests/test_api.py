@@ -0,0 +1,45 @@
+import tarfile
+
+import pytest
+
+from generator.api import generate
+
+
+def test_generate_from_any_directory(tmp_path, monkeypatch, project_spec):
+    monkeypatch.chdir(tmp_path)
+
+    report = generate(project_spec, output=str(tmp_path / "output"))
+
+    assert report.ok
+    assert len(report.files) == 11
+    assert report.stats["files_written"] == 11
+    assert all(path.startswith(str(tmp_path / "output")) for path in report.files)
+
+
+def test_generate_calls_are_independent(tmp_path, project_spec):
+    first = generate(project_spec, output=str(tmp_path / "a"))
+    second = generate(
+        project_spec, output=str(tmp_path / "b"), options={"incremental": True}
+    )
+
+    assert first.stats == second.stats
+    assert second.files_skipped == 0
+
+
+def test_generate_rejects_invalid_input(tmp_path, project_spec):
+    with pytest.raises(ValueError, match="Unknown options: threads"):
+        generate(project_spec, output=str(tmp_path), options={"threads": 2})
+    with pytest.raises(ValueError, match="no entities"):
+        generate(dict(project_spec, entities=[]), output=str(tmp_path))
+
+
+def test_generate_into_archive(tmp_path, project_spec):
+    archive = tmp_path / "api.tar.gz"
+    report = generate(
+        project_spec, options={"archive": str(archive), "compression_level": 1}
+    )
+
+    assert report.ok
+    assert report.stats["files_written"] == 11
+    with tarfile.open(archive) as f:
+        assert len(f.getnames()) == 11
@@ -0,0 +1,35 @@
+import json
+
+from benchmarks.bench_generation import main, run_benchmarks
+
+
+def test_benchmarks_report_every_measure():
+    report = run_benchmarks([2], [5], repeat=1, imports=False)
+
+    names = {result["name"] for result in report["results"]}
+    assert {
+        "build_entity_data",
+        "naming.to_camel_case",
+        "validate_project",
+        "render",
+    } <= names
+    (generation,) = [
+        result
+        for result in report["results"]
+        if result["name"] == "generate_all_templates"
+    ]
+    assert generation["entities"] == 2
+    assert generation["peak_memory"] > 0
+
+
+def test_benchmarks_write_json(tmp_path):
+    output = tmp_path / "bench.json"
+    main(["-o", str(output), "--entities", "1", "--fields", "5", "--repeat", "1"])
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    imports = [result for result in report["results"] if result["name"] == "import"]
+    assert [result["module"] for result in imports][:2] == [
+        "generator.core",
+        "generator.core.class_generator",
+    ]
+    assert imports[0]["min"] > 0
@@ -0,0 +1,147 @@
+import json
+import os
+import subprocess
+import sys
+import zipfile
+
+from generator.cli import EXIT_GENERATION_FAILED, EXIT_OK, EXIT_USAGE, main
+
+
+def write_spec(tmp_path, spec):
+    path = tmp_path / "project.json"
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    return str(path)
+
+
+def test_cli_generates_project(tmp_path, capsys, project_spec):
+    output = tmp_path / "output"
+    code = main([write_spec(tmp_path, project_spec), "-o", str(output), "-w", "1"])
+
+    assert code == EXIT_OK
+    assert "1/1 entities" in capsys.readouterr().out
+    assert (
+        output
+        / "acme/shop/src/main/java/com/acme/shop/api/application"
+        / "product/model/Product.java"
+    ).exists()
+
+
+def test_cli_rejects_invalid_spec(tmp_path, capsys, project_spec):
+    spec = dict(project_spec, entities=[])
+    code = main([write_spec(tmp_path, spec), "-o", str(tmp_path)])
+
+    assert code == EXIT_USAGE
+    assert "no entities" in capsys.readouterr().err
+
+
+def test_cli_reports_every_problem_before_writing(tmp_path, capsys, project_spec):
+    spec = dict(project_spec, package="com.acme.new")
+    spec["entities"] = project_spec["entities"] * 2
+    output = tmp_path / "output"
+    code = main([write_spec(tmp_path, spec), "-o", str(output)])
+
+    err = capsys.readouterr().err
+    assert code == EXIT_USAGE
+    assert "- The package 'com.acme.new' is not a valid Java package" in err
+    assert "- The entity 'Product' is defined more than once" in err
+    assert not output.exists()
+
+
+def test_cli_reports_generation_errors(tmp_path, monkeypatch, capsys, project_spec):
+    def failing_render(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("generator.core.engine.render_entity_templates", failing_render)
+    code = main([write_spec(tmp_path, project_spec), "-o", str(tmp_path), "-w", "1"])
+
+    assert code == EXIT_GENERATION_FAILED
+    assert "Product: RuntimeError: boom" in capsys.readouterr().err
+
+
+def test_cli_does_not_import_the_gui():
+    code = (
+        "import sys, generator.cli; "
+        "heavy = [m for m in sys.modules "
+        "if m.split('.')[0] in ('tkinter', 'PIL', 'faker') "
+        "or m.startswith('generator.gui')]; "
+        "assert not heavy, heavy"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_only_writes_a_log_file_when_asked(tmp_path, project_spec):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+
+    def run(*args):
+        subprocess.run(
+            [sys.executable, "-m", "generator", "-o", "out", "-w", "1", *args],
+            input=json.dumps(project_spec),
+            text=True,
+            capture_output=True,
+            cwd=tmp_path,
+            env=env,
+            check=True,
+        )
+
+    run("-")
+    assert sorted(os.listdir(tmp_path)) == ["out"]
+    run("-", "--log-dir", "logs")
+    assert "Generation" in (tmp_path / "logs" / "hexapi.log").read_text("utf-8")
+
+
+def test_cli_reports_unchanged_files(tmp_path, capsys, project_spec):
+    spec_path = write_spec(tmp_path, project_spec)
+    main([spec_path, "-o", str(tmp_path / "output"), "-w", "1"])
+    capsys.readouterr()
+
+    main([spec_path, "-o", str(tmp_path / "output"), "-w", "1"])
+
+    assert "0 files written (0 bytes), 11 unchanged files skipped" in (
+        capsys.readouterr().out
+    )
+
+
+def test_cli_streams_json_lines(tmp_path, capsys, project_spec):
+    path = tmp_path / "project.jsonl"
+    project = {key: project_spec[key] for key in ("company", "project", "package")}
+    lines = [project] + project_spec["entities"]
+    path.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+
+    code = main([str(path), "--stream", "-o", str(tmp_path / "output")])
+
+    assert code == EXIT_OK
+    assert "11 files written" in capsys.readouterr().out
+
+
+def test_cli_stream_validates_the_whole_file_first(tmp_path, capsys, project_spec):
+    path = tmp_path / "project.jsonl"
+    project = {key: project_spec[key] for key in ("company", "project", "package")}
+    lines = [project] + project_spec["entities"] * 2
+    path.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+    output = tmp_path / "output"
+
+    code = main([str(path), "--stream", "-o", str(output)])
+
+    assert code == EXIT_USAGE
+    assert "Line 3: The entity 'Product' is defined" in capsys.readouterr().err
+    assert not output.exists()
+
+    path.write_text("{not json", encoding="utf-8")
+    assert main([str(path), "--stream", "-o", str(output)]) == EXIT_USAGE
+
+
+def test_cli_writes_archive(tmp_path, capsys, monkeypatch, project_spec):
+    monkeypatch.chdir(tmp_path)
+    archive = tmp_path / "api.zip"
+    code = main(
+        [write_spec(tmp_path, project_spec), "--archive", str(archive), "-w", "1"]
+    )
+
+    assert code == EXIT_OK
+    assert not (tmp_path / "output").exists()
+    with zipfile.ZipFile(archive) as f:
+        assert (
+            "acme/shop/src/main/java/com/acme/shop/api/application"
+            "/product/model/Product.java"
+        ) in f.namelist()